@@ -0,0 +1,59 @@
+# Builds create issue payloads with CreateIssueRequest and with a compiled
+# CreateIssueTemplate.
+#
+#   python benchmarks/bench_create_issue.py
+from timeit import repeat
+
+from jira_cloud_api.jira_request import CreateIssueRequest
+from jira_cloud_api.jira_templates import CreateIssueTemplate
+
+KEYS = [
+    "project.key",
+    "issuetype.id",
+    "summary",
+    "description",
+    "priority.name",
+    "components.name",
+    "labels",
+    "customfield_10000.value",
+    "customfield_10001",
+]
+ROWS = [
+    [
+        "SAND",
+        "10002",
+        f"Issue {i}",
+        "Imported issue.",
+        "High",
+        ["Backend", "API"],
+        ["import"],
+        "Team A",
+        i,
+    ]
+    for i in range(1000)
+]
+
+
+def bench(name: str, build) -> None:
+    best = min(repeat(build, number=20, repeat=5))
+    print(f"{name:<22} {best / (20 * len(ROWS)) * 1e6:8.2f} us/row")
+
+
+def main() -> None:
+    template = CreateIssueTemplate(KEYS)
+    assert template.render(ROWS[0]) == (
+        CreateIssueRequest(fields=dict(zip(KEYS, ROWS[0]))).fields
+    )
+
+    bench(
+        "CreateIssueRequest",
+        lambda: [CreateIssueRequest(fields=dict(zip(KEYS, row))) for row in ROWS],
+    )
+    bench(
+        "CreateIssueTemplate",
+        lambda: [template.create_request(row) for row in ROWS],
+    )
+
+
+if __name__ == "__main__":
+    main()
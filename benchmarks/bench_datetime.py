@@ -0,0 +1,49 @@
+# Compares parse_jira_datetime with dateparser on Jira timestamps.
+#
+#   python benchmarks/bench_datetime.py
+#   python -X importtime -c "import jira_cloud_api" 2>&1 | grep dateparser
+import subprocess
+import sys
+from timeit import repeat
+
+from jira_cloud_api.jira_datetime import parse_jira_datetime
+
+TIMESTAMPS = [
+    "2023-03-29T00:15:35.205-0700",
+    "2024-11-02T18:04:11.000+0000",
+    "2025-01-15T09:30:00.123+05:30",
+    "2025-06-30T23:59:59Z",
+]
+
+
+def bench(name: str, parse, number: int) -> None:
+    best = min(
+        repeat(lambda: [parse(value) for value in TIMESTAMPS], number=number, repeat=5)
+    )
+    per_call = best / (number * len(TIMESTAMPS)) * 1e6
+    print(f"{name:<22} {per_call:8.2f} us/timestamp")
+
+
+def import_time(module: str) -> float:
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr.splitlines()
+    # the last line is the cumulative time of the requested module.
+    return int(output[-1].split("|")[1]) / 1000
+
+
+def main() -> None:
+    from dateparser import parse  # pylint: disable=import-outside-toplevel
+
+    bench("parse_jira_datetime", parse_jira_datetime, number=5000)
+    # dateparser is ~1000x slower, keep the run short.
+    bench("dateparser.parse", parse, number=20)
+    print(f"{'import dateparser':<22} {import_time('dateparser'):8.2f} ms")
+    print(f"{'import jira_cloud_api':<22} {import_time('jira_cloud_api'):8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
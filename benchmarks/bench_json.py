@@ -0,0 +1,56 @@
+# Decodes the mock server payloads with every installed JSON backend.
+#
+#   python -m benchmarks.bench_json  (from the repository root)
+from functools import partial
+from timeit import repeat
+from typing import Dict
+
+import requests
+from requests_mock import Mocker
+
+from jira_cloud_api.jira_json import JSON_DECODERS, get_json_decoder
+from tests.mock_jira_server import mock_jira_requests
+
+URL = "https://localhost"
+
+
+def get_payloads() -> Dict[str, bytes]:
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests(search_issue_count=1000),
+    ):
+        return {
+            "fields": requests.get(f"{URL}/rest/api/2/field", timeout=1).content,
+            "projects": requests.get(f"{URL}/rest/api/2/project", timeout=1).content,
+            "createmeta": requests.get(
+                f"{URL}/rest/api/2/issue/createmeta/SAND/issuetypes/10002", timeout=1
+            ).content,
+            "search (1000 issues)": requests.get(
+                f"{URL}/rest/api/2/search",
+                params={"jql": "project = SAND", "maxResults": "1000"},
+                timeout=1,
+            ).content,
+        }
+
+
+def main() -> None:
+    payloads = get_payloads()
+    for backend in JSON_DECODERS:
+        try:
+            decode = get_json_decoder(backend)
+        except ValueError:
+            print(f"{backend:<8} not installed")
+            continue
+
+        for name, payload in payloads.items():
+            number = max(1, 2_000_000 // len(payload))
+            best = min(repeat(partial(decode, payload), number=number, repeat=5))
+            print(
+                f"{backend:<8} {name:<22} {len(payload):>8} bytes"
+                f" {best / number * 1e6:10.1f} us"
+            )
+
+
+if __name__ == "__main__":
+    main()
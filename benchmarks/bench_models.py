@@ -0,0 +1,102 @@
+# Memory used by project field models, compared with the previous plain
+# dataclasses without interning.
+#
+#   python benchmarks/bench_models.py
+import json
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from jira_cloud_api.jira_converters import convert_to_project_field
+
+PROJECTS = 300
+FIELDS_PER_PROJECT = 40
+
+
+@dataclass
+class LegacyJiraFieldSchema:
+    type: str
+    items: Optional[str] = None
+    system: Optional[str] = None
+    custom: Optional[str] = None
+    custom_id: Optional[str] = None
+
+
+@dataclass
+class LegacyJiraProjectField:
+    required: bool
+    name: str
+    has_default_value: bool
+    allowed_values: Dict[str, str]
+    field_id: str
+    key: str
+    schema: Optional[LegacyJiraFieldSchema]
+
+
+def convert_to_legacy_project_field(raw_data: Dict[str, Any]) -> Any:
+    schema = raw_data["schema"]
+    return LegacyJiraProjectField(
+        required=raw_data.get("required", False),
+        name=str(raw_data.get("name", "")),
+        has_default_value=raw_data.get("hasDefaultValue", False),
+        allowed_values={},
+        field_id=str(raw_data.get("fieldId", "")),
+        key=str(raw_data.get("key", "")),
+        schema=LegacyJiraFieldSchema(
+            type=str(schema.get("type", "")),
+            items=str(schema.get("items", "")),
+            system=str(schema.get("system", "")),
+            custom=str(schema.get("custom", "")),
+            custom_id=str(schema.get("customId", "")),
+        ),
+    )
+
+
+def get_raw_fields() -> List[Dict[str, Any]]:
+    fields = []
+    for project in range(PROJECTS):
+        for i in range(FIELDS_PER_PROJECT):
+            custom = i % 2 == 1
+            fields.append(
+                {
+                    "required": i == 0,
+                    "name": f"Field {i}",
+                    "hasDefaultValue": False,
+                    "fieldId": f"customfield_{10000 + i}" if custom else f"field{i}",
+                    "key": f"customfield_{10000 + i}" if custom else f"field{i}",
+                    "schema": {
+                        "type": "array" if i % 3 == 0 else "string",
+                        "items": "option" if i % 3 == 0 else "",
+                        "system": "" if custom else f"field{i}",
+                        "custom": "com.atlassian.jira.plugin.system.customfieldtypes"
+                        + (":select" if custom else ""),
+                        "customId": 10000 + i if custom else "",
+                    },
+                    "project": project,
+                }
+            )
+    # decoding gives every object its own string copies, like a response.
+    decoded: List[Dict[str, Any]] = json.loads(json.dumps(fields))
+    return decoded
+
+
+def measure(name: str, convert: Callable[[Dict[str, Any]], Any]) -> None:
+    tracemalloc.start()
+    # decode inside the trace, models keep the decoded strings alive unless
+    # they are replaced by interned copies.
+    raw_fields = get_raw_fields()
+    models = [convert(field) for field in raw_fields]
+    del raw_fields
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{name:<12} {used / len(models):8.1f} bytes/field")
+
+
+def main() -> None:
+    measure("dataclass", convert_to_legacy_project_field)
+    measure("slotted", convert_to_project_field)
+
+
+if __name__ == "__main__":
+    main()
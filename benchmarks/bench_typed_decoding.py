@@ -0,0 +1,57 @@
+# Compares json decoding plus the dict based converters with the msgspec
+# typed decoding path on the mock server payloads.
+#
+#   python -m benchmarks.bench_typed_decoding  (from the repository root)
+import json
+from functools import partial
+from timeit import repeat
+from typing import Any, Callable, Dict
+
+from benchmarks.bench_json import get_payloads
+from jira_cloud_api.jira_converters import convert_to_field, convert_to_project_field
+from jira_cloud_api.jira_json import get_typed_decoder
+
+
+def decode_fields(content: bytes) -> Any:
+    return [convert_to_field(field) for field in json.loads(content)]
+
+
+def decode_project_fields(content: bytes) -> Any:
+    raw_data: Dict[str, Any] = json.loads(content)
+    return [
+        convert_to_project_field(field)
+        for field in raw_data.get("fields", raw_data.get("values", []))
+    ]
+
+
+def bench(name: str, decode: Callable[[bytes], Any], content: bytes) -> None:
+    objects = len(decode(content))
+    number = 2000
+    best = min(repeat(partial(decode, content), number=number, repeat=5))
+    print(f"{name:<28} {best / number / objects * 1e6:8.2f} us/object")
+
+
+def main() -> None:
+    payloads = get_payloads()
+    bench("fields json + converters", decode_fields, payloads["fields"])
+    bench(
+        "createmeta json + converters",
+        decode_project_fields,
+        payloads["createmeta"],
+    )
+
+    try:
+        typed_decoder = get_typed_decoder()
+    except ValueError as e:
+        print(e)
+        return
+    bench("fields msgspec typed", typed_decoder.decode_fields, payloads["fields"])
+    bench(
+        "createmeta msgspec typed",
+        lambda content: typed_decoder.decode_project_fields_page(content).fields,
+        payloads["createmeta"],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,38 +1,113 @@
-from importlib.metadata import version
-
-from jira_cloud_api.jira_api import JiraApi, JiraApiOptions
-from jira_cloud_api.jira_request import (
-    CreateIssueRequest,
-    GetProjectIssueFieldsRequest,
-    GetProjectIssueTypesRequest,
-)
-from jira_cloud_api.jira_response import (
-    CreateIssueResponse,
-    GetFieldsResponse,
-    GetIssueResponse,
-    GetMySelfResponse,
-    GetProjectDetailResponse,
-    GetProjectIssueFieldsResponse,
-    GetProjectIssueTypesResponse,
-    GetProjectsResponse,
-    GetServerInfoResponse,
-)
-
-__version__ = version("jira_cloud_api")
-
-__all__ = [
-    "JiraApi",
-    "JiraApiOptions",
-    "CreateIssueRequest",
-    "GetProjectIssueFieldsRequest",
-    "GetProjectIssueTypesRequest",
-    "CreateIssueResponse",
-    "GetFieldsResponse",
-    "GetIssueResponse",
-    "GetMySelfResponse",
-    "GetProjectDetailResponse",
-    "GetProjectIssueFieldsResponse",
-    "GetProjectIssueTypesResponse",
-    "GetProjectsResponse",
-    "GetServerInfoResponse",
-]
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List
+
+if TYPE_CHECKING:
+    from jira_cloud_api.jira_api import JiraApi, JiraApiError, JiraApiOptions
+    from jira_cloud_api.jira_async_api import AsyncJiraApi
+    from jira_cloud_api.jira_cache import (
+        ConditionalRequestCache,
+        DiskMetadataCache,
+        MetadataCache,
+    )
+    from jira_cloud_api.jira_client_pool import JiraClientPool
+    from jira_cloud_api.jira_datetime import parse_jira_datetime
+    from jira_cloud_api.jira_field_registry import FieldRegistry
+    from jira_cloud_api.jira_import import ImportRowResult, IssueImporter
+    from jira_cloud_api.jira_request import (
+        AddAttachmentRequest,
+        CreateIssueRequest,
+        GetProjectIssueFieldsRequest,
+        GetProjectIssueTypesRequest,
+        SearchIssuesRequest,
+        UpdateIssueRequest,
+    )
+    from jira_cloud_api.jira_response import (
+        AddAttachmentResponse,
+        CreateIssueResponse,
+        DownloadAttachmentResponse,
+        GetFieldsResponse,
+        GetIssueResponse,
+        GetIssueTransitionsResponse,
+        GetMySelfResponse,
+        GetProjectDetailResponse,
+        GetProjectIssueFieldsResponse,
+        GetProjectIssueTypesResponse,
+        GetProjectsResponse,
+        GetServerInfoResponse,
+        TransitionIssueResponse,
+        UpdateIssueResponse,
+    )
+    from jira_cloud_api.jira_retry import RetryPolicy, TokenBucket
+    from jira_cloud_api.jira_sync import (
+        FileWatermarkStore,
+        IncrementalSync,
+        MemoryWatermarkStore,
+        SyncWatermark,
+    )
+    from jira_cloud_api.jira_templates import CreateIssueTemplate
+
+# public name -> module, the module is imported on first attribute access so
+# ``import jira_cloud_api`` stays cheap for CLIs and serverless cold starts.
+_LAZY_ATTRIBUTES: Dict[str, str] = {
+    "JiraApi": "jira_cloud_api.jira_api",
+    "JiraApiOptions": "jira_cloud_api.jira_api",
+    "JiraApiError": "jira_cloud_api.jira_api",
+    "AsyncJiraApi": "jira_cloud_api.jira_async_api",
+    "JiraClientPool": "jira_cloud_api.jira_client_pool",
+    "MetadataCache": "jira_cloud_api.jira_cache",
+    "ConditionalRequestCache": "jira_cloud_api.jira_cache",
+    "DiskMetadataCache": "jira_cloud_api.jira_cache",
+    "FieldRegistry": "jira_cloud_api.jira_field_registry",
+    "IssueImporter": "jira_cloud_api.jira_import",
+    "ImportRowResult": "jira_cloud_api.jira_import",
+    "RetryPolicy": "jira_cloud_api.jira_retry",
+    "TokenBucket": "jira_cloud_api.jira_retry",
+    "IncrementalSync": "jira_cloud_api.jira_sync",
+    "SyncWatermark": "jira_cloud_api.jira_sync",
+    "FileWatermarkStore": "jira_cloud_api.jira_sync",
+    "MemoryWatermarkStore": "jira_cloud_api.jira_sync",
+    "parse_jira_datetime": "jira_cloud_api.jira_datetime",
+    "AddAttachmentRequest": "jira_cloud_api.jira_request",
+    "CreateIssueRequest": "jira_cloud_api.jira_request",
+    "CreateIssueTemplate": "jira_cloud_api.jira_templates",
+    "GetProjectIssueFieldsRequest": "jira_cloud_api.jira_request",
+    "GetProjectIssueTypesRequest": "jira_cloud_api.jira_request",
+    "SearchIssuesRequest": "jira_cloud_api.jira_request",
+    "UpdateIssueRequest": "jira_cloud_api.jira_request",
+    "AddAttachmentResponse": "jira_cloud_api.jira_response",
+    "CreateIssueResponse": "jira_cloud_api.jira_response",
+    "DownloadAttachmentResponse": "jira_cloud_api.jira_response",
+    "GetFieldsResponse": "jira_cloud_api.jira_response",
+    "GetIssueResponse": "jira_cloud_api.jira_response",
+    "GetIssueTransitionsResponse": "jira_cloud_api.jira_response",
+    "GetMySelfResponse": "jira_cloud_api.jira_response",
+    "GetProjectDetailResponse": "jira_cloud_api.jira_response",
+    "GetProjectIssueFieldsResponse": "jira_cloud_api.jira_response",
+    "GetProjectIssueTypesResponse": "jira_cloud_api.jira_response",
+    "GetProjectsResponse": "jira_cloud_api.jira_response",
+    "GetServerInfoResponse": "jira_cloud_api.jira_response",
+    "TransitionIssueResponse": "jira_cloud_api.jira_response",
+    "UpdateIssueResponse": "jira_cloud_api.jira_response",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        # reading the installed metadata scans sys.path, do it on demand.
+        # pylint: disable-next=import-outside-toplevel
+        from importlib.metadata import version
+
+        value: Any = version("jira_cloud_api")
+    elif name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name]), name)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(list(globals()) + __all__ + ["__version__"])
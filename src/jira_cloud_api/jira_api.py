@@ -1,36 +1,140 @@
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
-
-from dateparser import parse as date_parse
-from requests import request as http_request
-from requests.auth import HTTPBasicAuth
+from threading import Lock
+from time import sleep
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    TypeVar,
+    Union,
+)
 
+from jira_cloud_api.jira_attachment import (
+    DEFAULT_CHUNK_SIZE,
+    AttachmentTarget,
+    MultipartFileStream,
+    RangeSlice,
+    open_attachment_source,
+    open_attachment_target,
+    to_range_header,
+)
+from jira_cloud_api.jira_cache import (
+    FIELDS_ENDPOINT,
+    ISSUE_TRANSITIONS_ENDPOINT,
+    PROJECT_DETAIL_ENDPOINT,
+    PROJECT_ISSUE_FIELDS_ENDPOINT,
+    PROJECT_ISSUE_TYPES_ENDPOINT,
+    PROJECTS_ENDPOINT,
+    ConditionalRequestCache,
+    DiskMetadataCache,
+    MetadataCache,
+)
+from jira_cloud_api.jira_client_core import (
+    BULK_CREATE_ISSUE_LIMIT,
+    GET_ISSUES_CHUNK_SIZE,
+    ClientCaches,
+    SearchIssuesPages,
+    TransitionGroup,
+    add_issue_responses,
+    create_rate_limiter,
+    find_group_transition,
+    get_issues_search_chunks,
+    get_missing_issue_keys,
+    get_next_issues_chunk_start_at,
+    get_next_page_start_at,
+    get_query_all_start_ats,
+    get_settled_transition_response,
+    get_transition_groups,
+    order_issue_responses,
+    resolve_own_transition,
+    set_call_error,
+)
+from jira_cloud_api.jira_converters import (
+    convert_to_issue,
+    get_changed_issue_fields,
+    merge_project_issue_fields_pages,
+    merge_project_issue_types_pages,
+    to_add_attachment_response,
+    to_create_issue_response,
+    to_create_issues_responses,
+    to_download_attachment_response,
+    to_fields_response,
+    to_issue_keys_search_request,
+    to_issue_params,
+    to_issue_response,
+    to_issue_search_responses,
+    to_issue_transitions_response,
+    to_myself_response,
+    to_project_detail_response,
+    to_project_issue_fields_response,
+    to_project_issue_types_response,
+    to_projects_response,
+    to_search_issues_params,
+    to_server_info_response,
+    to_transition_issue_response,
+    to_typed_fields_response,
+    to_typed_project_detail_response,
+    to_typed_project_issue_fields_response,
+    to_typed_projects_response,
+    to_update_issue_response,
+)
+from jira_cloud_api.jira_field_registry import FieldRegistry
+from jira_cloud_api.jira_json import JsonDecoder, get_json_decoder, get_typed_decoder
 from jira_cloud_api.jira_models import (
     JiraField,
-    JiraFieldSchema,
+    JiraIssue,
     JiraIssueType,
-    JiraProject,
-    JiraProjectCategory,
-    JiraProjectDetail,
     JiraProjectField,
 )
 from jira_cloud_api.jira_request import (
+    AddAttachmentRequest,
     CreateIssueRequest,
     GetProjectIssueFieldsRequest,
     GetProjectIssueTypesRequest,
+    SearchIssuesRequest,
+    UpdateIssueRequest,
 )
 from jira_cloud_api.jira_response import (
+    AddAttachmentResponse,
+    BaseResponse,
     CreateIssueResponse,
+    DownloadAttachmentResponse,
     GetFieldsResponse,
+    GetIssueResponse,
+    GetIssueTransitionsResponse,
     GetMySelfResponse,
     GetProjectDetailResponse,
     GetProjectIssueFieldsResponse,
     GetProjectIssueTypesResponse,
     GetProjectsResponse,
     GetServerInfoResponse,
+    TransitionIssueResponse,
+    UpdateIssueResponse,
+)
+from jira_cloud_api.jira_retry import RetryPolicy, get_retry_delay
+from jira_cloud_api.jira_transport import (
+    HttpxTransport,
+    JiraTransport,
+    JiraTransportResponse,
+    RequestsTransport,
 )
 
 _DEFAULT_JIRA_TIMEOUT = 60.0
+_DEFAULT_POOL_CONNECTIONS = 10
+_DEFAULT_POOL_MAXSIZE = 10
+_DEFAULT_MAX_CONCURRENCY = 8
+_DEFAULT_CACHE_MAX_SIZE = 256
+_DEFAULT_CACHE_TTL = 300.0
+
+T = TypeVar("T")
+R = TypeVar("R")
+B = TypeVar("B", bound=BaseResponse)
 
 
 @dataclass
@@ -38,11 +142,14 @@ class JiraApiRequest:
     url: str
     params: Optional[Dict[str, Any]] = None
     body: Optional[Any] = None
+    headers: Optional[Dict[str, str]] = None
 
 
 class JiraApiResponse:
-    status_code: int
-    content: Any
+    # defaults describe a call which failed before any response arrived.
+    status_code: int = 0
+    content: Any = {}
+    headers: Mapping[str, str] = {}
     status_reason: Optional[str] = None
     error_text: Optional[str] = None
 
@@ -50,6 +157,21 @@ class JiraApiResponse:
         return self.status_code >= 200 and self.status_code <= 299
 
 
+class JiraApiError(Exception):
+    def __init__(
+        self,
+        status_code: int,
+        status_reason: Optional[str] = None,
+        error_text: Optional[str] = None,
+    ) -> None:
+        super().__init__(
+            f"Jira API request failed with status {status_code}: {error_text}"
+        )
+        self.status_code = status_code
+        self.status_reason = status_reason
+        self.error_text = error_text
+
+
 @dataclass
 class JiraApiOptions:
     url: str
@@ -57,6 +179,37 @@ class JiraApiOptions:
     user_email: Optional[str] = None
     timeout: Optional[float] = _DEFAULT_JIRA_TIMEOUT
     ssl_verify: bool = False
+    # number of per-host connection pools kept by the transport.
+    pool_connections: int = _DEFAULT_POOL_CONNECTIONS
+    # max connections kept open to a single host.
+    pool_maxsize: int = _DEFAULT_POOL_MAXSIZE
+    keep_alive: bool = True
+    http2: bool = False
+    # max requests a single call sends in parallel, e.g. pages of query_all.
+    max_concurrency: int = _DEFAULT_MAX_CONCURRENCY
+    # opt-in cache of fields, projects and createmeta responses.
+    cache_enabled: bool = False
+    cache_max_size: int = _DEFAULT_CACHE_MAX_SIZE
+    cache_ttl: float = _DEFAULT_CACHE_TTL
+    # per endpoint TTLs in seconds, keyed by the jira_cache *_ENDPOINT names.
+    cache_ttls: Optional[Dict[str, float]] = None
+    # revalidate metadata with If-None-Match / If-Modified-Since and reuse the
+    # parsed response on 304 Not Modified.
+    conditional_requests: bool = False
+    # persist metadata (and validators) under this directory, so short lived
+    # processes can start warm. Uses the cache TTLs above.
+    disk_cache_dir: Optional[str] = None
+    # retry throttled / unavailable responses, None disables retries.
+    retry_policy: Optional[RetryPolicy] = None
+    # client side pacing in requests per second, None disables it.
+    rate_limit: Optional[float] = None
+    rate_limit_burst: Optional[float] = None
+    # "auto" (default), "orjson", "msgspec", "json" or a callable that
+    # decodes the raw response bytes.
+    json_decoder: Optional[Union[str, JsonDecoder]] = None
+    # decode metadata responses straight into the models with msgspec
+    # structs, requires jira-cloud-api[msgspec].
+    typed_decoding: bool = False
 
 
 class JiraApi:
@@ -70,9 +223,25 @@ class JiraApi:
     def __init__(
         self,
         options: JiraApiOptions,
+        transport: Optional[JiraTransport] = None,
     ) -> None:
         self.__is_jira_cloud = self.__is_jira_cloud_url(options.url)
         self.__options = options
+        # a transport passed in is shared with other clients (see
+        # JiraClientPool), it is neither configured nor closed by this one.
+        self.__transport: Optional[JiraTransport] = transport
+        self.__owns_transport = transport is None
+        # the workers of __map_concurrently may ask for it at the same time.
+        self.__transport_lock = Lock()
+        # per instance copy, the bearer token of one client must not end up
+        # in the headers of another.
+        self.default_request_headers = dict(JiraApi.default_request_headers)
+        self.__rate_limiter = create_rate_limiter(options)
+        self.__caches = ClientCaches(options)
+        self.__decode_json = get_json_decoder(options.json_decoder)
+        self.__typed_decoder = get_typed_decoder() if options.typed_decoding else None
+        self.__field_registry = FieldRegistry()
+        self.__field_registry_source: Optional[List[JiraField]] = None
 
         if self.__is_jira_cloud:
             if not options.user_email:
@@ -88,66 +257,135 @@ class JiraApi:
             return True
         return False
 
-    def __call_post_api(self, request: JiraApiRequest) -> JiraApiResponse:
-        api_response = JiraApiResponse()
+    def __enter__(self) -> "JiraApi":
+        return self
 
-        try:
-            response = http_request(
-                method="POST",
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self.__transport_lock:
+            if self.__transport is not None and self.__owns_transport:
+                self.__transport.close()
+                self.__transport = None
+
+    def __get_transport(self) -> JiraTransport:
+        transport = self.__transport
+        if transport is not None:
+            return transport
+
+        with self.__transport_lock:
+            if self.__transport is None:
+                transport_type = (
+                    HttpxTransport if self.__options.http2 else RequestsTransport
+                )
+                self.__transport = transport_type(
+                    headers=self.default_request_headers,
+                    pool_connections=self.__options.pool_connections,
+                    pool_maxsize=self.__options.pool_maxsize,
+                    keep_alive=self.__options.keep_alive,
+                    ssl_verify=self.__options.ssl_verify,
+                )
+            return self.__transport
+
+    def __send(
+        self,
+        method: str,
+        request: JiraApiRequest,
+        json: Optional[Any] = None,
+        data: Optional[Any] = None,
+        stream: bool = False,
+    ) -> JiraTransportResponse:
+        attempt = 0
+        while True:
+            if self.__rate_limiter is not None:
+                sleep(self.__rate_limiter.reserve())
+
+            response = self.__get_transport().request(
+                method=method,
                 url=request.url,
                 params=request.params,
-                json=request.body if request.body else {},
+                json=json,
+                headers=(
+                    request.headers
+                    if self.__owns_transport
+                    else {**self.default_request_headers, **(request.headers or {})}
+                ),
                 auth=(
-                    HTTPBasicAuth(
-                        self.__options.user_email, self.__options.access_token
-                    )
+                    (self.__options.user_email, self.__options.access_token)
                     if self.__is_jira_cloud and self.__options.user_email
                     else None
                 ),
                 timeout=self.__options.timeout,
-                verify=self.__options.ssl_verify,
+                data=data,
+                stream=stream,
+            )
+
+            delay = get_retry_delay(
+                self.__options.retry_policy,
+                self.__rate_limiter,
+                method,
+                response.status_code,
+                response.headers,
+                attempt,
+                is_streamed=data is not None,
+            )
+            if delay is None:
+                return response
+
+            response.close()
+            sleep(delay)
+            attempt += 1
+
+    def __call_post_api(
+        self, request: JiraApiRequest, method: str = "POST", data: Optional[Any] = None
+    ) -> JiraApiResponse:
+        api_response = JiraApiResponse()
+        response = None
+
+        try:
+            response = self.__send(
+                method,
+                request,
+                json=None if data is not None else request.body or {},
+                data=data,
             )
 
             api_response.status_code = response.status_code
             api_response.status_reason = response.reason
             api_response.content = (
-                response.json() if response.status_code == 200 else {}
+                self.__decode_json(response.content)
+                if 200 <= response.status_code <= 299 and response.content
+                else {}
             )
             api_response.error_text = (
                 response.text if hasattr(response, "text") else None
             )
         except Exception as e:
-            api_response.error_text = (
-                str(e) if api_response.error_text is None else api_response.error_text
-            )
+            set_call_error(api_response, e)
         finally:
-            if response:
+            if response is not None:
                 response.close()
         return api_response
 
-    def __call_get_api(self, request: JiraApiRequest) -> JiraApiResponse:
+    def __call_get_api(
+        self,
+        request: JiraApiRequest,
+        decode: Optional[Callable[[bytes], Any]] = None,
+    ) -> JiraApiResponse:
         api_response = JiraApiResponse()
+        response = None
 
         try:
-            response = http_request(
-                method="GET",
-                url=request.url,
-                params=request.params,
-                auth=(
-                    HTTPBasicAuth(
-                        self.__options.user_email, self.__options.access_token
-                    )
-                    if self.__is_jira_cloud and self.__options.user_email
-                    else None
-                ),
-                timeout=self.__options.timeout,
-                verify=self.__options.ssl_verify,
-            )
+            response = self.__send("GET", request)
 
             api_response.status_code = response.status_code
             api_response.status_reason = response.reason
+            api_response.headers = response.headers
             api_response.content = (
-                response.json() if response.status_code == 200 else {}
+                (decode or self.__decode_json)(response.content)
+                if response.status_code == 200 and response.content
+                else {}
             )
             api_response.error_text = (
                 response.text
@@ -155,308 +393,368 @@ class JiraApi:
                 else None
             )
         except Exception as e:
-            api_response.error_text = (
-                str(e) if api_response.error_text is None else api_response.error_text
-            )
+            set_call_error(api_response, e)
         finally:
-            if response:
+            if response is not None:
                 response.close()
         return api_response
 
-    def get_server_info(self) -> GetServerInfoResponse:
-        raw_response = self.__call_get_api(
-            JiraApiRequest(url=f"{self.__options.url}/rest/api/2/serverInfo")
-        )
+    def invalidate(self, endpoint: Optional[str] = None, key: Hashable = None) -> None:
+        # drops cached metadata from memory, disk and the conditional request
+        # validators, ``endpoint`` is one of the jira_cache *_ENDPOINT names.
+        self.__caches.invalidate(endpoint, key)
 
-        response = GetServerInfoResponse()
-        response.status_code = raw_response.status_code
-        response.status_reason = raw_response.status_reason
+    @property
+    def metadata_cache(self) -> Optional[MetadataCache]:
+        # read-only view for statistics, use invalidate to drop entries.
+        return self.__caches.cache
 
-        if raw_response.status_code != 200:
-            response.error_text = raw_response.error_text
-            return response
+    @property
+    def disk_cache(self) -> Optional[DiskMetadataCache]:
+        return self.__caches.disk_cache
 
-        response.status_code = raw_response.status_code
-        response.base_url = str(raw_response.content.get("baseUrl", ""))
-        response.version = str(raw_response.content.get("version", ""))
-        response.deployment_type = str(raw_response.content.get("deploymentType", ""))
-        response.server_time_zone = str(raw_response.content.get("serverTimeZone", ""))
-        response.server_time = date_parse(raw_response.content.get("serverTime", ""))
+    @property
+    def conditional_request_cache(self) -> Optional[ConditionalRequestCache]:
+        return self.__caches.validators
 
+    def __call_conditional_get_api(
+        self,
+        request: JiraApiRequest,
+        convert: Callable[[JiraApiResponse], B],
+        decode: Optional[Callable[[bytes], Any]] = None,
+    ) -> B:
+        key = self.__caches.add_validator_headers(request)
+        raw_response = self.__call_get_api(request, decode)
+
+        cached: Optional[B] = self.__caches.get_not_modified(key, raw_response)
+        if cached is not None:
+            return cached
+
+        response = convert(raw_response)
+        self.__caches.put_validated(key, raw_response, response)
         return response
 
-    def get_jira_browser_link(self, key: str) -> "str":
-        return f"{self.__options.url}/browse/{key}"
-
-    def get_myself(self) -> GetMySelfResponse:
-        raw_response = self.__call_get_api(
-            JiraApiRequest(url=f"{self.__options.url}/rest/api/2/myself")
-        )
-
-        response = GetMySelfResponse()
-        response.status_code = raw_response.status_code
-        response.status_reason = raw_response.status_reason
-
-        if not raw_response.is_success_response():
-            response.error_text = raw_response.error_text
-            return response
+    def __cached(self, endpoint: str, key: Hashable, load: Callable[[], B]) -> B:
+        if not self.__caches.is_enabled:
+            return load()
 
-        response.account_id = str(raw_response.content.get("accountId", ""))
-        response.account_type = str(raw_response.content.get("accountType", ""))
-        response.email_address = str(raw_response.content.get("emailAddress", ""))
-        response.display_name = str(raw_response.content.get("displayName", ""))
-        response.time_zone = str(raw_response.content.get("timeZone", ""))
+        cached: Optional[B] = self.__caches.get(endpoint, key)
+        if cached is not None:
+            return cached
 
+        response = load()
+        self.__caches.put(endpoint, key, response)
         return response
 
-    def get_all_projects(self) -> GetProjectsResponse:
+    def get_server_info(self) -> GetServerInfoResponse:
         raw_response = self.__call_get_api(
-            JiraApiRequest(url=f"{self.__options.url}/rest/api/2/project")
+            JiraApiRequest(url=f"{self.__options.url}/rest/api/2/serverInfo")
         )
 
-        response = GetProjectsResponse()
-        response.status_code = raw_response.status_code
-        response.status_reason = raw_response.status_reason
+        return to_server_info_response(raw_response)
 
-        if not raw_response.is_success_response():
-            response.error_text = raw_response.error_text
-            return response
+    def get_jira_browser_link(self, key: str) -> "str":
+        return f"{self.__options.url}/browse/{key}"
 
-        def __convert_to_project(raw_data: Dict[str, Any]) -> JiraProject:
-            return JiraProject(
-                id=str(raw_data.get("id", "")),
-                name=str(raw_data.get("name", "")),
-                key=str(raw_data.get("key", "")),
-                type=str(raw_data.get("projectTypeKey", "")),
-                is_private=raw_data.get("isPrivate", False),
-                category=JiraProjectCategory(
-                    id=str(raw_data.get("projectCategory", {}).get("id", "")),
-                    name=str(raw_data.get("projectCategory", {}).get("name", "")),
-                    description=str(
-                        raw_data.get("projectCategory", {}).get("description", "")
-                    ),
-                ),
-            )
+    def get_myself(self) -> GetMySelfResponse:
+        raw_response = self.__call_get_api(
+            JiraApiRequest(url=f"{self.__options.url}/rest/api/2/myself")
+        )
 
-        response.projects = [
-            __convert_to_project(project) for project in raw_response.content
-        ]
+        return to_myself_response(raw_response)
 
-        return response
+    def get_all_projects(self) -> GetProjectsResponse:
+        return self.__cached(PROJECTS_ENDPOINT, None, self.__get_all_projects)
+
+    def __get_all_projects(self) -> GetProjectsResponse:
+        request = JiraApiRequest(url=f"{self.__options.url}/rest/api/2/project")
+        if self.__typed_decoder is not None:
+            return self.__call_conditional_get_api(
+                request,
+                to_typed_projects_response,
+                self.__typed_decoder.decode_projects,
+            )
+        return self.__call_conditional_get_api(request, to_projects_response)
 
     def get_project_detail(self, project_id_or_key: str) -> GetProjectDetailResponse:
-        raw_response = self.__call_get_api(
-            JiraApiRequest(
-                url=f"{self.__options.url}/rest/api/2/project/{project_id_or_key}"
+        return self.__cached(
+            PROJECT_DETAIL_ENDPOINT,
+            project_id_or_key,
+            lambda: self.__get_project_detail(project_id_or_key),
+        )
+
+    def __get_project_detail(self, project_id_or_key: str) -> GetProjectDetailResponse:
+        request = JiraApiRequest(
+            url=f"{self.__options.url}/rest/api/2/project/{project_id_or_key}"
+        )
+        if self.__typed_decoder is not None:
+            return self.__call_conditional_get_api(
+                request,
+                to_typed_project_detail_response,
+                self.__typed_decoder.decode_project_detail,
             )
+        return self.__call_conditional_get_api(request, to_project_detail_response)
+
+    def get_project_issue_types(
+        self, request: GetProjectIssueTypesRequest
+    ) -> GetProjectIssueTypesResponse:
+        return self.__cached(
+            PROJECT_ISSUE_TYPES_ENDPOINT,
+            (
+                request.project_id_or_key,
+                request.start_at,
+                request.max_results,
+                request.query_all,
+            ),
+            lambda: self.__get_project_issue_types(request),
         )
 
-        response = GetProjectDetailResponse()
-        response.status_code = raw_response.status_code
-        response.status_reason = raw_response.status_reason
+    def __get_project_issue_types(
+        self, request: GetProjectIssueTypesRequest
+    ) -> GetProjectIssueTypesResponse:
+        response = self.__get_project_issue_types_page(request, request.start_at)
 
-        if not raw_response.is_success_response():
-            response.error_text = raw_response.error_text
+        start_ats = get_query_all_start_ats(
+            request.start_at, request.max_results, request.query_all, response
+        )
+        if not start_ats:
             return response
 
-        response.project = JiraProjectDetail(
-            id=str(raw_response.content.get("id", "")),
-            key=str(raw_response.content.get("key", "")),
-            description=str(raw_response.content.get("description", "")),
-            issue_types=[
-                JiraIssueType(
-                    id=str(issue_type.get("id", "")),
-                    name=str(issue_type.get("name", "")),
-                    description=str(issue_type.get("description", "")),
-                    subtask=issue_type.get("subtask", False),
-                    hierarchy_level=issue_type.get("hierarchyLevel", 0),
-                    project_id=str(raw_response.content.get("id", "")),
-                )
-                for issue_type in raw_response.content.get("issueTypes", [])
-            ],
-            assignee_type=str(raw_response.content.get("assigneeType", "")),
-            name=str(raw_response.content.get("name", "")),
-            is_private=raw_response.content.get("isPrivate", False),
-            type=str(raw_response.content.get("projectTypeKey", "")),
+        pages = self.__map_concurrently(
+            lambda start_at: self.__get_project_issue_types_page(request, start_at),
+            start_ats,
         )
 
-        return response
+        return merge_project_issue_types_pages(response, pages)
 
-    def get_project_issue_types(
+    def iter_project_issue_types(
         self, request: GetProjectIssueTypesRequest
+    ) -> Iterator[JiraIssueType]:
+        start_at: Optional[int] = request.start_at
+        while start_at is not None:
+            page = self.__get_project_issue_types_page(request, start_at)
+            if page.status_code != 200:
+                raise JiraApiError(
+                    page.status_code, page.status_reason, page.error_text
+                )
+
+            yield from page.issue_types
+
+            start_at = get_next_page_start_at(
+                start_at, request.max_results, page, len(page.issue_types)
+            )
+
+    def __get_project_issue_types_page(
+        self, request: GetProjectIssueTypesRequest, start_at: int
     ) -> GetProjectIssueTypesResponse:
         raw_request = JiraApiRequest(
             url=f"{self.__options.url}/rest/api/2/issue/createmeta/{request.project_id_or_key}/issuetypes",  # pylint: disable=line-too-long
             params={
-                "startAt": request.start_at,
+                "startAt": start_at,
                 "maxResults": request.max_results,
             },
         )
 
-        raw_response = self.__call_get_api(raw_request)
-
-        response = GetProjectIssueTypesResponse()
-        response.status_code = raw_response.status_code
-        response.status_reason = raw_response.status_reason
-        response.total = raw_response.content.get("total", 0)
-        response.max_results = raw_response.content.get("maxResults", 50)
+        return self.__call_conditional_get_api(
+            raw_request,
+            lambda raw_response: to_project_issue_types_response(
+                raw_response, request.project_id_or_key
+            ),
+        )
 
-        if not raw_response.is_success_response():
-            response.error_text = raw_response.error_text
-            return response
+    def get_all_fields(self) -> GetFieldsResponse:
+        return self.__cached(FIELDS_ENDPOINT, None, self.__get_all_fields)
 
-        def __convert_to_issue_type(raw_data: Dict[str, Any]) -> JiraIssueType:
-            return JiraIssueType(
-                id=str(raw_data.get("id", "")),
-                name=str(raw_data.get("name", "")),
-                description=str(raw_data.get("description", "")),
-                subtask=raw_data.get("subtask", False),
-                hierarchy_level=raw_data.get("hierarchyLevel", 0),
-                project_id=request.project_id_or_key,
+    def __get_all_fields(self) -> GetFieldsResponse:
+        request = JiraApiRequest(url=f"{self.__options.url}/rest/api/2/field")
+        if self.__typed_decoder is not None:
+            return self.__call_conditional_get_api(
+                request, to_typed_fields_response, self.__typed_decoder.decode_fields
             )
+        return self.__call_conditional_get_api(request, to_fields_response)
 
-        response.issue_types = [
-            __convert_to_issue_type(issue_type)
-            for issue_type in raw_response.content.get("issueTypes", [])
-        ]
-
-        if (
-            request.query_all
-            and request.start_at + request.max_results < response.total
-        ):
-            request.start_at += request.max_results
-
-            next_response = self.get_project_issue_types(request)
-
-            response.issue_types = response.issue_types + (
-                next_response.issue_types if next_response.status_code == 200 else []
+    def get_field_registry(self) -> FieldRegistry:
+        response = self.get_all_fields()
+        if response.status_code != 200:
+            raise JiraApiError(
+                response.status_code, response.status_reason, response.error_text
             )
 
-        return response
+        # a cached or revalidated response returns the same list, skip the
+        # refresh then instead of comparing every field again.
+        if response.fields is not self.__field_registry_source:
+            self.__field_registry.refresh(response.fields)
+            self.__field_registry_source = response.fields
+        return self.__field_registry
 
-    def get_all_fields(self) -> GetFieldsResponse:
-        raw_response = self.__call_get_api(
-            JiraApiRequest(url=f"{self.__options.url}/rest/api/2/field")
+    def get_project_issue_fields(
+        self, request: GetProjectIssueFieldsRequest
+    ) -> GetProjectIssueFieldsResponse:
+        return self.__cached(
+            PROJECT_ISSUE_FIELDS_ENDPOINT,
+            (
+                request.project_id_or_key,
+                request.issue_type_id,
+                request.start_at,
+                request.max_results,
+                request.query_all,
+            ),
+            lambda: self.__get_project_issue_fields(request),
         )
 
-        response = GetFieldsResponse()
-        response.status_code = raw_response.status_code
-        response.status_reason = raw_response.status_reason
-        response.error_text = raw_response.error_text
+    def __get_project_issue_fields(
+        self, request: GetProjectIssueFieldsRequest
+    ) -> GetProjectIssueFieldsResponse:
+        response = self.__get_project_issue_fields_page(request, request.start_at)
 
-        if not raw_response.is_success_response():
-            response.error_text = raw_response.error_text
+        start_ats = get_query_all_start_ats(
+            request.start_at, request.max_results, request.query_all, response
+        )
+        if not start_ats:
             return response
 
-        response.fields = [
-            JiraField(
-                id=str(field.get("id", "")),
-                key=str(field.get("key", "")),
-                name=str(field.get("name", "")),
-                custom=field.get("custom", False),
-                orderable=field.get("orderable", False),
-                searchable=field.get("searchable", False),
-                clause_names=field.get("clauseNames", []),
-                schema=(
-                    JiraFieldSchema(
-                        type=str(field.get("schema", {}).get("type", "")),
-                        items=str(field.get("schema", {}).get("items", "")),
-                        system=str(field.get("schema", {}).get("system", "")),
-                        custom=str(field.get("schema", {}).get("custom", "")),
-                        custom_id=str(field.get("schema", {}).get("customId", "")),
-                    )
-                    if field.get("schema", None)
-                    else None
-                ),
-            )
-            for field in raw_response.content
-        ]
+        pages = self.__map_concurrently(
+            lambda start_at: self.__get_project_issue_fields_page(request, start_at),
+            start_ats,
+        )
 
-        return response
+        return merge_project_issue_fields_pages(response, pages)
 
-    def get_project_issue_fields(
+    def iter_project_issue_fields(
         self, request: GetProjectIssueFieldsRequest
+    ) -> Iterator[JiraProjectField]:
+        start_at: Optional[int] = request.start_at
+        while start_at is not None:
+            page = self.__get_project_issue_fields_page(request, start_at)
+            if page.status_code != 200:
+                raise JiraApiError(
+                    page.status_code, page.status_reason, page.error_text
+                )
+
+            yield from page.fields
+
+            start_at = get_next_page_start_at(
+                start_at, request.max_results, page, len(page.fields)
+            )
+
+    def __get_project_issue_fields_page(
+        self, request: GetProjectIssueFieldsRequest, start_at: int
     ) -> GetProjectIssueFieldsResponse:
         raw_request = JiraApiRequest(
             url=f"{self.__options.url}/rest/api/2/issue/createmeta/{request.project_id_or_key}/issuetypes/{request.issue_type_id}",  # pylint: disable=line-too-long
             params={
-                "startAt": request.start_at,
+                "startAt": start_at,
                 "maxResults": request.max_results,
             },
         )
 
-        raw_response = self.__call_get_api(raw_request)
+        if self.__typed_decoder is not None:
+            return self.__call_conditional_get_api(
+                raw_request,
+                to_typed_project_issue_fields_response,
+                self.__typed_decoder.decode_project_fields_page,
+            )
+        return self.__call_conditional_get_api(
+            raw_request, to_project_issue_fields_response
+        )
 
-        response = GetProjectIssueFieldsResponse()
-        response.status_code = raw_response.status_code
-        response.status_reason = raw_response.status_reason
-        response.error_text = raw_response.error_text
-        response.total = raw_response.content.get("total", 0)
-        response.max_results = raw_response.content.get("maxResults", 50)
+    def __map_concurrently(self, func: Callable[[T], R], items: List[T]) -> List[R]:
+        if not items:
+            return []
+        if len(items) == 1 or self.__options.max_concurrency <= 1:
+            return [func(item) for item in items]
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.__options.max_concurrency, len(items))
+        ) as executor:
+            # map keeps the results in the order of items.
+            return list(executor.map(func, items))
+
+    def search_issues(self, request: SearchIssuesRequest) -> Iterator[JiraIssue]:
+        pages = SearchIssuesPages(request)
+        while True:
+            raw_response = self.__call_get_api(
+                JiraApiRequest(
+                    url=f"{self.__options.url}{pages.path}", params=pages.params
+                )
+            )
+            if not raw_response.is_success_response():
+                raise JiraApiError(
+                    raw_response.status_code,
+                    raw_response.status_reason,
+                    raw_response.error_text,
+                )
 
-        if not raw_response.is_success_response():
-            response.error_text = raw_response.error_text
-            return response
+            issues = raw_response.content.get("issues", [])
+            for issue in issues:
+                yield convert_to_issue(issue)
 
-        def __convert_to_allowed_values(raw_data: Optional[Any]) -> Dict[str, str]:
-            if (raw_data is None) or not isinstance(raw_data, list):
-                return {}
+            if not pages.advance(raw_response.content, len(issues)):
+                return
 
-            allowed_values = {}
-            i = 0
-            for item in raw_data:
-                allowed_values.update(
-                    {f"{key}_{i}": str(value) for key, value in item.items()}
-                )
-                i += 1
-
-            return allowed_values
-
-        def __convert_to_jira_project_field(
-            raw_data: Dict[str, Any],
-        ) -> JiraProjectField:
-            return JiraProjectField(
-                required=raw_data.get("required", False),
-                name=str(raw_data.get("name", "")),
-                has_default_value=raw_data.get("hasDefaultValue", False),
-                allowed_values=(
-                    __convert_to_allowed_values(raw_data.get("allowedValues", []))
-                    if raw_data.get("allowedValues", None)
-                    else {}
-                ),
-                field_id=str(raw_data.get("fieldId", "")),
-                key=str(raw_data.get("key", "")),
-                schema=(
-                    JiraFieldSchema(
-                        type=str(raw_data.get("schema", {}).get("type", "")),
-                        items=str(raw_data.get("schema", {}).get("items", "")),
-                        system=str(raw_data.get("schema", {}).get("system", "")),
-                        custom=str(raw_data.get("schema", {}).get("custom", "")),
-                        custom_id=str(raw_data.get("schema", {}).get("customId", "")),
-                    )
-                    if raw_data.get("schema", None)
-                    else None
-                ),
+    def get_issue(
+        self,
+        key: str,
+        fields: Optional[List[str]] = None,
+        expand: Optional[List[str]] = None,
+    ) -> GetIssueResponse:
+        raw_response = self.__call_get_api(
+            JiraApiRequest(
+                url=f"{self.__options.url}/rest/api/2/issue/{key}",
+                params=to_issue_params(fields, expand),
             )
+        )
 
-        response.fields = [
-            __convert_to_jira_project_field(issue_type)
-            for issue_type in raw_response.content.get("fields", [])
-        ]
+        return to_issue_response(raw_response)
 
-        if (
-            request.query_all
-            and request.start_at + request.max_results < response.total
+    def get_issues(
+        self,
+        keys: List[str],
+        fields: Optional[List[str]] = None,
+        expand: Optional[List[str]] = None,
+        chunk_size: int = GET_ISSUES_CHUNK_SIZE,
+    ) -> List[GetIssueResponse]:
+        # results are in the order of keys.
+        found: Dict[str, GetIssueResponse] = {}
+        for responses in self.__map_concurrently(
+            lambda chunk: self.__search_issues_chunk(chunk, fields, expand),
+            get_issues_search_chunks(keys, chunk_size),
         ):
-            request.start_at += request.max_results
+            found.update(responses)
+
+        missing_keys = get_missing_issue_keys(keys, found)
+        add_issue_responses(
+            found,
+            missing_keys,
+            self.__map_concurrently(
+                lambda key: self.get_issue(key, fields, expand), missing_keys
+            ),
+        )
 
-            next_response = self.get_project_issue_fields(request)
+        return order_issue_responses(keys, found)
 
-            response.fields = response.fields + (
-                next_response.fields if next_response.status_code == 200 else []
+    def __search_issues_chunk(
+        self,
+        keys: List[str],
+        fields: Optional[List[str]],
+        expand: Optional[List[str]],
+    ) -> Dict[str, GetIssueResponse]:
+        # validateQuery=warn keeps one unknown key from failing the whole
+        # search, a failed chunk still falls back to single gets.
+        request = to_issue_keys_search_request(keys, fields, expand)
+        responses: Dict[str, GetIssueResponse] = {}
+        start_at: Optional[int] = 0
+        while start_at is not None:
+            raw_response = self.__call_get_api(
+                JiraApiRequest(
+                    url=f"{self.__options.url}/rest/api/2/search",
+                    params=to_search_issues_params(request, start_at=start_at),
+                )
             )
+            responses.update(to_issue_search_responses(raw_response))
+            start_at = get_next_issues_chunk_start_at(start_at, raw_response)
 
-        return response
+        return responses
 
     def create_issue(self, request: CreateIssueRequest) -> CreateIssueResponse:
         raw_response = self.__call_post_api(
@@ -466,17 +764,247 @@ class JiraApi:
             )
         )
 
-        response = CreateIssueResponse()
-        response.status_code = raw_response.status_code
-        response.status_reason = raw_response.status_reason
-        response.error_text = raw_response.error_text
+        return to_create_issue_response(raw_response)
 
-        if not raw_response.is_success_response():
-            response.error_text = raw_response.error_text
-            return response
+    def create_issues(
+        self,
+        requests: List[CreateIssueRequest],
+        chunk_size: int = BULK_CREATE_ISSUE_LIMIT,
+        concurrent: bool = False,
+    ) -> List[CreateIssueResponse]:
+        chunk_size = max(1, min(chunk_size, BULK_CREATE_ISSUE_LIMIT))
+        chunks = [
+            requests[i : i + chunk_size] for i in range(0, len(requests), chunk_size)
+        ]
 
-        response.id = raw_response.content.get("id", "")
-        response.key = raw_response.content.get("key", "")
-        response.link = raw_response.content.get("self", "")
+        if concurrent:
+            results = self.__map_concurrently(self.__create_issues_chunk, chunks)
+        else:
+            results = [self.__create_issues_chunk(chunk) for chunk in chunks]
 
-        return response
+        return [response for result in results for response in result]
+
+    def __create_issues_chunk(
+        self, requests: List[CreateIssueRequest]
+    ) -> List[CreateIssueResponse]:
+        raw_response = self.__call_post_api(
+            JiraApiRequest(
+                url=f"{self.__options.url}/rest/api/2/issue/bulk",
+                body={
+                    "issueUpdates": [{"fields": request.fields} for request in requests]
+                },
+            )
+        )
+
+        return to_create_issues_responses(raw_response, len(requests))
+
+    def update_issue(
+        self, request: UpdateIssueRequest, notify_users: bool = True
+    ) -> UpdateIssueResponse:
+        # notify_users=False suppresses the watcher emails, Jira only accepts
+        # it from admins and project admins.
+        fields = get_changed_issue_fields(request)
+        if not fields:
+            return to_update_issue_response(None, request.key, [])
+
+        raw_response = self.__call_post_api(
+            JiraApiRequest(
+                url=f"{self.__options.url}/rest/api/2/issue/{request.key}",
+                params=None if notify_users else {"notifyUsers": "false"},
+                body={"fields": fields},
+            ),
+            method="PUT",
+        )
+
+        return to_update_issue_response(raw_response, request.key, list(fields))
+
+    def update_issues(
+        self,
+        requests: List[UpdateIssueRequest],
+        notify_users: bool = True,
+        concurrent: bool = True,
+    ) -> List[UpdateIssueResponse]:
+        # Jira has no bulk edit for arbitrary fields, each issue is one PUT.
+        # At most max_concurrency run at once, rate_limit caps the throughput.
+        if concurrent:
+            return self.__map_concurrently(
+                lambda request: self.update_issue(request, notify_users), requests
+            )
+        return [self.update_issue(request, notify_users) for request in requests]
+
+    def get_issue_transitions(self, key: str) -> GetIssueTransitionsResponse:
+        raw_response = self.__call_get_api(
+            JiraApiRequest(
+                url=f"{self.__options.url}/rest/api/2/issue/{key}/transitions"
+            )
+        )
+
+        return to_issue_transitions_response(raw_response)
+
+    def transition_issue(self, key: str, transition_id: str) -> TransitionIssueResponse:
+        raw_response = self.__call_post_api(
+            JiraApiRequest(
+                url=f"{self.__options.url}/rest/api/2/issue/{key}/transitions",
+                body={"transition": {"id": transition_id}},
+            )
+        )
+
+        return to_transition_issue_response(raw_response, key, transition_id)
+
+    def transition_issues(
+        self, keys: List[str], to_status: str
+    ) -> List[TransitionIssueResponse]:
+        # ``to_status`` is a status id or name. Project, issue type and status
+        # of the issues are read with get_issues (one search per 100 keys),
+        # the transitions once per (project, issue type, status), and then
+        # most issues need a single POST instead of GET + POST. The transition
+        # lists go through the metadata cache when it is enabled.
+        distinct_keys = list(dict.fromkeys(keys))
+        issues = self.get_issues(
+            distinct_keys, fields=["project", "issuetype", "status"]
+        )
+
+        groups = get_transition_groups(distinct_keys, issues, to_status)
+        group_transitions = dict(
+            zip(
+                groups,
+                self.__map_concurrently(
+                    lambda group: self.__get_group_transitions(group, groups[group]),
+                    list(groups),
+                ),
+            )
+        )
+
+        responses = self.__map_concurrently(
+            lambda item: self.__transition_issue(
+                item[0], item[1], to_status, group_transitions
+            ),
+            list(zip(distinct_keys, issues)),
+        )
+
+        responses_by_key = dict(zip(distinct_keys, responses))
+        return [responses_by_key[key] for key in keys]
+
+    def __get_group_transitions(
+        self, group: TransitionGroup, key: str
+    ) -> GetIssueTransitionsResponse:
+        return self.__cached(
+            ISSUE_TRANSITIONS_ENDPOINT, group, lambda: self.get_issue_transitions(key)
+        )
+
+    def __transition_issue(
+        self,
+        key: str,
+        issue: GetIssueResponse,
+        to_status: str,
+        group_transitions: Dict[TransitionGroup, GetIssueTransitionsResponse],
+    ) -> TransitionIssueResponse:
+        settled_response = get_settled_transition_response(key, issue, to_status)
+        if settled_response is not None:
+            return settled_response
+
+        tried_response: Optional[TransitionIssueResponse] = None
+        transition = find_group_transition(issue, to_status, group_transitions)
+        if transition is not None:
+            tried_response = self.transition_issue(key, transition.id)
+            if tried_response.status_code != 400:
+                return tried_response
+
+        own_transition = resolve_own_transition(
+            key, to_status, self.get_issue_transitions(key), tried_response
+        )
+        if isinstance(own_transition, TransitionIssueResponse):
+            return own_transition
+        return self.transition_issue(key, own_transition.id)
+
+    def add_attachment(
+        self, request: AddAttachmentRequest, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AddAttachmentResponse:
+        # the file is streamed as multipart/form-data in chunks of chunk_size,
+        # it is never read into memory as a whole. Uploads are not retried.
+        try:
+            with open_attachment_source(request.file, request.filename) as (
+                file,
+                filename,
+            ):
+                body = MultipartFileStream(
+                    file, filename, request.content_type, chunk_size
+                )
+                headers = {"Content-Type": body.content_type}
+                if body.len is not None:
+                    headers["Content-Length"] = str(body.len)
+
+                raw_response = self.__call_post_api(
+                    JiraApiRequest(
+                        url=f"{self.__options.url}/rest/api/2/issue/{request.issue_key}/attachments",  # pylint: disable=line-too-long
+                        headers=headers,
+                    ),
+                    data=body,
+                )
+        except OSError as e:
+            raw_response = JiraApiResponse()
+            raw_response.error_text = str(e)
+
+        return to_add_attachment_response(raw_response, request.issue_key)
+
+    def add_attachments(
+        self,
+        requests: List[AddAttachmentRequest],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        concurrent: bool = True,
+    ) -> List[AddAttachmentResponse]:
+        # at most max_concurrency uploads run at once, each holds one chunk.
+        if concurrent:
+            return self.__map_concurrently(
+                lambda request: self.add_attachment(request, chunk_size), requests
+            )
+        return [self.add_attachment(request, chunk_size) for request in requests]
+
+    def download_attachment(
+        self,
+        attachment_id: str,
+        target: AttachmentTarget,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> DownloadAttachmentResponse:
+        # writes the content to a path or binary file object chunk by chunk.
+        # start and end (inclusive) request a byte range, a path target is
+        # only created once the response succeeded.
+        range_header = to_range_header(start, end)
+        api_response = JiraApiResponse()
+        response = None
+        size = 0
+
+        try:
+            response = self.__send(
+                "GET",
+                JiraApiRequest(
+                    url=f"{self.__options.url}/rest/api/2/attachment/content/{attachment_id}",  # pylint: disable=line-too-long
+                    headers={"Range": range_header} if range_header else None,
+                ),
+                stream=True,
+            )
+
+            api_response.status_code = response.status_code
+            api_response.status_reason = response.reason
+            api_response.headers = response.headers
+            if not api_response.is_success_response():
+                api_response.error_text = response.text
+            else:
+                range_slice = RangeSlice(response.status_code, start, end)
+                with open_attachment_target(target) as file:
+                    for chunk in response.iter_content(chunk_size):
+                        data = range_slice.apply(chunk)
+                        if data:
+                            file.write(data)
+                            size += len(data)
+                        if range_slice.is_done:
+                            break
+        except Exception as e:
+            api_response.error_text = str(e)
+        finally:
+            if response is not None:
+                response.close()
+
+        return to_download_attachment_response(api_response, attachment_id, size)
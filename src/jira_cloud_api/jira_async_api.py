@@ -0,0 +1,917 @@
+import asyncio
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    TypeVar,
+)
+
+from jira_cloud_api.jira_api import (
+    JiraApi,
+    JiraApiError,
+    JiraApiOptions,
+    JiraApiRequest,
+    JiraApiResponse,
+)
+from jira_cloud_api.jira_attachment import (
+    DEFAULT_CHUNK_SIZE,
+    AttachmentTarget,
+    MultipartFileStream,
+    RangeSlice,
+    open_attachment_source,
+    open_attachment_target,
+    to_range_header,
+)
+from jira_cloud_api.jira_cache import (
+    FIELDS_ENDPOINT,
+    ISSUE_TRANSITIONS_ENDPOINT,
+    PROJECT_DETAIL_ENDPOINT,
+    PROJECT_ISSUE_FIELDS_ENDPOINT,
+    PROJECT_ISSUE_TYPES_ENDPOINT,
+    PROJECTS_ENDPOINT,
+    ConditionalRequestCache,
+    DiskMetadataCache,
+    MetadataCache,
+)
+from jira_cloud_api.jira_client_core import (
+    BULK_CREATE_ISSUE_LIMIT,
+    GET_ISSUES_CHUNK_SIZE,
+    ClientCaches,
+    SearchIssuesPages,
+    TransitionGroup,
+    add_issue_responses,
+    create_rate_limiter,
+    find_group_transition,
+    get_issues_search_chunks,
+    get_missing_issue_keys,
+    get_next_issues_chunk_start_at,
+    get_next_page_start_at,
+    get_query_all_start_ats,
+    get_settled_transition_response,
+    get_transition_groups,
+    order_issue_responses,
+    resolve_own_transition,
+    set_call_error,
+)
+from jira_cloud_api.jira_converters import (
+    convert_to_issue,
+    get_changed_issue_fields,
+    merge_project_issue_fields_pages,
+    merge_project_issue_types_pages,
+    to_add_attachment_response,
+    to_create_issue_response,
+    to_create_issues_responses,
+    to_download_attachment_response,
+    to_fields_response,
+    to_issue_keys_search_request,
+    to_issue_params,
+    to_issue_response,
+    to_issue_search_responses,
+    to_issue_transitions_response,
+    to_myself_response,
+    to_project_detail_response,
+    to_project_issue_fields_response,
+    to_project_issue_types_response,
+    to_projects_response,
+    to_search_issues_params,
+    to_server_info_response,
+    to_transition_issue_response,
+    to_typed_fields_response,
+    to_typed_project_detail_response,
+    to_typed_project_issue_fields_response,
+    to_typed_projects_response,
+    to_update_issue_response,
+)
+from jira_cloud_api.jira_field_registry import FieldRegistry
+from jira_cloud_api.jira_json import get_json_decoder, get_typed_decoder
+from jira_cloud_api.jira_models import (
+    JiraField,
+    JiraIssue,
+    JiraIssueType,
+    JiraProjectField,
+)
+from jira_cloud_api.jira_request import (
+    AddAttachmentRequest,
+    CreateIssueRequest,
+    GetProjectIssueFieldsRequest,
+    GetProjectIssueTypesRequest,
+    SearchIssuesRequest,
+    UpdateIssueRequest,
+)
+from jira_cloud_api.jira_response import (
+    AddAttachmentResponse,
+    BaseResponse,
+    CreateIssueResponse,
+    DownloadAttachmentResponse,
+    GetFieldsResponse,
+    GetIssueResponse,
+    GetIssueTransitionsResponse,
+    GetMySelfResponse,
+    GetProjectDetailResponse,
+    GetProjectIssueFieldsResponse,
+    GetProjectIssueTypesResponse,
+    GetProjectsResponse,
+    GetServerInfoResponse,
+    TransitionIssueResponse,
+    UpdateIssueResponse,
+)
+from jira_cloud_api.jira_retry import get_retry_delay
+from jira_cloud_api.jira_transport import HttpxTransportResponse
+
+T = TypeVar("T")
+R = TypeVar("R")
+B = TypeVar("B", bound=BaseResponse)
+
+
+class AsyncJiraApi:
+    def __init__(
+        self,
+        options: JiraApiOptions,
+        transport: Optional[Any] = None,
+    ) -> None:
+        try:
+            import httpx  # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise ValueError(
+                "AsyncJiraApi requires httpx, install jira-cloud-api[async]."
+            ) from e
+
+        self.__is_jira_cloud = (
+            options.url is not None and "ATLASSIAN.NET" in options.url.upper()
+        )
+        self.__options = options
+        self.__rate_limiter = create_rate_limiter(options)
+        self.__caches = ClientCaches(options)
+        self.__decode_json = get_json_decoder(options.json_decoder)
+        self.__typed_decoder = get_typed_decoder() if options.typed_decoding else None
+        self.__field_registry = FieldRegistry()
+        self.__field_registry_source: Optional[List[JiraField]] = None
+
+        if self.__is_jira_cloud and not options.user_email:
+            raise ValueError("User email must be provided for Jira Cloud API.")
+
+        headers = dict(JiraApi.default_request_headers)
+        if not self.__is_jira_cloud:
+            headers["Authorization"] = f"Bearer {options.access_token}"
+        if not options.keep_alive:
+            headers["Connection"] = "close"
+
+        # requests waiting for a free connection queue on the pool instead of
+        # failing, so a single event loop can keep thousands of calls in flight.
+        self.__client = httpx.AsyncClient(
+            http2=options.http2,
+            verify=options.ssl_verify,
+            headers=headers,
+            auth=(
+                (options.user_email, options.access_token)
+                if self.__is_jira_cloud and options.user_email
+                else None
+            ),
+            timeout=httpx.Timeout(options.timeout, pool=None),
+            limits=httpx.Limits(
+                max_connections=options.pool_connections * options.pool_maxsize,
+                max_keepalive_connections=(
+                    options.pool_maxsize if options.keep_alive else 0
+                ),
+            ),
+            transport=transport,
+        )
+
+    async def __aenter__(self) -> "AsyncJiraApi":
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        await self.__client.aclose()
+
+    async def __send(
+        self,
+        method: str,
+        request: JiraApiRequest,
+        json: Optional[Any] = None,
+        data: Optional[Any] = None,
+        stream: bool = False,
+    ) -> HttpxTransportResponse:
+        attempt = 0
+        while True:
+            if self.__rate_limiter is not None:
+                await asyncio.sleep(self.__rate_limiter.reserve())
+
+            # ``data`` is a streamed body, ``stream`` leaves the response body
+            # unread until aiter_content.
+            response = HttpxTransportResponse(
+                await self.__client.send(
+                    self.__client.build_request(
+                        method=method,
+                        url=request.url,
+                        params=request.params,
+                        json=json,
+                        content=data,
+                        headers=request.headers,
+                    ),
+                    stream=stream,
+                )
+            )
+
+            delay = get_retry_delay(
+                self.__options.retry_policy,
+                self.__rate_limiter,
+                method,
+                response.status_code,
+                response.headers,
+                attempt,
+                is_streamed=data is not None,
+            )
+            if delay is None:
+                return response
+
+            await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    async def __call_post_api(
+        self, request: JiraApiRequest, method: str = "POST", data: Optional[Any] = None
+    ) -> JiraApiResponse:
+        api_response = JiraApiResponse()
+
+        try:
+            response = await self.__send(
+                method,
+                request,
+                json=None if data is not None else request.body or {},
+                data=data,
+            )
+
+            api_response.status_code = response.status_code
+            api_response.status_reason = response.reason
+            api_response.content = (
+                self.__decode_json(response.content)
+                if 200 <= response.status_code <= 299 and response.content
+                else {}
+            )
+            api_response.error_text = (
+                response.text if hasattr(response, "text") else None
+            )
+        except Exception as e:
+            set_call_error(api_response, e)
+        return api_response
+
+    async def __call_get_api(
+        self,
+        request: JiraApiRequest,
+        decode: Optional[Callable[[bytes], Any]] = None,
+    ) -> JiraApiResponse:
+        api_response = JiraApiResponse()
+
+        try:
+            response = await self.__send("GET", request)
+
+            api_response.status_code = response.status_code
+            api_response.status_reason = response.reason
+            api_response.headers = response.headers
+            api_response.content = (
+                (decode or self.__decode_json)(response.content)
+                if response.status_code == 200 and response.content
+                else {}
+            )
+            api_response.error_text = (
+                response.text
+                if hasattr(response, "text") and response.status_code > 299
+                else None
+            )
+        except Exception as e:
+            set_call_error(api_response, e)
+        return api_response
+
+    def invalidate(self, endpoint: Optional[str] = None, key: Hashable = None) -> None:
+        # drops cached metadata from memory, disk and the conditional request
+        # validators, ``endpoint`` is one of the jira_cache *_ENDPOINT names.
+        self.__caches.invalidate(endpoint, key)
+
+    @property
+    def metadata_cache(self) -> Optional[MetadataCache]:
+        # read-only view for statistics, use invalidate to drop entries.
+        return self.__caches.cache
+
+    @property
+    def disk_cache(self) -> Optional[DiskMetadataCache]:
+        return self.__caches.disk_cache
+
+    @property
+    def conditional_request_cache(self) -> Optional[ConditionalRequestCache]:
+        return self.__caches.validators
+
+    async def __call_conditional_get_api(
+        self,
+        request: JiraApiRequest,
+        convert: Callable[[JiraApiResponse], B],
+        decode: Optional[Callable[[bytes], Any]] = None,
+    ) -> B:
+        key = self.__caches.add_validator_headers(request)
+        raw_response = await self.__call_get_api(request, decode)
+
+        cached: Optional[B] = self.__caches.get_not_modified(key, raw_response)
+        if cached is not None:
+            return cached
+
+        response = convert(raw_response)
+        self.__caches.put_validated(key, raw_response, response)
+        return response
+
+    async def __cached(
+        self, endpoint: str, key: Hashable, load: Callable[[], Awaitable[B]]
+    ) -> B:
+        if not self.__caches.is_enabled:
+            return await load()
+
+        cached: Optional[B] = self.__caches.get(endpoint, key)
+        if cached is not None:
+            return cached
+
+        response = await load()
+        self.__caches.put(endpoint, key, response)
+        return response
+
+    async def get_server_info(self) -> GetServerInfoResponse:
+        raw_response = await self.__call_get_api(
+            JiraApiRequest(url=f"{self.__options.url}/rest/api/2/serverInfo")
+        )
+
+        return to_server_info_response(raw_response)
+
+    def get_jira_browser_link(self, key: str) -> "str":
+        return f"{self.__options.url}/browse/{key}"
+
+    async def get_myself(self) -> GetMySelfResponse:
+        raw_response = await self.__call_get_api(
+            JiraApiRequest(url=f"{self.__options.url}/rest/api/2/myself")
+        )
+
+        return to_myself_response(raw_response)
+
+    async def get_all_projects(self) -> GetProjectsResponse:
+        return await self.__cached(PROJECTS_ENDPOINT, None, self.__get_all_projects)
+
+    async def __get_all_projects(self) -> GetProjectsResponse:
+        request = JiraApiRequest(url=f"{self.__options.url}/rest/api/2/project")
+        if self.__typed_decoder is not None:
+            return await self.__call_conditional_get_api(
+                request,
+                to_typed_projects_response,
+                self.__typed_decoder.decode_projects,
+            )
+        return await self.__call_conditional_get_api(request, to_projects_response)
+
+    async def get_project_detail(
+        self, project_id_or_key: str
+    ) -> GetProjectDetailResponse:
+        return await self.__cached(
+            PROJECT_DETAIL_ENDPOINT,
+            project_id_or_key,
+            lambda: self.__get_project_detail(project_id_or_key),
+        )
+
+    async def __get_project_detail(
+        self, project_id_or_key: str
+    ) -> GetProjectDetailResponse:
+        request = JiraApiRequest(
+            url=f"{self.__options.url}/rest/api/2/project/{project_id_or_key}"
+        )
+        if self.__typed_decoder is not None:
+            return await self.__call_conditional_get_api(
+                request,
+                to_typed_project_detail_response,
+                self.__typed_decoder.decode_project_detail,
+            )
+        return await self.__call_conditional_get_api(
+            request, to_project_detail_response
+        )
+
+    async def get_project_issue_types(
+        self, request: GetProjectIssueTypesRequest
+    ) -> GetProjectIssueTypesResponse:
+        return await self.__cached(
+            PROJECT_ISSUE_TYPES_ENDPOINT,
+            (
+                request.project_id_or_key,
+                request.start_at,
+                request.max_results,
+                request.query_all,
+            ),
+            lambda: self.__get_project_issue_types(request),
+        )
+
+    async def __get_project_issue_types(
+        self, request: GetProjectIssueTypesRequest
+    ) -> GetProjectIssueTypesResponse:
+        response = await self.__get_project_issue_types_page(request, request.start_at)
+
+        start_ats = get_query_all_start_ats(
+            request.start_at, request.max_results, request.query_all, response
+        )
+        if not start_ats:
+            return response
+
+        pages = await self.__map_concurrently(
+            lambda start_at: self.__get_project_issue_types_page(request, start_at),
+            start_ats,
+        )
+
+        return merge_project_issue_types_pages(response, pages)
+
+    async def iter_project_issue_types(
+        self, request: GetProjectIssueTypesRequest
+    ) -> AsyncIterator[JiraIssueType]:
+        start_at: Optional[int] = request.start_at
+        while start_at is not None:
+            page = await self.__get_project_issue_types_page(request, start_at)
+            if page.status_code != 200:
+                raise JiraApiError(
+                    page.status_code, page.status_reason, page.error_text
+                )
+
+            for issue_type in page.issue_types:
+                yield issue_type
+
+            start_at = get_next_page_start_at(
+                start_at, request.max_results, page, len(page.issue_types)
+            )
+
+    async def __get_project_issue_types_page(
+        self, request: GetProjectIssueTypesRequest, start_at: int
+    ) -> GetProjectIssueTypesResponse:
+        raw_request = JiraApiRequest(
+            url=f"{self.__options.url}/rest/api/2/issue/createmeta/{request.project_id_or_key}/issuetypes",  # pylint: disable=line-too-long
+            params={
+                "startAt": start_at,
+                "maxResults": request.max_results,
+            },
+        )
+
+        return await self.__call_conditional_get_api(
+            raw_request,
+            lambda raw_response: to_project_issue_types_response(
+                raw_response, request.project_id_or_key
+            ),
+        )
+
+    async def get_all_fields(self) -> GetFieldsResponse:
+        return await self.__cached(FIELDS_ENDPOINT, None, self.__get_all_fields)
+
+    async def __get_all_fields(self) -> GetFieldsResponse:
+        request = JiraApiRequest(url=f"{self.__options.url}/rest/api/2/field")
+        if self.__typed_decoder is not None:
+            return await self.__call_conditional_get_api(
+                request, to_typed_fields_response, self.__typed_decoder.decode_fields
+            )
+        return await self.__call_conditional_get_api(request, to_fields_response)
+
+    async def get_field_registry(self) -> FieldRegistry:
+        response = await self.get_all_fields()
+        if response.status_code != 200:
+            raise JiraApiError(
+                response.status_code, response.status_reason, response.error_text
+            )
+
+        # a cached or revalidated response returns the same list, skip the
+        # refresh then instead of comparing every field again.
+        if response.fields is not self.__field_registry_source:
+            self.__field_registry.refresh(response.fields)
+            self.__field_registry_source = response.fields
+        return self.__field_registry
+
+    async def get_project_issue_fields(
+        self, request: GetProjectIssueFieldsRequest
+    ) -> GetProjectIssueFieldsResponse:
+        return await self.__cached(
+            PROJECT_ISSUE_FIELDS_ENDPOINT,
+            (
+                request.project_id_or_key,
+                request.issue_type_id,
+                request.start_at,
+                request.max_results,
+                request.query_all,
+            ),
+            lambda: self.__get_project_issue_fields(request),
+        )
+
+    async def __get_project_issue_fields(
+        self, request: GetProjectIssueFieldsRequest
+    ) -> GetProjectIssueFieldsResponse:
+        response = await self.__get_project_issue_fields_page(request, request.start_at)
+
+        start_ats = get_query_all_start_ats(
+            request.start_at, request.max_results, request.query_all, response
+        )
+        if not start_ats:
+            return response
+
+        pages = await self.__map_concurrently(
+            lambda start_at: self.__get_project_issue_fields_page(request, start_at),
+            start_ats,
+        )
+
+        return merge_project_issue_fields_pages(response, pages)
+
+    async def iter_project_issue_fields(
+        self, request: GetProjectIssueFieldsRequest
+    ) -> AsyncIterator[JiraProjectField]:
+        start_at: Optional[int] = request.start_at
+        while start_at is not None:
+            page = await self.__get_project_issue_fields_page(request, start_at)
+            if page.status_code != 200:
+                raise JiraApiError(
+                    page.status_code, page.status_reason, page.error_text
+                )
+
+            for field in page.fields:
+                yield field
+
+            start_at = get_next_page_start_at(
+                start_at, request.max_results, page, len(page.fields)
+            )
+
+    async def __get_project_issue_fields_page(
+        self, request: GetProjectIssueFieldsRequest, start_at: int
+    ) -> GetProjectIssueFieldsResponse:
+        raw_request = JiraApiRequest(
+            url=f"{self.__options.url}/rest/api/2/issue/createmeta/{request.project_id_or_key}/issuetypes/{request.issue_type_id}",  # pylint: disable=line-too-long
+            params={
+                "startAt": start_at,
+                "maxResults": request.max_results,
+            },
+        )
+
+        if self.__typed_decoder is not None:
+            return await self.__call_conditional_get_api(
+                raw_request,
+                to_typed_project_issue_fields_response,
+                self.__typed_decoder.decode_project_fields_page,
+            )
+        return await self.__call_conditional_get_api(
+            raw_request, to_project_issue_fields_response
+        )
+
+    async def __map_concurrently(
+        self, func: Callable[[T], Awaitable[R]], items: List[T]
+    ) -> List[R]:
+        semaphore = asyncio.Semaphore(max(self.__options.max_concurrency, 1))
+
+        async def call_with_limit(item: T) -> R:
+            async with semaphore:
+                return await func(item)
+
+        # gather keeps the results in the order of items.
+        return list(await asyncio.gather(*(call_with_limit(item) for item in items)))
+
+    async def search_issues(
+        self, request: SearchIssuesRequest
+    ) -> AsyncIterator[JiraIssue]:
+        pages = SearchIssuesPages(request)
+        while True:
+            raw_response = await self.__call_get_api(
+                JiraApiRequest(
+                    url=f"{self.__options.url}{pages.path}", params=pages.params
+                )
+            )
+            if not raw_response.is_success_response():
+                raise JiraApiError(
+                    raw_response.status_code,
+                    raw_response.status_reason,
+                    raw_response.error_text,
+                )
+
+            issues = raw_response.content.get("issues", [])
+            for issue in issues:
+                yield convert_to_issue(issue)
+
+            if not pages.advance(raw_response.content, len(issues)):
+                return
+
+    async def get_issue(
+        self,
+        key: str,
+        fields: Optional[List[str]] = None,
+        expand: Optional[List[str]] = None,
+    ) -> GetIssueResponse:
+        raw_response = await self.__call_get_api(
+            JiraApiRequest(
+                url=f"{self.__options.url}/rest/api/2/issue/{key}",
+                params=to_issue_params(fields, expand),
+            )
+        )
+
+        return to_issue_response(raw_response)
+
+    async def get_issues(
+        self,
+        keys: List[str],
+        fields: Optional[List[str]] = None,
+        expand: Optional[List[str]] = None,
+        chunk_size: int = GET_ISSUES_CHUNK_SIZE,
+    ) -> List[GetIssueResponse]:
+        # results are in the order of keys.
+        found: Dict[str, GetIssueResponse] = {}
+        for responses in await self.__map_concurrently(
+            lambda chunk: self.__search_issues_chunk(chunk, fields, expand),
+            get_issues_search_chunks(keys, chunk_size),
+        ):
+            found.update(responses)
+
+        missing_keys = get_missing_issue_keys(keys, found)
+        add_issue_responses(
+            found,
+            missing_keys,
+            await self.__map_concurrently(
+                lambda key: self.get_issue(key, fields, expand), missing_keys
+            ),
+        )
+
+        return order_issue_responses(keys, found)
+
+    async def __search_issues_chunk(
+        self,
+        keys: List[str],
+        fields: Optional[List[str]],
+        expand: Optional[List[str]],
+    ) -> Dict[str, GetIssueResponse]:
+        # validateQuery=warn keeps one unknown key from failing the whole
+        # search, a failed chunk still falls back to single gets.
+        request = to_issue_keys_search_request(keys, fields, expand)
+        responses: Dict[str, GetIssueResponse] = {}
+        start_at: Optional[int] = 0
+        while start_at is not None:
+            raw_response = await self.__call_get_api(
+                JiraApiRequest(
+                    url=f"{self.__options.url}/rest/api/2/search",
+                    params=to_search_issues_params(request, start_at=start_at),
+                )
+            )
+            responses.update(to_issue_search_responses(raw_response))
+            start_at = get_next_issues_chunk_start_at(start_at, raw_response)
+
+        return responses
+
+    async def create_issue(self, request: CreateIssueRequest) -> CreateIssueResponse:
+        raw_response = await self.__call_post_api(
+            JiraApiRequest(
+                url=f"{self.__options.url}/rest/api/2/issue",
+                body={"fields": request.fields},
+            )
+        )
+
+        return to_create_issue_response(raw_response)
+
+    async def create_issues(
+        self,
+        requests: List[CreateIssueRequest],
+        chunk_size: int = BULK_CREATE_ISSUE_LIMIT,
+        concurrent: bool = False,
+    ) -> List[CreateIssueResponse]:
+        chunk_size = max(1, min(chunk_size, BULK_CREATE_ISSUE_LIMIT))
+        chunks = [
+            requests[i : i + chunk_size] for i in range(0, len(requests), chunk_size)
+        ]
+
+        if concurrent:
+            results = await self.__map_concurrently(self.__create_issues_chunk, chunks)
+        else:
+            results = [await self.__create_issues_chunk(chunk) for chunk in chunks]
+
+        return [response for result in results for response in result]
+
+    async def __create_issues_chunk(
+        self, requests: List[CreateIssueRequest]
+    ) -> List[CreateIssueResponse]:
+        raw_response = await self.__call_post_api(
+            JiraApiRequest(
+                url=f"{self.__options.url}/rest/api/2/issue/bulk",
+                body={
+                    "issueUpdates": [{"fields": request.fields} for request in requests]
+                },
+            )
+        )
+
+        return to_create_issues_responses(raw_response, len(requests))
+
+    async def update_issue(
+        self, request: UpdateIssueRequest, notify_users: bool = True
+    ) -> UpdateIssueResponse:
+        # notify_users=False suppresses the watcher emails, Jira only accepts
+        # it from admins and project admins.
+        fields = get_changed_issue_fields(request)
+        if not fields:
+            return to_update_issue_response(None, request.key, [])
+
+        raw_response = await self.__call_post_api(
+            JiraApiRequest(
+                url=f"{self.__options.url}/rest/api/2/issue/{request.key}",
+                params=None if notify_users else {"notifyUsers": "false"},
+                body={"fields": fields},
+            ),
+            method="PUT",
+        )
+
+        return to_update_issue_response(raw_response, request.key, list(fields))
+
+    async def update_issues(
+        self,
+        requests: List[UpdateIssueRequest],
+        notify_users: bool = True,
+        concurrent: bool = True,
+    ) -> List[UpdateIssueResponse]:
+        # Jira has no bulk edit for arbitrary fields, each issue is one PUT.
+        # At most max_concurrency run at once, rate_limit caps the throughput.
+        if concurrent:
+            return await self.__map_concurrently(
+                lambda request: self.update_issue(request, notify_users), requests
+            )
+        return [await self.update_issue(request, notify_users) for request in requests]
+
+    async def get_issue_transitions(self, key: str) -> GetIssueTransitionsResponse:
+        raw_response = await self.__call_get_api(
+            JiraApiRequest(
+                url=f"{self.__options.url}/rest/api/2/issue/{key}/transitions"
+            )
+        )
+
+        return to_issue_transitions_response(raw_response)
+
+    async def transition_issue(
+        self, key: str, transition_id: str
+    ) -> TransitionIssueResponse:
+        raw_response = await self.__call_post_api(
+            JiraApiRequest(
+                url=f"{self.__options.url}/rest/api/2/issue/{key}/transitions",
+                body={"transition": {"id": transition_id}},
+            )
+        )
+
+        return to_transition_issue_response(raw_response, key, transition_id)
+
+    async def transition_issues(
+        self, keys: List[str], to_status: str
+    ) -> List[TransitionIssueResponse]:
+        # ``to_status`` is a status id or name. Project, issue type and status
+        # of the issues are read with get_issues (one search per 100 keys),
+        # the transitions once per (project, issue type, status), and then
+        # most issues need a single POST instead of GET + POST. The transition
+        # lists go through the metadata cache when it is enabled.
+        distinct_keys = list(dict.fromkeys(keys))
+        issues = await self.get_issues(
+            distinct_keys, fields=["project", "issuetype", "status"]
+        )
+
+        groups = get_transition_groups(distinct_keys, issues, to_status)
+        group_transitions = dict(
+            zip(
+                groups,
+                await self.__map_concurrently(
+                    lambda group: self.__get_group_transitions(group, groups[group]),
+                    list(groups),
+                ),
+            )
+        )
+
+        responses = await self.__map_concurrently(
+            lambda item: self.__transition_issue(
+                item[0], item[1], to_status, group_transitions
+            ),
+            list(zip(distinct_keys, issues)),
+        )
+
+        responses_by_key = dict(zip(distinct_keys, responses))
+        return [responses_by_key[key] for key in keys]
+
+    async def __get_group_transitions(
+        self, group: TransitionGroup, key: str
+    ) -> GetIssueTransitionsResponse:
+        return await self.__cached(
+            ISSUE_TRANSITIONS_ENDPOINT, group, lambda: self.get_issue_transitions(key)
+        )
+
+    async def __transition_issue(
+        self,
+        key: str,
+        issue: GetIssueResponse,
+        to_status: str,
+        group_transitions: Dict[TransitionGroup, GetIssueTransitionsResponse],
+    ) -> TransitionIssueResponse:
+        settled_response = get_settled_transition_response(key, issue, to_status)
+        if settled_response is not None:
+            return settled_response
+
+        tried_response: Optional[TransitionIssueResponse] = None
+        transition = find_group_transition(issue, to_status, group_transitions)
+        if transition is not None:
+            tried_response = await self.transition_issue(key, transition.id)
+            if tried_response.status_code != 400:
+                return tried_response
+
+        own_transition = resolve_own_transition(
+            key, to_status, await self.get_issue_transitions(key), tried_response
+        )
+        if isinstance(own_transition, TransitionIssueResponse):
+            return own_transition
+        return await self.transition_issue(key, own_transition.id)
+
+    async def add_attachment(
+        self, request: AddAttachmentRequest, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ) -> AddAttachmentResponse:
+        # the file is streamed as multipart/form-data in chunks of chunk_size,
+        # it is never read into memory as a whole. Uploads are not retried.
+        try:
+            with open_attachment_source(request.file, request.filename) as (
+                file,
+                filename,
+            ):
+                body = MultipartFileStream(
+                    file, filename, request.content_type, chunk_size
+                )
+                headers = {"Content-Type": body.content_type}
+                if body.len is not None:
+                    headers["Content-Length"] = str(body.len)
+
+                raw_response = await self.__call_post_api(
+                    JiraApiRequest(
+                        url=f"{self.__options.url}/rest/api/2/issue/{request.issue_key}/attachments",  # pylint: disable=line-too-long
+                        headers=headers,
+                    ),
+                    # an AsyncClient only sends async iterable bodies.
+                    data=aiter(body),
+                )
+        except OSError as e:
+            raw_response = JiraApiResponse()
+            raw_response.error_text = str(e)
+
+        return to_add_attachment_response(raw_response, request.issue_key)
+
+    async def add_attachments(
+        self,
+        requests: List[AddAttachmentRequest],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        concurrent: bool = True,
+    ) -> List[AddAttachmentResponse]:
+        # at most max_concurrency uploads run at once, each holds one chunk.
+        if concurrent:
+            return await self.__map_concurrently(
+                lambda request: self.add_attachment(request, chunk_size), requests
+            )
+        return [await self.add_attachment(request, chunk_size) for request in requests]
+
+    async def download_attachment(
+        self,
+        attachment_id: str,
+        target: AttachmentTarget,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> DownloadAttachmentResponse:
+        # writes the content to a path or binary file object chunk by chunk.
+        # start and end (inclusive) request a byte range, a path target is
+        # only created once the response succeeded.
+        range_header = to_range_header(start, end)
+        api_response = JiraApiResponse()
+        response = None
+        size = 0
+
+        try:
+            response = await self.__send(
+                "GET",
+                JiraApiRequest(
+                    url=f"{self.__options.url}/rest/api/2/attachment/content/{attachment_id}",  # pylint: disable=line-too-long
+                    headers={"Range": range_header} if range_header else None,
+                ),
+                stream=True,
+            )
+
+            api_response.status_code = response.status_code
+            api_response.status_reason = response.reason
+            api_response.headers = response.headers
+            if not api_response.is_success_response():
+                await response.aread()
+                api_response.error_text = response.text
+            else:
+                range_slice = RangeSlice(response.status_code, start, end)
+                with open_attachment_target(target) as file:
+                    async for chunk in response.aiter_content(chunk_size):
+                        data = range_slice.apply(chunk)
+                        if data:
+                            file.write(data)
+                            size += len(data)
+                        if range_slice.is_done:
+                            break
+        except Exception as e:
+            api_response.error_text = str(e)
+        finally:
+            if response is not None:
+                await response.aclose()
+
+        return to_download_attachment_response(api_response, attachment_id, size)
@@ -0,0 +1,181 @@
+import io
+import os
+from contextlib import contextmanager
+from mimetypes import guess_type
+from typing import IO, Any, AsyncIterator, Iterator, Optional, Protocol, Tuple, Union
+from uuid import uuid4
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+class BinaryWriter(Protocol):
+    def write(self, data: bytes, /) -> Any: ...
+
+
+# a path or a binary file object opened by the caller, any object with a
+# write(bytes) method can be a download target.
+AttachmentSource = Union[str, "os.PathLike[str]", IO[bytes]]
+AttachmentTarget = Union[str, "os.PathLike[str]", BinaryWriter]
+
+
+def _get_remaining_size(file: IO[bytes]) -> Optional[int]:
+    # bytes left from the current position, None for pipes and sockets, the
+    # body is then sent chunked.
+    try:
+        return os.fstat(file.fileno()).st_size - file.tell()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        pass
+    try:
+        if not file.seekable():
+            return None
+        position = file.tell()
+        end = file.seek(0, os.SEEK_END)
+        file.seek(position)
+        return end - position
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+
+
+class MultipartFileStream:
+    # multipart/form-data body with a single "file" part, as expected by
+    # POST /issue/{key}/attachments. The file is read chunk by chunk while the
+    # body is sent, it is never held in memory as a whole. requests reads it
+    # through read() and len, httpx iterates it.
+
+    def __init__(
+        self,
+        file: IO[bytes],
+        filename: str,
+        content_type: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        boundary = uuid4().hex
+        quoted_filename = filename.replace("\\", "\\\\").replace('"', '\\"')
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        self.chunk_size = max(1, chunk_size)
+        self.__file = file
+        part_type = (
+            content_type or guess_type(filename)[0] or "application/octet-stream"
+        )
+        disposition = f'form-data; name="file"; filename="{quoted_filename}"'
+        self.__head = (
+            f"--{boundary}\r\n"
+            f"Content-Disposition: {disposition}\r\n"
+            f"Content-Type: {part_type}\r\n\r\n"
+        ).encode("utf-8")
+        self.__tail = f"\r\n--{boundary}--\r\n".encode("utf-8")
+
+        size = _get_remaining_size(file)
+        # read by requests to set Content-Length, None sends the body chunked.
+        self.len: Optional[int] = (
+            len(self.__head) + size + len(self.__tail) if size is not None else None
+        )
+        self.__chunks = self.__iter_chunks()
+        self.__chunk = b""
+        self.__offset = 0
+
+    def __iter_chunks(self) -> Iterator[bytes]:
+        yield self.__head
+        while True:
+            chunk = self.__file.read(self.chunk_size)
+            if not chunk:
+                break
+            yield chunk
+        yield self.__tail
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        if size is None or size < 0:
+            data = self.__chunk[self.__offset :] + b"".join(self.__chunks)
+            self.__chunk = b""
+            self.__offset = 0
+            return data
+
+        while self.__offset >= len(self.__chunk):
+            chunk = next(self.__chunks, None)
+            if chunk is None:
+                return b""
+            self.__chunk = chunk
+            self.__offset = 0
+
+        # a short read is fine, callers read until an empty result.
+        data = self.__chunk[self.__offset : self.__offset + size]
+        self.__offset += len(data)
+        return data
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            data = self.read(self.chunk_size)
+            if not data:
+                return
+            yield data
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        # local file reads of one chunk are short, they are not moved off the
+        # event loop.
+        for data in self:
+            yield data
+
+
+@contextmanager
+def open_attachment_source(
+    file: AttachmentSource, filename: Optional[str] = None
+) -> Iterator[Tuple[IO[bytes], str]]:
+    # paths are opened (and closed) here, file objects are used as they are.
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "rb") as opened_file:
+            yield opened_file, filename or os.path.basename(os.fspath(file))
+    else:
+        name = getattr(file, "name", None)
+        yield file, filename or (
+            os.path.basename(name) if isinstance(name, str) else "attachment"
+        )
+
+
+@contextmanager
+def open_attachment_target(target: AttachmentTarget) -> Iterator[BinaryWriter]:
+    if isinstance(target, (str, os.PathLike)):
+        with open(target, "wb") as opened_file:
+            yield opened_file
+    else:
+        yield target
+
+
+def to_range_header(start: Optional[int], end: Optional[int]) -> Optional[str]:
+    # ``end`` is inclusive like the HTTP Range header.
+    if start is None and end is None:
+        return None
+    if start is None:
+        # the first end + 1 bytes, a bare "-n" would be the last n bytes.
+        return f"bytes=0-{end}"
+    return f"bytes={start}-{'' if end is None else end}"
+
+
+class RangeSlice:
+    # applies a requested range to the full 200 response of a server which
+    # ignored the Range header, a 206 response is passed through.
+
+    def __init__(
+        self, status_code: int, start: Optional[int], end: Optional[int]
+    ) -> None:
+        if status_code == 206 or (start is None and end is None):
+            self.__skip = 0
+            self.__limit: Optional[int] = None
+        else:
+            self.__skip = start or 0
+            self.__limit = None if end is None else max(0, end + 1 - self.__skip)
+
+    @property
+    def is_done(self) -> bool:
+        return self.__limit is not None and self.__limit <= 0
+
+    def apply(self, chunk: bytes) -> bytes:
+        if self.__skip:
+            if self.__skip >= len(chunk):
+                self.__skip -= len(chunk)
+                return b""
+            chunk = chunk[self.__skip :]
+            self.__skip = 0
+        if self.__limit is not None:
+            chunk = chunk[: self.__limit]
+            self.__limit -= len(chunk)
+        return chunk
@@ -0,0 +1,254 @@
+import os
+import pickle
+from collections import OrderedDict
+from hashlib import sha256
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from time import monotonic, time
+from typing import Any, Dict, Hashable, Mapping, Optional, Tuple
+
+FIELDS_ENDPOINT = "fields"
+PROJECTS_ENDPOINT = "projects"
+PROJECT_DETAIL_ENDPOINT = "project_detail"
+PROJECT_ISSUE_TYPES_ENDPOINT = "project_issue_types"
+PROJECT_ISSUE_FIELDS_ENDPOINT = "project_issue_fields"
+# keyed by (project id, issue type id, status id), the transitions out of a
+# status are the same for every issue of a workflow.
+ISSUE_TRANSITIONS_ENDPOINT = "issue_transitions"
+
+VALIDATORS_ENDPOINT = "validators"
+
+_DEFAULT_CACHE_TTL = 300.0
+_DEFAULT_CACHE_MAX_SIZE = 256
+# bump when the pickled models change shape, old files are then ignored.
+_DISK_CACHE_FORMAT_VERSION = 4
+
+
+class MetadataCache:
+    def __init__(
+        self,
+        max_size: int = _DEFAULT_CACHE_MAX_SIZE,
+        default_ttl: float = _DEFAULT_CACHE_TTL,
+        ttls: Optional[Dict[str, float]] = None,
+    ) -> None:
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        self.ttls: Dict[str, float] = dict(ttls) if ttls else {}
+        self.hits = 0
+        self.misses = 0
+        self.__entries: "OrderedDict[Tuple[str, Hashable], Tuple[float, Any]]" = (
+            OrderedDict()
+        )
+        self.__lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(self, endpoint: str, key: Hashable = None) -> Optional[Any]:
+        with self.__lock:
+            entry = self.__entries.get((endpoint, key), None)
+            if entry is None or entry[0] <= monotonic():
+                if entry is not None:
+                    del self.__entries[(endpoint, key)]
+                self.misses += 1
+                return None
+
+            self.__entries.move_to_end((endpoint, key))
+            self.hits += 1
+            return entry[1]
+
+    def put(self, endpoint: str, key: Hashable, value: Any) -> None:
+        ttl = self.ttls.get(endpoint, self.default_ttl)
+        if ttl <= 0 or self.max_size <= 0:
+            return
+
+        with self.__lock:
+            self.__entries[(endpoint, key)] = (monotonic() + ttl, value)
+            self.__entries.move_to_end((endpoint, key))
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+
+    def invalidate(self, endpoint: Optional[str] = None, key: Hashable = None) -> None:
+        with self.__lock:
+            if endpoint is None:
+                self.__entries.clear()
+            elif key is None:
+                for entry_key in [k for k in self.__entries if k[0] == endpoint]:
+                    del self.__entries[entry_key]
+            else:
+                self.__entries.pop((endpoint, key), None)
+
+    def clear(self) -> None:
+        self.invalidate()
+        self.hits = 0
+        self.misses = 0
+
+
+def get_token_digest(access_token: str) -> str:
+    # credentials are only ever kept as a digest in cache keys and paths.
+    return sha256(access_token.encode("utf-8")).hexdigest()
+
+
+class DiskMetadataCache:
+    # one pickle file per entry under a directory per Jira base URL and
+    # credential, so a process only loads the entries it asks for. Projects
+    # and createmeta are filtered by permissions, two users of one site must
+    # not share entries. Only point this at a directory that is private to
+    # the user, pickle files are trusted.
+
+    def __init__(
+        self,
+        directory: str,
+        url: str,
+        default_ttl: float = _DEFAULT_CACHE_TTL,
+        ttls: Optional[Dict[str, float]] = None,
+        user_email: Optional[str] = None,
+        access_token: str = "",
+    ) -> None:
+        self.default_ttl = default_ttl
+        self.ttls: Dict[str, float] = dict(ttls) if ttls else {}
+        self.hits = 0
+        self.misses = 0
+        identity = "\n".join(
+            [url.rstrip("/").lower(), user_email or "", get_token_digest(access_token)]
+        )
+        self.directory = os.path.join(
+            os.path.expanduser(directory),
+            f"v{_DISK_CACHE_FORMAT_VERSION}",
+            sha256(identity.encode("utf-8")).hexdigest()[:32],
+        )
+
+    def __get_path(self, endpoint: str, key: Hashable) -> str:
+        key_hash = sha256(repr(key).encode("utf-8")).hexdigest()[:32]
+        return os.path.join(self.directory, f"{endpoint}-{key_hash}.pickle")
+
+    def get(
+        self, endpoint: str, key: Hashable = None, check_ttl: bool = True
+    ) -> Optional[Any]:
+        path = self.__get_path(endpoint, key)
+        try:
+            with open(path, "rb") as file:
+                stored_at, stored_key, value = pickle.load(file)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except Exception:
+            # a corrupted or incompatible file is just a miss.
+            self.__remove(path)
+            self.misses += 1
+            return None
+
+        ttl = self.ttls.get(endpoint, self.default_ttl)
+        if stored_key != key or (check_ttl and stored_at + ttl <= time()):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return value
+
+    def put(self, endpoint: str, key: Hashable, value: Any) -> None:
+        path = self.__get_path(endpoint, key)
+        try:
+            os.makedirs(self.directory, mode=0o700, exist_ok=True)
+            with NamedTemporaryFile(
+                "wb", dir=self.directory, suffix=".tmp", delete=False
+            ) as file:
+                pickle.dump((time(), key, value), file, pickle.HIGHEST_PROTOCOL)
+            # replace atomically so readers never see a partial file.
+            os.replace(file.name, path)
+        except Exception:
+            # the disk cache is best effort, never fail the API call.
+            pass
+
+    def invalidate(self, endpoint: Optional[str] = None, key: Hashable = None) -> None:
+        if endpoint is not None and key is not None:
+            self.__remove(self.__get_path(endpoint, key))
+            return
+
+        if not os.path.isdir(self.directory):
+            return
+        for name in os.listdir(self.directory):
+            if endpoint is None or name.startswith(f"{endpoint}-"):
+                self.__remove(os.path.join(self.directory, name))
+
+    @staticmethod
+    def __remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+class ConditionalRequestCache:
+    # remembers the ETag / Last-Modified validators of a response together
+    # with the parsed result, so a 304 can be answered without parsing.
+
+    def __init__(
+        self,
+        max_size: int = _DEFAULT_CACHE_MAX_SIZE,
+        disk_cache: Optional[DiskMetadataCache] = None,
+    ) -> None:
+        self.max_size = max_size
+        self.not_modified = 0
+        # validators are kept on disk as well, so a new process can still
+        # revalidate with a 304 after the TTLs expired.
+        self.disk_cache = disk_cache
+        self.__entries: "OrderedDict[Hashable, Tuple[Dict[str, str], Any]]" = (
+            OrderedDict()
+        )
+        self.__lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get_request_headers(self, key: Hashable) -> Optional[Dict[str, str]]:
+        with self.__lock:
+            entry = self.__entries.get(key, None)
+        if entry is None and self.disk_cache is not None:
+            entry = self.disk_cache.get(VALIDATORS_ENDPOINT, key, check_ttl=False)
+            if entry is not None:
+                self.__put_entry(key, entry)
+        return dict(entry[0]) if entry is not None else None
+
+    def get_not_modified(self, key: Hashable) -> Optional[Any]:
+        with self.__lock:
+            entry = self.__entries.get(key, None)
+            if entry is not None:
+                self.__entries.move_to_end(key)
+        if entry is None and self.disk_cache is not None:
+            entry = self.disk_cache.get(VALIDATORS_ENDPOINT, key, check_ttl=False)
+        if entry is None:
+            return None
+
+        self.not_modified += 1
+        return entry[1]
+
+    def put(
+        self, key: Hashable, response_headers: Mapping[str, str], value: Any
+    ) -> None:
+        request_headers = {}
+        if response_headers.get("ETag", None):
+            request_headers["If-None-Match"] = response_headers["ETag"]
+        if response_headers.get("Last-Modified", None):
+            request_headers["If-Modified-Since"] = response_headers["Last-Modified"]
+        if not request_headers:
+            return
+
+        self.__put_entry(key, (request_headers, value))
+        if self.disk_cache is not None:
+            self.disk_cache.put(VALIDATORS_ENDPOINT, key, (request_headers, value))
+
+    def __put_entry(self, key: Hashable, entry: Tuple[Dict[str, str], Any]) -> None:
+        if self.max_size <= 0:
+            return
+
+        with self.__lock:
+            self.__entries[key] = entry
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+            self.not_modified = 0
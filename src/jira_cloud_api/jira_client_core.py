@@ -0,0 +1,361 @@
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Hashable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from jira_cloud_api.jira_cache import (
+    VALIDATORS_ENDPOINT,
+    ConditionalRequestCache,
+    DiskMetadataCache,
+    MetadataCache,
+)
+from jira_cloud_api.jira_converters import (
+    create_transition_issue_response,
+    find_transition,
+    get_issue_lookup_key,
+    get_issue_search_chunks,
+    get_remaining_page_start_ats,
+    get_transition_group,
+    is_issue_in_status,
+    to_search_issues_params,
+    to_transition_issue_response,
+)
+from jira_cloud_api.jira_models import JiraTransition
+from jira_cloud_api.jira_request import SearchIssuesRequest
+from jira_cloud_api.jira_response import (
+    BaseResponse,
+    GetIssueResponse,
+    GetIssueTransitionsResponse,
+    GetProjectIssueFieldsResponse,
+    GetProjectIssueTypesResponse,
+    TransitionIssueResponse,
+)
+from jira_cloud_api.jira_retry import TokenBucket
+
+if TYPE_CHECKING:
+    from jira_cloud_api.jira_api import (
+        JiraApiOptions,
+        JiraApiRequest,
+        JiraApiResponse,
+    )
+
+# everything here is shared by JiraApi and AsyncJiraApi, the clients only
+# send the requests, blocking or awaited.
+
+BULK_CREATE_ISSUE_LIMIT = 50
+# keys folded into one key in (...) search, also the max page size of search.
+GET_ISSUES_CHUNK_SIZE = 100
+
+TransitionGroup = Tuple[str, str, str]
+
+
+def create_rate_limiter(options: "JiraApiOptions") -> Optional[TokenBucket]:
+    return (
+        TokenBucket(options.rate_limit, options.rate_limit_burst)
+        if options.rate_limit
+        else None
+    )
+
+
+def set_call_error(api_response: "JiraApiResponse", error: Exception) -> None:
+    # a body which could not be read or decoded fails the call, the default
+    # {} content of a 2xx would be taken (and cached) as an empty result.
+    if api_response.is_success_response():
+        api_response.status_code = 0
+        api_response.content = {}
+    if api_response.error_text is None:
+        api_response.error_text = str(error)
+
+
+class ClientCaches:
+    # the metadata cache, its disk copy and the conditional request validators
+    # of one client.
+
+    def __init__(self, options: "JiraApiOptions") -> None:
+        self.cache = (
+            MetadataCache(
+                max_size=options.cache_max_size,
+                default_ttl=options.cache_ttl,
+                ttls=options.cache_ttls,
+            )
+            if options.cache_enabled
+            else None
+        )
+        self.disk_cache = (
+            DiskMetadataCache(
+                directory=options.disk_cache_dir,
+                url=options.url,
+                default_ttl=options.cache_ttl,
+                ttls=options.cache_ttls,
+                user_email=options.user_email,
+                access_token=options.access_token,
+            )
+            if options.disk_cache_dir
+            else None
+        )
+        self.validators = (
+            ConditionalRequestCache(
+                max_size=options.cache_max_size, disk_cache=self.disk_cache
+            )
+            if options.conditional_requests
+            else None
+        )
+
+    @property
+    def is_enabled(self) -> bool:
+        return self.cache is not None or self.disk_cache is not None
+
+    def get(self, endpoint: str, key: Hashable) -> Optional[Any]:
+        # cached responses are shared between callers, treat them as read-only.
+        cached = self.cache.get(endpoint, key) if self.cache is not None else None
+        if cached is None and self.disk_cache is not None:
+            cached = self.disk_cache.get(endpoint, key)
+            if cached is not None and self.cache is not None:
+                self.cache.put(endpoint, key, cached)
+        return cached
+
+    def put(self, endpoint: str, key: Hashable, response: BaseResponse) -> None:
+        # successful converters leave error_text unset.
+        if response.status_code != 200 or getattr(response, "error_text", None):
+            return
+        if self.cache is not None:
+            self.cache.put(endpoint, key, response)
+        if self.disk_cache is not None:
+            self.disk_cache.put(endpoint, key, response)
+
+    def invalidate(self, endpoint: Optional[str] = None, key: Hashable = None) -> None:
+        # memory, disk and validators together, an entry dropped from memory
+        # alone comes back from the disk copy (or a 304) on the next call.
+        if self.cache is not None:
+            self.cache.invalidate(endpoint, key)
+        if self.disk_cache is not None:
+            self.disk_cache.invalidate(endpoint, key)
+        if self.validators is not None:
+            # validators are keyed by URL and params, not by endpoint.
+            self.validators.clear()
+            if self.disk_cache is not None:
+                self.disk_cache.invalidate(VALIDATORS_ENDPOINT)
+
+    def add_validator_headers(self, request: "JiraApiRequest") -> Optional[Hashable]:
+        # returns the validator key of the request, None without validators.
+        if self.validators is None:
+            return None
+
+        key = (request.url, tuple(sorted((request.params or {}).items())))
+        validator_headers = self.validators.get_request_headers(key)
+        if validator_headers:
+            request.headers = {**(request.headers or {}), **validator_headers}
+        return key
+
+    def get_not_modified(
+        self, key: Optional[Hashable], raw_response: "JiraApiResponse"
+    ) -> Optional[Any]:
+        if self.validators is None or raw_response.status_code != 304:
+            return None
+        return self.validators.get_not_modified(key)
+
+    def put_validated(
+        self,
+        key: Optional[Hashable],
+        raw_response: "JiraApiResponse",
+        response: BaseResponse,
+    ) -> None:
+        if (
+            self.validators is not None
+            and response.status_code == 200
+            and not getattr(response, "error_text", None)
+        ):
+            self.validators.put(key, raw_response.headers, response)
+
+
+def get_query_all_start_ats(
+    start_at: int,
+    max_results: int,
+    query_all: bool,
+    first_page: Union[GetProjectIssueTypesResponse, GetProjectIssueFieldsResponse],
+) -> List[int]:
+    # the pages after the first one, requested concurrently by query_all.
+    if not query_all or first_page.status_code != 200:
+        return []
+    return get_remaining_page_start_ats(
+        start_at, first_page.max_results or max_results, first_page.total
+    )
+
+
+def get_next_page_start_at(
+    start_at: int,
+    max_results: int,
+    page: Union[GetProjectIssueTypesResponse, GetProjectIssueFieldsResponse],
+    item_count: int,
+) -> Optional[int]:
+    # None once the last page was read.
+    start_at += page.max_results or max_results
+    if not item_count or start_at >= page.total:
+        return None
+    return start_at
+
+
+def get_next_search_start_at(
+    start_at: int, content: Mapping[str, Any], issue_count: int
+) -> Optional[int]:
+    start_at += issue_count
+    if not issue_count or start_at >= content.get("total", 0):
+        return None
+    return start_at
+
+
+def get_next_search_page_token(content: Mapping[str, Any]) -> Optional[str]:
+    next_page_token: Optional[str] = content.get("nextPageToken", None)
+    if not next_page_token or content.get("isLast", False):
+        return None
+    return next_page_token
+
+
+class SearchIssuesPages:
+    # the pages of search_issues, by startAt offsets or by nextPageToken with
+    # token_paginated, both clients read them with the same loop.
+
+    def __init__(self, request: SearchIssuesRequest) -> None:
+        self.__request = request
+        self.__start_at = request.start_at
+        self.__next_page_token: Optional[str] = None
+
+    @property
+    def path(self) -> str:
+        if self.__request.token_paginated:
+            return "/rest/api/2/search/jql"
+        return "/rest/api/2/search"
+
+    @property
+    def params(self) -> Dict[str, Any]:
+        if self.__request.token_paginated:
+            return to_search_issues_params(
+                self.__request, next_page_token=self.__next_page_token
+            )
+        return to_search_issues_params(self.__request, start_at=self.__start_at)
+
+    def advance(self, content: Mapping[str, Any], issue_count: int) -> bool:
+        # False once the last page was read.
+        if self.__request.token_paginated:
+            self.__next_page_token = get_next_search_page_token(content)
+            return self.__next_page_token is not None
+
+        start_at = get_next_search_start_at(self.__start_at, content, issue_count)
+        if start_at is None:
+            return False
+        self.__start_at = start_at
+        return True
+
+
+def get_next_issues_chunk_start_at(
+    start_at: int, raw_response: "JiraApiResponse"
+) -> Optional[int]:
+    # a key in (...) search is paged as well, Jira may cap maxResults below the
+    # chunk size (lower still for some fields and expands).
+    if not raw_response.is_success_response():
+        return None
+    return get_next_search_start_at(
+        start_at, raw_response.content, len(raw_response.content.get("issues", []))
+    )
+
+
+def get_issues_search_chunks(keys: List[str], chunk_size: int) -> List[List[str]]:
+    # keys are folded into key in (...) searches, one request per chunk
+    # instead of one per key, a single key is fetched on its own.
+    chunk_size = max(1, min(chunk_size, GET_ISSUES_CHUNK_SIZE))
+    return get_issue_search_chunks(keys, chunk_size) if len(set(keys)) > 1 else []
+
+
+def get_missing_issue_keys(
+    keys: List[str], found: Dict[str, GetIssueResponse]
+) -> List[str]:
+    # keys the searches did not return (unknown, moved or a failed chunk) are
+    # fetched one by one, so every key gets its own response or error.
+    return [
+        key for key in dict.fromkeys(keys) if get_issue_lookup_key(key) not in found
+    ]
+
+
+def add_issue_responses(
+    found: Dict[str, GetIssueResponse],
+    keys: List[str],
+    responses: List[GetIssueResponse],
+) -> None:
+    for key, response in zip(keys, responses):
+        found[get_issue_lookup_key(key)] = response
+
+
+def order_issue_responses(
+    keys: List[str], found: Dict[str, GetIssueResponse]
+) -> List[GetIssueResponse]:
+    return [found[get_issue_lookup_key(key)] for key in keys]
+
+
+def get_transition_groups(
+    keys: List[str], issues: List[GetIssueResponse], to_status: str
+) -> Dict[TransitionGroup, str]:
+    # one issue per (project, issue type, status), its transitions are read
+    # for every issue of the group.
+    groups: Dict[TransitionGroup, str] = {}
+    for key, issue in zip(keys, issues):
+        if issue.status_code == 200 and not is_issue_in_status(issue, to_status):
+            groups.setdefault(get_transition_group(issue), key)
+    return groups
+
+
+def get_settled_transition_response(
+    key: str, issue: GetIssueResponse, to_status: str
+) -> Optional[TransitionIssueResponse]:
+    # the outcome of issues which need no transition request, None otherwise.
+    if issue.status_code != 200:
+        return create_transition_issue_response(
+            key, issue.status_code, issue.status_reason, issue.error_text
+        )
+    if is_issue_in_status(issue, to_status):
+        return to_transition_issue_response(None, key, None)
+    return None
+
+
+def find_group_transition(
+    issue: GetIssueResponse,
+    to_status: str,
+    group_transitions: Dict[TransitionGroup, GetIssueTransitionsResponse],
+) -> Optional[JiraTransition]:
+    transitions = group_transitions[get_transition_group(issue)]
+    if transitions.status_code != 200:
+        return None
+    return find_transition(transitions.transitions, to_status)
+
+
+def resolve_own_transition(
+    key: str,
+    to_status: str,
+    transitions: GetIssueTransitionsResponse,
+    tried_response: Optional[TransitionIssueResponse],
+) -> Union[TransitionIssueResponse, JiraTransition]:
+    # the shared transitions did not apply to this issue, e.g. a workflow
+    # condition hides one. Returns the transition of the issue to send, or
+    # the outcome when there is nothing (new) to send.
+    if transitions.status_code != 200:
+        return create_transition_issue_response(
+            key,
+            transitions.status_code,
+            transitions.status_reason,
+            transitions.error_text,
+        )
+
+    own_transition = find_transition(transitions.transitions, to_status)
+    if own_transition is None:
+        return tried_response or create_transition_issue_response(
+            key, 0, None, f"No transition of {key} leads to {to_status}."
+        )
+    if tried_response is not None and tried_response.transition_id == own_transition.id:
+        return tried_response
+    return own_transition
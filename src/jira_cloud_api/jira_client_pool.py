@@ -0,0 +1,205 @@
+from collections import OrderedDict
+from threading import BoundedSemaphore, Lock
+from time import monotonic
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from jira_cloud_api.jira_api import JiraApi, JiraApiOptions
+from jira_cloud_api.jira_cache import get_token_digest
+from jira_cloud_api.jira_transport import (
+    HttpxTransport,
+    JiraTransport,
+    JiraTransportResponse,
+    RequestsTransport,
+)
+
+_DEFAULT_MAX_CLIENTS = 1024
+# a shared transport talks to many sites, keep a connection pool per site for
+# more of them than a single client would.
+_DEFAULT_POOL_CONNECTIONS = 100
+_DEFAULT_POOL_MAXSIZE = 10
+
+# (url, user email, token digest)
+_ClientKey = Tuple[str, Optional[str], str]
+# (http2, ssl_verify, keep_alive)
+_TransportKey = Tuple[bool, bool, bool]
+
+
+class _LimitedTransport:
+    # holds a slot of the pool wide semaphore while a request is in flight,
+    # the slot is released before retry and rate limit sleeps.
+
+    def __init__(self, transport: JiraTransport, semaphore: BoundedSemaphore) -> None:
+        self.__transport = transport
+        self.__semaphore = semaphore
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        auth: Optional[Tuple[str, str]] = None,
+        timeout: Optional[float] = None,
+        data: Optional[Any] = None,
+        stream: bool = False,
+    ) -> JiraTransportResponse:
+        # a streamed response releases its slot once the headers arrived.
+        with self.__semaphore:
+            return self.__transport.request(
+                method=method,
+                url=url,
+                params=params,
+                json=json,
+                headers=headers,
+                auth=auth,
+                timeout=timeout,
+                data=data,
+                stream=stream,
+            )
+
+    def close(self) -> None:
+        self.__transport.close()
+
+
+def _get_client_key(options: JiraApiOptions) -> _ClientKey:
+    # only a digest of the token is kept in the key.
+    return (
+        options.url.rstrip("/").lower(),
+        options.user_email,
+        get_token_digest(options.access_token),
+    )
+
+
+class JiraClientPool:
+    # one JiraApi per site and credential for multi-tenant services. Clients
+    # with the same transport settings share one transport (and with it the
+    # keep-alive connection pools), idle clients are evicted least recently
+    # used first and ``max_concurrency`` caps the requests in flight across
+    # all tenants. The options of the first ``get`` for a key are used until
+    # the client is evicted or removed.
+
+    def __init__(
+        self,
+        max_clients: int = _DEFAULT_MAX_CLIENTS,
+        idle_timeout: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+        pool_connections: int = _DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = _DEFAULT_POOL_MAXSIZE,
+    ) -> None:
+        if max_clients < 1:
+            raise ValueError("Max clients must be at least 1.")
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("Max concurrency must be at least 1.")
+        if idle_timeout is not None and idle_timeout <= 0:
+            raise ValueError("Idle timeout must be greater than 0.")
+
+        self.max_clients = max_clients
+        self.idle_timeout = idle_timeout
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.__semaphore = (
+            BoundedSemaphore(max_concurrency) if max_concurrency is not None else None
+        )
+        self.__lock = Lock()
+        # key -> (client, last used), least recently used first.
+        self.__clients: "OrderedDict[_ClientKey, Tuple[JiraApi, float]]" = OrderedDict()
+        self.__transports: Dict[_TransportKey, JiraTransport] = {}
+
+    def __enter__(self) -> "JiraClientPool":
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.__clients)
+
+    def __iter__(self) -> Iterator[JiraApi]:
+        with self.__lock:
+            return iter([client for client, _ in self.__clients.values()])
+
+    def __contains__(self, options: object) -> bool:
+        return (
+            isinstance(options, JiraApiOptions)
+            and _get_client_key(options) in self.__clients
+        )
+
+    def get(self, options: JiraApiOptions) -> JiraApi:
+        key = _get_client_key(options)
+        now = monotonic()
+        with self.__lock:
+            entry = self.__clients.get(key, None)
+            if entry is not None:
+                self.__clients[key] = (entry[0], now)
+                self.__clients.move_to_end(key)
+                return entry[0]
+
+            client = JiraApi(options, transport=self.__get_transport(options))
+            self.__clients[key] = (client, now)
+            evicted = self.__pop_evictable(now)
+
+        for evicted_client in evicted:
+            evicted_client.close()
+        return client
+
+    def remove(self, options: JiraApiOptions) -> None:
+        with self.__lock:
+            entry = self.__clients.pop(_get_client_key(options), None)
+        if entry is not None:
+            entry[0].close()
+
+    def evict_idle(self) -> int:
+        # closes the clients idle for longer than ``idle_timeout`` and returns
+        # how many were evicted.
+        with self.__lock:
+            evicted = self.__pop_evictable(monotonic())
+        for client in evicted:
+            client.close()
+        return len(evicted)
+
+    def close(self) -> None:
+        with self.__lock:
+            clients = [client for client, _ in self.__clients.values()]
+            transports = list(self.__transports.values())
+            self.__clients.clear()
+            self.__transports.clear()
+        for client in clients:
+            client.close()
+        for transport in transports:
+            transport.close()
+
+    def __pop_evictable(self, now: float) -> List[JiraApi]:
+        evicted = []
+        while len(self.__clients) > self.max_clients:
+            _, (client, _) = self.__clients.popitem(last=False)
+            evicted.append(client)
+
+        if self.idle_timeout is not None:
+            # the dict is in last used order, stop at the first recent client.
+            for key, (client, last_used) in list(self.__clients.items()):
+                if now - last_used < self.idle_timeout:
+                    break
+                del self.__clients[key]
+                evicted.append(client)
+        return evicted
+
+    def __get_transport(self, options: JiraApiOptions) -> JiraTransport:
+        key = (options.http2, options.ssl_verify, options.keep_alive)
+        transport = self.__transports.get(key, None)
+        if transport is None:
+            transport_type = HttpxTransport if options.http2 else RequestsTransport
+            # no Authorization header here, each client sends its own. Only
+            # the connection pools are shared, cookies are not kept at all.
+            transport = transport_type(
+                headers=JiraApi.default_request_headers,
+                pool_connections=self.pool_connections,
+                pool_maxsize=self.pool_maxsize,
+                keep_alive=options.keep_alive,
+                ssl_verify=options.ssl_verify,
+                persist_cookies=False,
+            )
+            if self.__semaphore is not None:
+                transport = _LimitedTransport(transport, self.__semaphore)
+            self.__transports[key] = transport
+        return transport
@@ -0,0 +1,795 @@
+from copy import copy
+from functools import lru_cache
+from json import JSONDecodeError, dumps, loads
+from re import compile as compile_regex
+from sys import intern
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from jira_cloud_api.jira_datetime import parse_jira_datetime
+from jira_cloud_api.jira_models import (
+    JiraAllowedValue,
+    JiraAttachment,
+    JiraField,
+    JiraFieldSchema,
+    JiraIssue,
+    JiraIssueType,
+    JiraProject,
+    JiraProjectCategory,
+    JiraProjectDetail,
+    JiraProjectField,
+    JiraTransition,
+)
+from jira_cloud_api.jira_request import SearchIssuesRequest, UpdateIssueRequest
+from jira_cloud_api.jira_response import (
+    AddAttachmentResponse,
+    CreateIssueResponse,
+    DownloadAttachmentResponse,
+    GetFieldsResponse,
+    GetIssueResponse,
+    GetIssueTransitionsResponse,
+    GetMySelfResponse,
+    GetProjectDetailResponse,
+    GetProjectIssueFieldsResponse,
+    GetProjectIssueTypesResponse,
+    GetProjectsResponse,
+    GetServerInfoResponse,
+    TransitionIssueResponse,
+    UpdateIssueResponse,
+)
+
+if TYPE_CHECKING:
+    from jira_cloud_api.jira_api import JiraApiResponse
+
+# issue keys, e.g. SAND-1, and issue ids can be folded into a key in (...) JQL,
+# anything else is fetched on its own and gets Jira's error for it.
+_ISSUE_KEY_OR_ID = compile_regex(r"^(?:[A-Za-z][A-Za-z0-9_]*-\d+|\d+)$")
+
+
+def _intern(value: Any) -> str:
+    # ids, types and names repeat across projects and fields, keep a single
+    # copy of each string in long-running processes.
+    return intern(str(value))
+
+
+@lru_cache(maxsize=4096)
+def get_field_schema(
+    type_: str, items: str, system: str, custom: str, custom_id: str
+) -> JiraFieldSchema:
+    return JiraFieldSchema(
+        type=_intern(type_),
+        items=_intern(items),
+        system=_intern(system),
+        custom=_intern(custom),
+        custom_id=_intern(custom_id),
+    )
+
+
+def convert_to_field_schema(raw_data: Dict[str, Any]) -> Optional[JiraFieldSchema]:
+    if not raw_data.get("schema", None):
+        return None
+
+    schema = raw_data["schema"]
+    return get_field_schema(
+        str(schema.get("type", "")),
+        str(schema.get("items", "")),
+        str(schema.get("system", "")),
+        str(schema.get("custom", "")),
+        str(schema.get("customId", "")),
+    )
+
+
+def convert_to_project(raw_data: Dict[str, Any]) -> JiraProject:
+    category = raw_data.get("projectCategory", None) or {}
+    return JiraProject(
+        id=str(raw_data.get("id", "")),
+        name=str(raw_data.get("name", "")),
+        key=str(raw_data.get("key", "")),
+        type=_intern(raw_data.get("projectTypeKey", "")),
+        is_private=raw_data.get("isPrivate", False),
+        category=JiraProjectCategory(
+            id=_intern(category.get("id", "")),
+            name=_intern(category.get("name", "")),
+            description=_intern(category.get("description", "")),
+        ),
+    )
+
+
+def convert_to_issue_type(raw_data: Dict[str, Any], project_id: str) -> JiraIssueType:
+    return JiraIssueType(
+        id=_intern(raw_data.get("id", "")),
+        name=_intern(raw_data.get("name", "")),
+        description=_intern(raw_data.get("description", "")),
+        subtask=raw_data.get("subtask", False),
+        hierarchy_level=raw_data.get("hierarchyLevel", 0),
+        project_id=_intern(project_id),
+    )
+
+
+def convert_to_project_detail(raw_data: Dict[str, Any]) -> JiraProjectDetail:
+    return JiraProjectDetail(
+        id=str(raw_data.get("id", "")),
+        key=str(raw_data.get("key", "")),
+        description=str(raw_data.get("description", "")),
+        issue_types=[
+            convert_to_issue_type(issue_type, str(raw_data.get("id", "")))
+            for issue_type in raw_data.get("issueTypes", [])
+        ],
+        assignee_type=_intern(raw_data.get("assigneeType", "")),
+        name=str(raw_data.get("name", "")),
+        is_private=raw_data.get("isPrivate", False),
+        type=_intern(raw_data.get("projectTypeKey", "")),
+    )
+
+
+def convert_to_field(raw_data: Dict[str, Any]) -> JiraField:
+    return JiraField(
+        id=_intern(raw_data.get("id", "")),
+        key=_intern(raw_data.get("key", "")),
+        name=_intern(raw_data.get("name", "")),
+        custom=raw_data.get("custom", False),
+        orderable=raw_data.get("orderable", False),
+        searchable=raw_data.get("searchable", False),
+        clause_names=[_intern(name) for name in raw_data.get("clauseNames", [])],
+        schema=convert_to_field_schema(raw_data),
+    )
+
+
+def convert_to_allowed_value(raw_data: Dict[str, Any]) -> JiraAllowedValue:
+    # options, components and versions use "value" or "name" for the label.
+    return JiraAllowedValue(
+        id=_intern(raw_data.get("id", "")),
+        name=_intern(raw_data["name"]) if "name" in raw_data else None,
+        value=_intern(raw_data["value"]) if "value" in raw_data else None,
+        link=raw_data.get("self", None),
+        disabled=raw_data.get("disabled", False),
+    )
+
+
+def convert_to_allowed_values(raw_data: Optional[Any]) -> List[JiraAllowedValue]:
+    if (raw_data is None) or not isinstance(raw_data, list):
+        return []
+
+    return [
+        convert_to_allowed_value(item) for item in raw_data if isinstance(item, dict)
+    ]
+
+
+def convert_to_project_field(raw_data: Dict[str, Any]) -> JiraProjectField:
+    return JiraProjectField(
+        required=raw_data.get("required", False),
+        name=_intern(raw_data.get("name", "")),
+        has_default_value=raw_data.get("hasDefaultValue", False),
+        allowed_values=(
+            convert_to_allowed_values(raw_data.get("allowedValues", []))
+            if raw_data.get("allowedValues", None)
+            else []
+        ),
+        field_id=_intern(raw_data.get("fieldId", "")),
+        key=_intern(raw_data.get("key", "")),
+        schema=convert_to_field_schema(raw_data),
+    )
+
+
+def convert_to_issue(raw_data: Dict[str, Any]) -> JiraIssue:
+    return JiraIssue(
+        id=str(raw_data.get("id", "")),
+        key=str(raw_data.get("key", "")),
+        link=str(raw_data.get("self", "")),
+        fields=raw_data.get("fields", {}),
+    )
+
+
+def to_search_issues_params(
+    request: SearchIssuesRequest,
+    start_at: Optional[int] = None,
+    next_page_token: Optional[str] = None,
+) -> Dict[str, Any]:
+    params: Dict[str, Any] = {"jql": request.jql, "maxResults": request.max_results}
+    if start_at is not None:
+        params["startAt"] = start_at
+    if next_page_token:
+        params["nextPageToken"] = next_page_token
+    if request.fields:
+        params["fields"] = ",".join(request.fields)
+    if request.expand:
+        params["expand"] = ",".join(request.expand)
+    if request.validate_query:
+        params["validateQuery"] = request.validate_query
+    return params
+
+
+def to_issue_params(
+    fields: Optional[List[str]] = None, expand: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    params: Dict[str, Any] = {}
+    if fields:
+        params["fields"] = ",".join(fields)
+    if expand:
+        params["expand"] = ",".join(expand)
+    return params
+
+
+def get_issue_search_chunks(keys: List[str], chunk_size: int) -> List[List[str]]:
+    # distinct keys which can be searched with JQL, in chunks of chunk_size.
+    searchable_keys = [
+        key for key in dict.fromkeys(keys) if _ISSUE_KEY_OR_ID.match(key) is not None
+    ]
+    return [
+        searchable_keys[i : i + chunk_size]
+        for i in range(0, len(searchable_keys), chunk_size)
+    ]
+
+
+def to_issue_keys_search_request(
+    keys: List[str],
+    fields: Optional[List[str]] = None,
+    expand: Optional[List[str]] = None,
+) -> SearchIssuesRequest:
+    # search defaults to navigable fields only, GET /issue to all of them.
+    return SearchIssuesRequest(
+        jql=f"key in ({', '.join(keys)})",
+        fields=fields or ["*all"],
+        expand=expand,
+        max_results=len(keys),
+        validate_query="warn",
+    )
+
+
+def get_issue_lookup_key(key: str) -> str:
+    return key.upper()
+
+
+def convert_to_issue_response(raw_data: Dict[str, Any]) -> GetIssueResponse:
+    response = GetIssueResponse()
+    response.status_code = 200
+    response.status_reason = "OK"
+    response.error_text = None
+    response.id = str(raw_data.get("id", ""))
+    response.key = str(raw_data.get("key", ""))
+    response.link = str(raw_data.get("self", ""))
+    response.fields = raw_data.get("fields", {})
+    return response
+
+
+def to_issue_response(raw_response: "JiraApiResponse") -> GetIssueResponse:
+    if not raw_response.is_success_response():
+        response = GetIssueResponse()
+        response.status_code = raw_response.status_code
+        response.status_reason = raw_response.status_reason
+        response.error_text = raw_response.error_text
+        return response
+
+    response = convert_to_issue_response(raw_response.content)
+    response.status_code = raw_response.status_code
+    response.status_reason = raw_response.status_reason
+    return response
+
+
+def to_issue_search_responses(
+    raw_response: "JiraApiResponse",
+) -> Dict[str, GetIssueResponse]:
+    # found issues by upper cased key and by id, a moved issue is found by its
+    # new key and keys missing here are fetched one by one.
+    responses: Dict[str, GetIssueResponse] = {}
+    if not raw_response.is_success_response():
+        return responses
+
+    for issue in raw_response.content.get("issues", []):
+        response = convert_to_issue_response(issue)
+        responses[get_issue_lookup_key(response.key)] = response
+        responses[response.id] = response
+    return responses
+
+
+def _is_unchanged(value: Any, previous: Any) -> bool:
+    # a value is unchanged when the previous one contains it, so {"name": "High"}
+    # matches the full {"id": "2", "name": "High", "self": ...} of get_issue.
+    if isinstance(value, dict):
+        return isinstance(previous, dict) and all(
+            key in previous and _is_unchanged(item, previous[key])
+            for key, item in value.items()
+        )
+    if isinstance(value, list):
+        return (
+            isinstance(previous, list)
+            and len(value) == len(previous)
+            and all(_is_unchanged(item, other) for item, other in zip(value, previous))
+        )
+    return bool(value == previous)
+
+
+def get_changed_issue_fields(request: UpdateIssueRequest) -> Dict[str, Any]:
+    # Jira replaces a field as a whole, a changed field is sent with its full
+    # new value.
+    if request.previous_fields is None:
+        return request.fields
+    return {
+        name: value
+        for name, value in request.fields.items()
+        if name not in request.previous_fields
+        or not _is_unchanged(value, request.previous_fields[name])
+    }
+
+
+def to_update_issue_response(
+    raw_response: Optional["JiraApiResponse"], key: str, updated_fields: List[str]
+) -> UpdateIssueResponse:
+    response = UpdateIssueResponse()
+    response.key = key
+    response.updated_fields = updated_fields
+
+    if raw_response is None:
+        # nothing changed, no request was sent.
+        response.status_code = 204
+        response.status_reason = "No Content"
+        response.error_text = None
+        return response
+
+    response.status_code = raw_response.status_code
+    response.status_reason = raw_response.status_reason
+    response.error_text = (
+        None if raw_response.is_success_response() else raw_response.error_text
+    )
+    return response
+
+
+def convert_to_transition(raw_data: Dict[str, Any]) -> JiraTransition:
+    to_status = raw_data.get("to", None) or {}
+    return JiraTransition(
+        id=_intern(raw_data.get("id", "")),
+        name=_intern(raw_data.get("name", "")),
+        to_status_id=_intern(to_status.get("id", "")),
+        to_status_name=_intern(to_status.get("name", "")),
+        has_screen=raw_data.get("hasScreen", False),
+        is_conditional=raw_data.get("isConditional", False),
+    )
+
+
+def to_issue_transitions_response(
+    raw_response: "JiraApiResponse",
+) -> GetIssueTransitionsResponse:
+    response = GetIssueTransitionsResponse()
+    response.status_code = raw_response.status_code
+    response.status_reason = raw_response.status_reason
+    response.error_text = raw_response.error_text
+    response.transitions = []
+
+    if not raw_response.is_success_response():
+        return response
+
+    response.transitions = [
+        convert_to_transition(transition)
+        for transition in raw_response.content.get("transitions", [])
+    ]
+
+    return response
+
+
+def get_transition_group(issue: GetIssueResponse) -> Tuple[str, str, str]:
+    # issues in the same group share the transitions out of their status.
+    return (
+        str((issue.fields.get("project", None) or {}).get("id", "")),
+        str((issue.fields.get("issuetype", None) or {}).get("id", "")),
+        str((issue.fields.get("status", None) or {}).get("id", "")),
+    )
+
+
+def is_issue_in_status(issue: GetIssueResponse, status: str) -> bool:
+    current = issue.fields.get("status", None) or {}
+    return (
+        str(current.get("id", "")) == status
+        or str(current.get("name", "")).casefold() == status.casefold()
+    )
+
+
+def find_transition(
+    transitions: List[JiraTransition], to_status: str
+) -> Optional[JiraTransition]:
+    # to_status is a status id or a case insensitive status name.
+    folded = to_status.casefold()
+    for transition in transitions:
+        if (
+            transition.to_status_id == to_status
+            or transition.to_status_name.casefold() == folded
+        ):
+            return transition
+    return None
+
+
+def to_transition_issue_response(
+    raw_response: Optional["JiraApiResponse"], key: str, transition_id: Optional[str]
+) -> TransitionIssueResponse:
+    if raw_response is None:
+        # already in the target status, no request was sent.
+        return create_transition_issue_response(key, 204, "No Content", None)
+
+    response = create_transition_issue_response(
+        key,
+        raw_response.status_code,
+        raw_response.status_reason,
+        None if raw_response.is_success_response() else raw_response.error_text,
+    )
+    response.transition_id = transition_id
+    return response
+
+
+def create_transition_issue_response(
+    key: str,
+    status_code: int,
+    status_reason: Optional[str],
+    error_text: Optional[str],
+) -> TransitionIssueResponse:
+    # for outcomes without a transition request of their own, e.g. the issue
+    # could not be read or no transition leads to the target status (0).
+    response = TransitionIssueResponse()
+    response.key = key
+    response.transition_id = None
+    response.status_code = status_code
+    response.status_reason = status_reason
+    response.error_text = error_text
+    return response
+
+
+def convert_to_attachment(raw_data: Dict[str, Any]) -> JiraAttachment:
+    return JiraAttachment(
+        id=str(raw_data.get("id", "")),
+        filename=str(raw_data.get("filename", "")),
+        size=int(raw_data.get("size", 0)),
+        mime_type=_intern(raw_data.get("mimeType", "")),
+        link=str(raw_data.get("self", "")),
+        content_link=str(raw_data.get("content", "")),
+    )
+
+
+def to_add_attachment_response(
+    raw_response: "JiraApiResponse", issue_key: str
+) -> AddAttachmentResponse:
+    response = AddAttachmentResponse()
+    response.status_code = raw_response.status_code
+    response.status_reason = raw_response.status_reason
+    response.error_text = raw_response.error_text
+    response.issue_key = issue_key
+    response.attachments = []
+
+    if not raw_response.is_success_response():
+        return response
+
+    response.error_text = None
+    if isinstance(raw_response.content, list):
+        response.attachments = [
+            convert_to_attachment(attachment) for attachment in raw_response.content
+        ]
+
+    return response
+
+
+def to_download_attachment_response(
+    raw_response: "JiraApiResponse", attachment_id: str, size: int
+) -> DownloadAttachmentResponse:
+    response = DownloadAttachmentResponse()
+    response.status_code = raw_response.status_code
+    response.status_reason = raw_response.status_reason
+    response.error_text = raw_response.error_text
+    response.attachment_id = attachment_id
+    response.size = size
+    response.content_range = raw_response.headers.get("Content-Range", None)
+    return response
+
+
+def to_server_info_response(raw_response: "JiraApiResponse") -> GetServerInfoResponse:
+    response = GetServerInfoResponse()
+    response.status_code = raw_response.status_code
+    response.status_reason = raw_response.status_reason
+
+    if raw_response.status_code != 200:
+        response.error_text = raw_response.error_text
+        return response
+
+    response.base_url = str(raw_response.content.get("baseUrl", ""))
+    response.version = str(raw_response.content.get("version", ""))
+    response.deployment_type = str(raw_response.content.get("deploymentType", ""))
+    response.server_time_zone = str(raw_response.content.get("serverTimeZone", ""))
+    response.server_time = parse_jira_datetime(
+        raw_response.content.get("serverTime", "")
+    )
+
+    return response
+
+
+def to_myself_response(raw_response: "JiraApiResponse") -> GetMySelfResponse:
+    response = GetMySelfResponse()
+    response.status_code = raw_response.status_code
+    response.status_reason = raw_response.status_reason
+
+    if not raw_response.is_success_response():
+        response.error_text = raw_response.error_text
+        return response
+
+    response.account_id = str(raw_response.content.get("accountId", ""))
+    response.account_type = str(raw_response.content.get("accountType", ""))
+    response.email_address = str(raw_response.content.get("emailAddress", ""))
+    response.display_name = str(raw_response.content.get("displayName", ""))
+    response.time_zone = str(raw_response.content.get("timeZone", ""))
+
+    return response
+
+
+def to_projects_response(raw_response: "JiraApiResponse") -> GetProjectsResponse:
+    response = GetProjectsResponse()
+    response.projects = []
+    response.status_code = raw_response.status_code
+    response.status_reason = raw_response.status_reason
+
+    if not raw_response.is_success_response():
+        response.error_text = raw_response.error_text
+        return response
+
+    response.projects = [
+        convert_to_project(project) for project in raw_response.content
+    ]
+
+    return response
+
+
+def to_project_detail_response(
+    raw_response: "JiraApiResponse",
+) -> GetProjectDetailResponse:
+    response = GetProjectDetailResponse()
+    response.project = None
+    response.status_code = raw_response.status_code
+    response.status_reason = raw_response.status_reason
+
+    if not raw_response.is_success_response():
+        response.error_text = raw_response.error_text
+        return response
+
+    response.project = convert_to_project_detail(raw_response.content)
+
+    return response
+
+
+def to_project_issue_types_response(
+    raw_response: "JiraApiResponse", project_id_or_key: str
+) -> GetProjectIssueTypesResponse:
+    response = GetProjectIssueTypesResponse()
+    response.status_code = raw_response.status_code
+    response.status_reason = raw_response.status_reason
+    response.total = raw_response.content.get("total", 0)
+    response.max_results = raw_response.content.get("maxResults", 50)
+
+    if not raw_response.is_success_response():
+        response.error_text = raw_response.error_text
+        return response
+
+    response.issue_types = [
+        convert_to_issue_type(issue_type, project_id_or_key)
+        for issue_type in raw_response.content.get(
+            "issueTypes", raw_response.content.get("values", [])
+        )
+    ]
+
+    return response
+
+
+def to_fields_response(raw_response: "JiraApiResponse") -> GetFieldsResponse:
+    response = GetFieldsResponse()
+    response.fields = []
+    response.status_code = raw_response.status_code
+    response.status_reason = raw_response.status_reason
+    response.error_text = raw_response.error_text
+
+    if not raw_response.is_success_response():
+        response.error_text = raw_response.error_text
+        return response
+
+    response.fields = [convert_to_field(field) for field in raw_response.content]
+
+    return response
+
+
+def to_project_issue_fields_response(
+    raw_response: "JiraApiResponse",
+) -> GetProjectIssueFieldsResponse:
+    response = GetProjectIssueFieldsResponse()
+    response.fields = []
+    response.status_code = raw_response.status_code
+    response.status_reason = raw_response.status_reason
+    response.error_text = raw_response.error_text
+    response.total = raw_response.content.get("total", 0)
+    response.max_results = raw_response.content.get("maxResults", 50)
+
+    if not raw_response.is_success_response():
+        response.error_text = raw_response.error_text
+        return response
+
+    response.fields = [
+        convert_to_project_field(field)
+        for field in raw_response.content.get(
+            "fields", raw_response.content.get("values", [])
+        )
+    ]
+
+    return response
+
+
+def to_create_issue_response(raw_response: "JiraApiResponse") -> CreateIssueResponse:
+    response = CreateIssueResponse()
+    response.status_code = raw_response.status_code
+    response.status_reason = raw_response.status_reason
+    response.error_text = raw_response.error_text
+
+    if not raw_response.is_success_response():
+        response.error_text = raw_response.error_text
+        return response
+
+    response.id = raw_response.content.get("id", "")
+    response.key = raw_response.content.get("key", "")
+    response.link = raw_response.content.get("self", "")
+
+    return response
+
+
+def to_create_issues_responses(
+    raw_response: "JiraApiResponse", count: int
+) -> List[CreateIssueResponse]:
+    content = raw_response.content
+    if not content and raw_response.error_text:
+        # a bulk request where every element failed is answered with 400,
+        # the body still carries the per-element errors.
+        try:
+            content = loads(raw_response.error_text)
+        except (JSONDecodeError, TypeError):
+            content = {}
+    if not isinstance(content, dict):
+        content = {}
+
+    element_errors: Dict[int, Dict[str, Any]] = {
+        error.get("failedElementNumber", -1): error
+        for error in content.get("errors", [])
+    }
+    if not raw_response.is_success_response() and not element_errors:
+        # the whole chunk failed, e.g. auth or server error.
+        element_errors = {i: {} for i in range(count)}
+
+    created_issues: Iterator[Dict[str, Any]] = iter(content.get("issues", []))
+    responses = []
+    for i in range(count):
+        response = CreateIssueResponse()
+        if i in element_errors:
+            error = element_errors[i]
+            response.status_code = error.get("status", raw_response.status_code)
+            response.status_reason = raw_response.status_reason
+            response.error_text = (
+                dumps(error["elementErrors"])
+                if "elementErrors" in error
+                else raw_response.error_text
+            )
+        else:
+            # created issues are listed in the order of the succeeded elements.
+            issue = next(created_issues, {})
+            response.status_code = raw_response.status_code
+            response.status_reason = raw_response.status_reason
+            response.error_text = None
+            response.id = issue.get("id", "")
+            response.key = issue.get("key", "")
+            response.link = issue.get("self", "")
+        responses.append(response)
+
+    return responses
+
+
+def get_remaining_page_start_ats(
+    start_at: int, page_size: int, total: int
+) -> List[int]:
+    if page_size <= 0:
+        return []
+    return list(range(start_at + page_size, total, page_size))
+
+
+def merge_project_issue_types_pages(
+    first_page: GetProjectIssueTypesResponse,
+    pages: List[GetProjectIssueTypesResponse],
+) -> GetProjectIssueTypesResponse:
+    # the first page may be held by the conditional request cache, merge into
+    # a copy so a later 304 does not return the merged list.
+    response = copy(first_page)
+    response.issue_types = list(first_page.issue_types)
+    for page in pages:
+        if page.status_code != 200:
+            # report the failed page on the merged response rather than
+            # returning a silently truncated list.
+            response.status_code = page.status_code
+            response.status_reason = page.status_reason
+            response.error_text = page.error_text
+            continue
+        response.issue_types.extend(page.issue_types)
+
+    return response
+
+
+def merge_project_issue_fields_pages(
+    first_page: GetProjectIssueFieldsResponse,
+    pages: List[GetProjectIssueFieldsResponse],
+) -> GetProjectIssueFieldsResponse:
+    response = copy(first_page)
+    response.fields = list(first_page.fields)
+    for page in pages:
+        if page.status_code != 200:
+            response.status_code = page.status_code
+            response.status_reason = page.status_reason
+            response.error_text = page.error_text
+            continue
+        response.fields.extend(page.fields)
+
+    return response
+
+
+class TypedProjectFieldsPage:
+    fields: List[JiraProjectField]
+    total: int
+    max_results: int
+
+
+def _copy_status(
+    response: Union[
+        GetFieldsResponse,
+        GetProjectsResponse,
+        GetProjectDetailResponse,
+        GetProjectIssueFieldsResponse,
+    ],
+    raw_response: "JiraApiResponse",
+) -> bool:
+    response.status_code = raw_response.status_code
+    response.status_reason = raw_response.status_reason
+    response.error_text = raw_response.error_text
+    if not raw_response.is_success_response():
+        return False
+
+    # content stays the default {} when the body was empty, the typed
+    # decoders never return a dict.
+    if isinstance(raw_response.content, dict):
+        response.status_code = 0
+        response.error_text = "Response body could not be decoded."
+        return False
+    return True
+
+
+def to_typed_fields_response(raw_response: "JiraApiResponse") -> GetFieldsResponse:
+    response = GetFieldsResponse()
+    response.fields = []
+    if _copy_status(response, raw_response):
+        response.fields = raw_response.content
+    return response
+
+
+def to_typed_projects_response(raw_response: "JiraApiResponse") -> GetProjectsResponse:
+    response = GetProjectsResponse()
+    response.projects = []
+    if _copy_status(response, raw_response):
+        response.projects = raw_response.content
+    return response
+
+
+def to_typed_project_detail_response(
+    raw_response: "JiraApiResponse",
+) -> GetProjectDetailResponse:
+    response = GetProjectDetailResponse()
+    response.project = None
+    if _copy_status(response, raw_response):
+        response.project = raw_response.content
+    return response
+
+
+def to_typed_project_issue_fields_response(
+    raw_response: "JiraApiResponse",
+) -> GetProjectIssueFieldsResponse:
+    response = GetProjectIssueFieldsResponse()
+    response.fields = []
+    response.total = 0
+    response.max_results = 50
+    if _copy_status(response, raw_response):
+        page: TypedProjectFieldsPage = raw_response.content
+        response.fields = page.fields
+        response.total = page.total
+        response.max_results = page.max_results
+    return response
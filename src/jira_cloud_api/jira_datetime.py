@@ -0,0 +1,57 @@
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Optional
+
+# Jira renders timestamps as 2023-03-29T00:15:35.205-0700, the regex also
+# accepts the other ISO-8601 shapes we see in the wild (Z, +07:00, no
+# fraction, plain dates).
+_ISO_DATETIME = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})"
+    r"(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:[.,](\d{1,9}))?)?"
+    r"(Z|z|[+-]\d{2}(?::?\d{2})?)?)?"
+)
+
+_TIMEZONES: Dict[str, timezone] = {"Z": timezone.utc, "z": timezone.utc}
+
+
+def _get_timezone(offset: str) -> timezone:
+    zone = _TIMEZONES.get(offset, None)
+    if zone is None:
+        minutes = int(offset[1:3]) * 60 + int(offset[-2:] if len(offset) > 3 else 0)
+        delta = timedelta(minutes=-minutes if offset[0] == "-" else minutes)
+        zone = timezone.utc if not minutes else timezone(delta)
+        # only a handful of offsets exist, so this stays small.
+        _TIMEZONES[offset] = zone
+    return zone
+
+
+def parse_jira_datetime(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+
+    match = _ISO_DATETIME.fullmatch(value.strip())
+    if match is None:
+        return _fallback_parse(value)
+
+    year, month, day, hour, minute, second, fraction, offset = match.groups()
+    try:
+        return datetime(
+            int(year),
+            int(month),
+            int(day),
+            int(hour) if hour else 0,
+            int(minute) if minute else 0,
+            int(second) if second else 0,
+            int(fraction[:6].ljust(6, "0")) if fraction else 0,
+            _get_timezone(offset) if offset else None,
+        )
+    except ValueError:
+        return _fallback_parse(value)
+
+
+def _fallback_parse(value: str) -> Optional[datetime]:
+    # dateparser loads its language data on import, only pay for it when a
+    # value is not in one of the formats above.
+    from dateparser import parse  # pylint: disable=import-outside-toplevel
+
+    return parse(value)
@@ -0,0 +1,153 @@
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from jira_cloud_api.jira_models import JiraField
+
+
+def _add_to_index(
+    index: Dict[str, List[JiraField]], name: str, field: JiraField
+) -> None:
+    if name:
+        index.setdefault(name, []).append(field)
+
+
+def _remove_from_index(
+    index: Dict[str, List[JiraField]], name: str, field: JiraField
+) -> None:
+    fields = index.get(name, None)
+    if fields is None:
+        return
+    fields[:] = [f for f in fields if f.id != field.id]
+    if not fields:
+        del index[name]
+
+
+class FieldRegistry:
+    # hash indexes over the fields of GET /rest/api/2/field. Display names,
+    # clause names and custom types are not unique, their indexes keep every
+    # matching field in the order Jira returned them.
+
+    def __init__(self, fields: Optional[Iterable[JiraField]] = None) -> None:
+        self.__by_id: Dict[str, JiraField] = {}
+        self.__by_key: Dict[str, JiraField] = {}
+        self.__by_name: Dict[str, List[JiraField]] = {}
+        self.__by_clause_name: Dict[str, List[JiraField]] = {}
+        self.__by_custom_type: Dict[str, List[JiraField]] = {}
+        if fields is not None:
+            self.refresh(fields)
+
+    def __len__(self) -> int:
+        return len(self.__by_id)
+
+    def __iter__(self) -> Iterator[JiraField]:
+        return iter(self.__by_id.values())
+
+    def __contains__(self, id_or_key: object) -> bool:
+        return id_or_key in self.__by_id or id_or_key in self.__by_key
+
+    def get_by_id(self, field_id: str) -> Optional[JiraField]:
+        return self.__by_id.get(field_id, None)
+
+    def get_by_key(self, key: str) -> Optional[JiraField]:
+        return self.__by_key.get(key, None)
+
+    def find_by_name(self, name: str) -> List[JiraField]:
+        return list(self.__by_name.get(name.casefold(), []))
+
+    def find_by_clause_name(self, clause_name: str) -> List[JiraField]:
+        return list(self.__by_clause_name.get(clause_name.casefold(), []))
+
+    def find_by_custom_type(self, custom_type: str) -> List[JiraField]:
+        return list(self.__by_custom_type.get(custom_type, []))
+
+    def resolve(self, value: str) -> Optional[JiraField]:
+        # id, key, display name and then JQL clause name, e.g. "customfield_10000",
+        # "Story Points" or "cf[10000]".
+        field = self.__by_id.get(value, None) or self.__by_key.get(value, None)
+        if field is not None:
+            return field
+
+        folded = value.casefold()
+        fields = self.__by_name.get(folded, None) or self.__by_clause_name.get(
+            folded, None
+        )
+        return fields[0] if fields else None
+
+    def refresh(self, fields: Iterable[JiraField]) -> int:
+        # replaces the registry content with ``fields``, only added, changed
+        # and removed fields touch the indexes. Returns the number of them.
+        latest = {field.id: field for field in fields}
+
+        removed = [field for id_, field in self.__by_id.items() if id_ not in latest]
+        for field in removed:
+            self.__remove(field)
+
+        changed = 0
+        touched: Dict[Tuple[int, str], List[JiraField]] = {}
+        for field in latest.values():
+            current = self.__by_id.get(field.id, None)
+            if current is field or current == field:
+                continue
+            if current is not None:
+                self.__remove(current)
+            self.__add(field)
+            touched.update(self.__get_buckets(field))
+            changed += 1
+
+        if changed:
+            # changed fields were appended, put the touched lists (and the
+            # iteration order) back into the order Jira returned them.
+            order = {field_id: i for i, field_id in enumerate(latest)}
+            self.__by_id = {field_id: self.__by_id[field_id] for field_id in latest}
+            for bucket in touched.values():
+                bucket.sort(key=lambda field: order[field.id])
+
+        return changed + len(removed)
+
+    def update(self, fields: Iterable[JiraField]) -> None:
+        # adds or replaces ``fields`` and keeps all others.
+        for field in fields:
+            current = self.__by_id.get(field.id, None)
+            if current is not None:
+                self.__remove(current)
+            self.__add(field)
+
+    def remove(self, field_id: str) -> None:
+        field = self.__by_id.get(field_id, None)
+        if field is not None:
+            self.__remove(field)
+
+    def __get_buckets(
+        self, field: JiraField
+    ) -> Iterator[Tuple[Tuple[int, str], List[JiraField]]]:
+        # the non-unique index lists which hold ``field``.
+        names = [(self.__by_name, field.name.casefold())]
+        names.extend(
+            (self.__by_clause_name, clause_name.casefold())
+            for clause_name in field.clause_names
+        )
+        if field.schema is not None:
+            names.append((self.__by_custom_type, field.schema.custom or ""))
+        for index, name in names:
+            bucket = index.get(name, None)
+            if bucket is not None:
+                yield (id(index), name), bucket
+
+    def __add(self, field: JiraField) -> None:
+        self.__by_id[field.id] = field
+        if field.key:
+            self.__by_key[field.key] = field
+        _add_to_index(self.__by_name, field.name.casefold(), field)
+        for clause_name in field.clause_names:
+            _add_to_index(self.__by_clause_name, clause_name.casefold(), field)
+        if field.schema is not None:
+            _add_to_index(self.__by_custom_type, field.schema.custom or "", field)
+
+    def __remove(self, field: JiraField) -> None:
+        del self.__by_id[field.id]
+        if self.__by_key.get(field.key, None) is field:
+            del self.__by_key[field.key]
+        _remove_from_index(self.__by_name, field.name.casefold(), field)
+        for clause_name in field.clause_names:
+            _remove_from_index(self.__by_clause_name, clause_name.casefold(), field)
+        if field.schema is not None:
+            _remove_from_index(self.__by_custom_type, field.schema.custom or "", field)
@@ -0,0 +1,288 @@
+import csv
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from itertools import islice
+from math import isfinite
+from os import PathLike
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+    Union,
+)
+
+from jira_cloud_api.jira_api import JiraApi, JiraApiError
+from jira_cloud_api.jira_client_core import BULK_CREATE_ISSUE_LIMIT
+from jira_cloud_api.jira_models import JiraProjectField
+from jira_cloud_api.jira_request import (
+    CreateIssueRequest,
+    GetProjectIssueFieldsRequest,
+)
+from jira_cloud_api.jira_response import CreateIssueResponse
+from jira_cloud_api.jira_templates import CreateIssueTemplate
+
+_DEFAULT_BATCH_SIZE = 200
+
+
+def read_csv_rows(
+    source: Union[str, "PathLike[str]", TextIO],
+    encoding: str = "utf-8-sig",
+    **fmtparams: Any,
+) -> Iterator[List[str]]:
+    # yields the header and then one list per row, the file is read lazily.
+    if isinstance(source, (str, PathLike)):
+        with open(source, newline="", encoding=encoding) as file:
+            yield from csv.reader(file, **fmtparams)
+    else:
+        yield from csv.reader(source, **fmtparams)
+
+
+def read_excel_rows(
+    path: Union[str, "PathLike[str]"], sheet_name: Optional[str] = None
+) -> Iterator[List[Any]]:
+    try:
+        from openpyxl import (  # pylint: disable=import-outside-toplevel
+            load_workbook,
+        )
+    except ImportError as e:
+        raise ValueError(
+            "Excel import requires openpyxl, install jira-cloud-api[excel]."
+        ) from e
+
+    # read only mode streams the sheet instead of loading every cell.
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        sheet = workbook[sheet_name] if sheet_name else workbook.active
+        for row in sheet.iter_rows(values_only=True):
+            yield list(row)
+    finally:
+        workbook.close()
+
+
+@dataclass
+class ImportRowResult:
+    # 1-based row number in the sheet, the header is row 1.
+    row_number: int
+    response: Optional[CreateIssueResponse] = None
+    errors: List[str] = field(default_factory=list)
+
+    def is_success(self) -> bool:
+        return (
+            not self.errors
+            and self.response is not None
+            and 200 <= self.response.status_code <= 299
+        )
+
+
+class IssueImporter:
+    # turns sheet rows into create issue requests. The header holds
+    # CreateIssueRequest dotted keys (or names mapped by ``column_mapping``),
+    # rows are read, validated and sent in batches so only one batch is kept
+    # in memory at a time.
+
+    def __init__(
+        self,
+        api: JiraApi,
+        project_fields: Optional[Iterable[JiraProjectField]] = None,
+        defaults: Optional[Mapping[str, Any]] = None,
+        column_mapping: Optional[Mapping[str, str]] = None,
+        list_columns: Optional[Iterable[str]] = None,
+        list_separator: str = ",",
+        chunk_size: int = BULK_CREATE_ISSUE_LIMIT,
+        batch_size: int = _DEFAULT_BATCH_SIZE,
+        concurrent: bool = False,
+    ) -> None:
+        self.api = api
+        self.project_fields = list(project_fields) if project_fields else None
+        self.defaults = dict(defaults) if defaults else {}
+        self.column_mapping = dict(column_mapping) if column_mapping else {}
+        self.list_columns = set(list_columns) if list_columns else set()
+        self.list_separator = list_separator
+        self.chunk_size = chunk_size
+        self.batch_size = max(1, batch_size)
+        self.concurrent = concurrent
+        self.__fields_by_id: Dict[str, JiraProjectField] = {}
+        if self.project_fields:
+            for project_field in self.project_fields:
+                self.__fields_by_id[project_field.field_id] = project_field
+                if project_field.key:
+                    self.__fields_by_id.setdefault(project_field.key, project_field)
+
+    @classmethod
+    def for_issue_type(
+        cls, api: JiraApi, project_id_or_key: str, issue_type_id: str, **kwargs: Any
+    ) -> "IssueImporter":
+        # createmeta goes through the metadata cache when it is enabled.
+        response = api.get_project_issue_fields(
+            GetProjectIssueFieldsRequest(
+                project_id_or_key=project_id_or_key,
+                issue_type_id=issue_type_id,
+                query_all=True,
+            )
+        )
+        if response.status_code != 200:
+            raise JiraApiError(
+                response.status_code, response.status_reason, response.error_text
+            )
+
+        project_path = "project.id" if project_id_or_key.isdigit() else "project.key"
+        defaults = {project_path: project_id_or_key, "issuetype.id": issue_type_id}
+        defaults.update(kwargs.pop("defaults", None) or {})
+        return cls(api, project_fields=response.fields, defaults=defaults, **kwargs)
+
+    def import_rows(self, rows: Iterable[Sequence[Any]]) -> Iterator[ImportRowResult]:
+        row_iterator = iter(rows)
+        header = next(row_iterator, None)
+        if header is None:
+            return
+
+        keys = [
+            self.column_mapping.get(str(name).strip(), str(name).strip())
+            for name in header
+        ]
+        keys.extend(key for key in self.defaults if key not in keys)
+        list_columns = [self.__is_list_column(key) for key in keys]
+        number_columns = [self.__get_schema_type(key) == "number" for key in keys]
+        date_columns = [self.__get_schema_type(key) == "date" for key in keys]
+        if self.project_fields is not None:
+            # unknown columns or missing required fields fail the whole sheet.
+            CreateIssueTemplate(keys, self.project_fields)
+
+        templates: Dict[Tuple[int, ...], Union[CreateIssueTemplate, str]] = {}
+        rows_with_numbers = enumerate(row_iterator, start=2)
+        while True:
+            batch = list(islice(rows_with_numbers, self.batch_size))
+            if not batch:
+                return
+
+            results: List[ImportRowResult] = []
+            pending: List[Tuple[ImportRowResult, CreateIssueRequest]] = []
+            for row_number, row in batch:
+                values = self.__get_values(
+                    keys, row, list_columns, number_columns, date_columns
+                )
+                # empty cells are left out of the payload, rows with the same
+                # set of filled columns share one compiled template.
+                columns = tuple(
+                    i for i, value in enumerate(values) if value is not None
+                )
+                template = templates.get(columns, None)
+                if template is None:
+                    template = self.__compile([keys[i] for i in columns])
+                    templates[columns] = template
+
+                result = ImportRowResult(row_number=row_number)
+                results.append(result)
+                if isinstance(template, str):
+                    result.errors.append(template)
+                    continue
+
+                row_values = [values[i] for i in columns]
+                result.errors.extend(template.validate(row_values))
+                if not result.errors:
+                    pending.append((result, template.create_request(row_values)))
+
+            if pending:
+                responses = self.api.create_issues(
+                    [request for _, request in pending],
+                    chunk_size=self.chunk_size,
+                    concurrent=self.concurrent,
+                )
+                for (result, _), response in zip(pending, responses):
+                    result.response = response
+                    if not result.is_success():
+                        result.errors.append(
+                            response.error_text or f"HTTP {response.status_code}"
+                        )
+
+            yield from results
+
+    def import_csv(
+        self, source: Union[str, "PathLike[str]", TextIO], **fmtparams: Any
+    ) -> Iterator[ImportRowResult]:
+        return self.import_rows(read_csv_rows(source, **fmtparams))
+
+    def import_excel(
+        self, path: Union[str, "PathLike[str]"], sheet_name: Optional[str] = None
+    ) -> Iterator[ImportRowResult]:
+        return self.import_rows(read_excel_rows(path, sheet_name))
+
+    def __compile(self, keys: List[str]) -> Union[CreateIssueTemplate, str]:
+        try:
+            return CreateIssueTemplate(keys, self.project_fields)
+        except ValueError as e:
+            return str(e)
+
+    def __get_values(
+        self,
+        keys: List[str],
+        row: Sequence[Any],
+        list_columns: List[bool],
+        number_columns: List[bool],
+        date_columns: List[bool],
+    ) -> List[Any]:
+        values: List[Any] = []
+        for i, key in enumerate(keys):
+            value = row[i] if i < len(row) else None
+            if isinstance(value, str):
+                value = value.strip() or None
+            # openpyxl returns None for empty cells, csv an empty string.
+            if value is None:
+                value = self.defaults.get(key, None)
+            elif isinstance(value, date):
+                value = _to_jira_date(value, date_columns[i])
+            elif isinstance(value, str):
+                if list_columns[i]:
+                    value = [
+                        item.strip()
+                        for item in value.split(self.list_separator)
+                        if item.strip()
+                    ]
+                elif number_columns[i]:
+                    value = _to_number(value)
+            values.append(value)
+        return values
+
+    def __is_list_column(self, key: str) -> bool:
+        if key in self.list_columns:
+            return True
+        project_field = self.__fields_by_id.get(key.split(".")[0], None)
+        return project_field is not None and project_field.is_array()
+
+    def __get_schema_type(self, key: str) -> Optional[str]:
+        project_field = self.__fields_by_id.get(key.split(".")[0], None)
+        if project_field is None or project_field.schema is None:
+            return None
+        return project_field.schema.type
+
+
+def _to_number(value: str) -> Union[int, float, str]:
+    try:
+        number = float(value)
+    except ValueError:
+        # let Jira report the invalid value for this row.
+        return value
+    # inf and nan are not JSON, Jira reports them like any other bad value.
+    if not isfinite(number):
+        return value
+    return int(number) if number.is_integer() else number
+
+
+def _to_jira_date(value: date, is_date_field: bool) -> str:
+    # openpyxl returns a datetime for date cells as well, date fields only
+    # take the date part. Naive datetimes are taken as local time.
+    if is_date_field or not isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d")
+    if value.tzinfo is None:
+        value = value.astimezone()
+    return (
+        f"{value.strftime('%Y-%m-%dT%H:%M:%S')}.{value.microsecond // 1000:03d}"
+        f"{value.strftime('%z')}"
+    )
@@ -0,0 +1,73 @@
+import json
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+
+if TYPE_CHECKING:
+    from jira_cloud_api.jira_typed import TypedDecoder
+
+# decodes a raw response body (bytes) into Python objects.
+JsonDecoder = Callable[[bytes], Any]
+
+AUTO_JSON_DECODER = "auto"
+JSON_DECODERS = ("orjson", "msgspec", "json")
+
+
+def _get_orjson_decoder() -> JsonDecoder:
+    import orjson  # pylint: disable=import-outside-toplevel
+
+    decoder: JsonDecoder = orjson.loads
+    return decoder
+
+
+def _get_msgspec_decoder() -> JsonDecoder:
+    import msgspec  # pylint: disable=import-outside-toplevel,import-error
+
+    decoder: JsonDecoder = msgspec.json.Decoder().decode
+    return decoder
+
+
+def _get_stdlib_decoder() -> JsonDecoder:
+    # json.loads detects the UTF-8/16/32 encoding of bytes on its own, so
+    # the body does not have to be decoded to text first.
+    return json.loads
+
+
+_DECODER_FACTORIES = {
+    "orjson": _get_orjson_decoder,
+    "msgspec": _get_msgspec_decoder,
+    "json": _get_stdlib_decoder,
+}
+
+
+def get_json_decoder(decoder: Optional[Union[str, JsonDecoder]] = None) -> JsonDecoder:
+    # None and "auto" pick the fastest installed backend, orjson, then
+    # msgspec and finally the standard library.
+    if callable(decoder):
+        return decoder
+
+    name = decoder or AUTO_JSON_DECODER
+    if name == AUTO_JSON_DECODER:
+        for backend in JSON_DECODERS:
+            try:
+                return _DECODER_FACTORIES[backend]()
+            except ImportError:
+                continue
+
+    if name not in _DECODER_FACTORIES:
+        raise ValueError(
+            f"Unknown JSON decoder {name}, use one of {', '.join(JSON_DECODERS)}."
+        )
+    try:
+        return _DECODER_FACTORIES[name]()
+    except ImportError as e:
+        raise ValueError(f"JSON decoder {name} is not installed.") from e
+
+
+def get_typed_decoder() -> "TypedDecoder":
+    try:
+        # pylint: disable-next=import-outside-toplevel
+        from jira_cloud_api.jira_typed import TypedDecoder
+    except ImportError as e:
+        raise ValueError(
+            "Typed decoding requires msgspec, install jira-cloud-api[msgspec]."
+        ) from e
+    return TypedDecoder()
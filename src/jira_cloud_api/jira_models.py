@@ -1,10 +1,10 @@
-from dataclasses import dataclass
-from typing import Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 
 from typing_extensions import Self
 
 
-@dataclass
+@dataclass(slots=True)
 class JiraFieldType:
     type_: Optional[str]
     name: Optional[str]
@@ -17,13 +17,15 @@ class JiraFieldType:
             self.properties = []
 
 
-@dataclass
+@dataclass(slots=True)
 class JiraFieldPropertyPath:
     path: str
     is_array: bool
 
 
-@dataclass
+# schemas repeat across fields and projects, converters share one frozen
+# instance per distinct schema.
+@dataclass(frozen=True, slots=True)
 class JiraFieldSchema:
     type: str
     items: Optional[str] = None
@@ -32,7 +34,7 @@ class JiraFieldSchema:
     custom_id: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class JiraField:
     id: str
     key: str
@@ -44,14 +46,14 @@ class JiraField:
     schema: Optional[JiraFieldSchema]
 
 
-@dataclass
+@dataclass(slots=True)
 class JiraProjectCategory:
     id: str
     name: str
     description: str
 
 
-@dataclass
+@dataclass(slots=True)
 class JiraProject:
     id: str
     name: str
@@ -61,7 +63,7 @@ class JiraProject:
     category: JiraProjectCategory
 
 
-@dataclass
+@dataclass(slots=True)
 class JiraIssueType:
     id: str
     name: str
@@ -71,7 +73,7 @@ class JiraIssueType:
     project_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class JiraProjectDetail:
     id: str
     key: str
@@ -83,30 +85,110 @@ class JiraProjectDetail:
     type: str
 
 
-@dataclass
+@dataclass(slots=True)
+class JiraAllowedValue:
+    id: str
+    name: Optional[str] = None
+    value: Optional[str] = None
+    link: Optional[str] = None
+    disabled: bool = False
+
+
+@dataclass(slots=True)
+class JiraAllowedValueIndexes:
+    by_id: Dict[str, JiraAllowedValue]
+    by_name: Dict[str, JiraAllowedValue]
+    by_value: Dict[str, JiraAllowedValue]
+
+
+@dataclass(slots=True)
 class JiraProjectField:
     required: bool
     name: str
     has_default_value: bool
-    allowed_values: Dict[str, str]
+    allowed_values: List[JiraAllowedValue]
     field_id: str
     key: str
     schema: Optional[JiraFieldSchema]
+    # built on the first lookup, fields with many options (components,
+    # versions) are then validated without scanning the list.
+    _indexes: Optional[JiraAllowedValueIndexes] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
         if self.allowed_values is None:
-            self.allowed_values = {}
+            self.allowed_values = []
 
     def is_array(self) -> bool:
         return self.schema.type == "array" if self.schema else False
 
+    def get_allowed_value_indexes(self) -> JiraAllowedValueIndexes:
+        if self._indexes is None:
+            indexes = JiraAllowedValueIndexes(by_id={}, by_name={}, by_value={})
+            # the first option wins when names or values are duplicated.
+            for allowed_value in self.allowed_values:
+                indexes.by_id.setdefault(allowed_value.id, allowed_value)
+                if allowed_value.name is not None:
+                    indexes.by_name.setdefault(allowed_value.name, allowed_value)
+                if allowed_value.value is not None:
+                    indexes.by_value.setdefault(allowed_value.value, allowed_value)
+            self._indexes = indexes
+        return self._indexes
+
+    def reset_allowed_value_indexes(self) -> None:
+        self._indexes = None
+
+    def get_allowed_value(self, value: Optional[str]) -> Optional[JiraAllowedValue]:
+        # matches the option id, name or value, e.g. "10001", "Backend" or "High".
+        if value is None:
+            return None
+
+        indexes = self.get_allowed_value_indexes()
+        return (
+            indexes.by_id.get(value, None)
+            or indexes.by_name.get(value, None)
+            or indexes.by_value.get(value, None)
+        )
+
+    def get_allowed_value_id(self, value: Optional[str]) -> Optional[str]:
+        allowed_value = self.get_allowed_value(value)
+        return allowed_value.id if allowed_value is not None else None
+
     def is_value_allowed(self, value: Optional[str]) -> bool:
-        if value not in self.allowed_values.values():
-            return False
-        return True
+        allowed_value = self.get_allowed_value(value)
+        return allowed_value is not None and not allowed_value.disabled
+
+
+@dataclass(slots=True)
+class JiraIssue:
+    id: str
+    key: str
+    link: str
+    fields: Dict[str, Any]
+
+
+@dataclass(slots=True)
+class JiraTransition:
+    id: str
+    name: str
+    to_status_id: str
+    to_status_name: str
+    has_screen: bool = False
+    is_conditional: bool = False
+
+
+@dataclass(slots=True)
+class JiraAttachment:
+    id: str
+    filename: str
+    size: int
+    mime_type: str
+    link: str
+    content_link: str
 
 
-@dataclass
+@dataclass(slots=True)
 class MySelfInfo:
     email_address: str
     display_name: str
@@ -1,5 +1,32 @@
 from dataclasses import dataclass
-from typing import Any, Dict
+from os import PathLike
+from typing import IO, Any, Dict, List, Optional, Union
+
+
+def _expand_dotted_fields(fields: Dict[str, Any]) -> Dict[str, Any]:
+    issue_fields: Dict[str, Any] = {}
+    for key, value in fields.items():
+        field_paths = key.split(".")
+        tmp = issue_fields
+        is_array = isinstance(value, list)
+        for count, field_path in enumerate(field_paths):
+            # if this value is an array and at least has 2 levels
+            # then the last property will be an array.
+            if is_array and count == len(field_paths) - 2:
+                tmp[field_path] = [
+                    {field_paths[len(field_paths) - 1]: v} for v in value
+                ]
+                break
+            if count == len(field_paths) - 1:
+                tmp[field_path] = value
+            else:
+                if tmp.get(field_path, None) is not None:
+                    # merge exist dict keys.
+                    tmp[field_path] = {**{}, **tmp[field_path]}
+                else:
+                    tmp[field_path] = {}
+            tmp = tmp[field_path]
+    return issue_fields
 
 
 @dataclass
@@ -7,29 +34,15 @@ class CreateIssueRequest:
     fields: Dict[str, Any]
 
     def __post_init__(self):
-        issue_fields: Dict[str, Any] = {}
-        for key, value in self.fields.items():
-            field_paths = key.split(".")
-            tmp = issue_fields
-            is_array = isinstance(value, list)
-            for count, field_path in enumerate(field_paths):
-                # if this value is an array and at least has 2 levels
-                # then the last property will be an array.
-                if is_array and count == len(field_paths) - 2:
-                    tmp[field_path] = [
-                        {field_paths[len(field_paths) - 1]: v} for v in value
-                    ]
-                    break
-                if count == len(field_paths) - 1:
-                    tmp[field_path] = value
-                else:
-                    if tmp.get(field_path, None) is not None:
-                        # merge exist dict keys.
-                        tmp[field_path] = {**{}, **tmp[field_path]}
-                    else:
-                        tmp[field_path] = {}
-                tmp = tmp[field_path]
-        self.fields = issue_fields
+        self.fields = _expand_dotted_fields(self.fields)
+
+    @classmethod
+    def from_issue_fields(cls, issue_fields: Dict[str, Any]) -> "CreateIssueRequest":
+        # ``issue_fields`` is already nested, e.g. rendered by a
+        # CreateIssueTemplate, so the dotted key expansion is skipped.
+        request = cls.__new__(cls)
+        request.fields = issue_fields
+        return request
 
 
 @dataclass
@@ -47,3 +60,45 @@ class GetProjectIssueFieldsRequest:
     start_at: int = 0
     max_results: int = 50
     query_all: bool = False
+
+
+@dataclass
+class SearchIssuesRequest:
+    jql: str
+    # only these fields are returned by the server, None means the default set.
+    fields: Optional[List[str]] = None
+    expand: Optional[List[str]] = None
+    start_at: int = 0
+    max_results: int = 50
+    # use the token paginated /search/jql endpoint instead of startAt offsets.
+    token_paginated: bool = False
+    # "strict" (Jira's default), "warn" or "none", with "warn" unknown values
+    # such as a deleted issue key are reported as warnings instead of failing
+    # the whole search.
+    validate_query: Optional[str] = None
+
+
+@dataclass
+class UpdateIssueRequest:
+    key: str
+    # dotted keys like CreateIssueRequest, e.g. {"priority.name": "High"}.
+    fields: Dict[str, Any]
+    # the last known field values, dotted or as returned by get_issue. Only
+    # fields which differ from it are sent, None sends every field.
+    previous_fields: Optional[Dict[str, Any]] = None
+
+    def __post_init__(self):
+        self.fields = _expand_dotted_fields(self.fields)
+        if self.previous_fields is not None:
+            self.previous_fields = _expand_dotted_fields(self.previous_fields)
+
+
+@dataclass
+class AddAttachmentRequest:
+    issue_key: str
+    # a path or a binary file object, read in chunks while uploading.
+    file: Union[str, "PathLike[str]", IO[bytes]]
+    # defaults to the base name of the path or file object.
+    filename: Optional[str] = None
+    # guessed from the file name when not given.
+    content_type: Optional[str] = None
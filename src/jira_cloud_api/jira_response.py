@@ -2,11 +2,13 @@ from datetime import datetime
 from typing import List, Optional
 
 from jira_cloud_api.jira_models import (
+    JiraAttachment,
     JiraField,
     JiraIssueType,
     JiraProject,
     JiraProjectDetail,
     JiraProjectField,
+    JiraTransition,
 )
 
 
@@ -22,6 +24,13 @@ class CreateIssueResponse(BaseResponse):
     link: str
 
 
+class UpdateIssueResponse(BaseResponse):
+    key: str
+    # the fields sent to Jira, empty when nothing changed and no request
+    # was made.
+    updated_fields: List[str]
+
+
 class GetServerInfoResponse(BaseResponse):
     base_url: str
     version: str
@@ -45,6 +54,16 @@ class GetIssueResponse(BaseResponse):
     fields: dict
 
 
+class GetIssueTransitionsResponse(BaseResponse):
+    transitions: List[JiraTransition]
+
+
+class TransitionIssueResponse(BaseResponse):
+    key: str
+    # None when the issue already was in the target status.
+    transition_id: Optional[str]
+
+
 class GetProjectsResponse(BaseResponse):
     projects: List[JiraProject]
 
@@ -67,3 +86,16 @@ class GetProjectIssueFieldsResponse(BaseResponse):
     fields: List[JiraProjectField]
     total: int
     max_results: int
+
+
+class AddAttachmentResponse(BaseResponse):
+    issue_key: str
+    attachments: List[JiraAttachment]
+
+
+class DownloadAttachmentResponse(BaseResponse):
+    attachment_id: str
+    # bytes written to the target.
+    size: int
+    # the Content-Range of a 206 response, e.g. "bytes 0-1023/4096".
+    content_range: Optional[str]
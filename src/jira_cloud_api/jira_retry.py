@@ -0,0 +1,160 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from random import uniform
+from threading import Lock
+from time import monotonic
+from typing import Mapping, Optional, Tuple
+
+_IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+_RETRY_STATUS_CODES = (429, 502, 503, 504)
+# upper bound for Retry-After / X-RateLimit-Reset delays and pauses.
+_DEFAULT_MAX_RETRY_AFTER = 120.0
+
+
+def _parse_http_time(value: str) -> Optional[datetime]:
+    # email pulls in socket and friends, only needed for HTTP-date headers.
+    from email.utils import (  # pylint: disable=import-outside-toplevel
+        parsedate_to_datetime,
+    )
+
+    try:
+        if "T" in value:
+            # X-RateLimit-Reset is ISO-8601, e.g. 2025-08-01T10:00Z
+            parsed = datetime.fromisoformat(value.strip().replace("Z", "+00:00"))
+        else:
+            parsed = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def get_retry_after(headers: Mapping[str, str]) -> Optional[float]:
+    retry_after = headers.get("Retry-After", None)
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            retry_at = _parse_http_time(retry_after)
+            if retry_at is not None:
+                return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    reset = headers.get("X-RateLimit-Reset", None)
+    if reset:
+        reset_at = _parse_http_time(reset)
+        if reset_at is not None:
+            return max(0.0, (reset_at - datetime.now(timezone.utc)).total_seconds())
+
+    return None
+
+
+def get_rate_limit_pause(
+    headers: Mapping[str, str], max_pause: float = _DEFAULT_MAX_RETRY_AFTER
+) -> Optional[float]:
+    # the server says the budget is used up, wait for the reset before the
+    # next request instead of running into a 429. A far or skewed reset must
+    # not stall every later request of the client.
+    if headers.get("X-RateLimit-Remaining", None) != "0":
+        return None
+    pause = get_retry_after(headers)
+    return min(pause, max_pause) if pause is not None else None
+
+
+@dataclass
+class RetryPolicy:
+    max_attempts: int = 4
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    # full jitter, the delay is a random value between 0 and the backoff.
+    jitter: bool = True
+    respect_retry_after: bool = True
+    # upper bound for Retry-After / X-RateLimit-Reset delays and pauses.
+    max_retry_after: float = _DEFAULT_MAX_RETRY_AFTER
+    retry_status_codes: Tuple[int, ...] = _RETRY_STATUS_CODES
+    retry_methods: Tuple[str, ...] = _IDEMPOTENT_METHODS
+
+    def should_retry(self, method: str, status_code: int, attempt: int) -> bool:
+        return (
+            attempt + 1 < self.max_attempts
+            and method.upper() in self.retry_methods
+            and status_code in self.retry_status_codes
+        )
+
+    def get_delay(self, attempt: int, headers: Mapping[str, str]) -> float:
+        if self.respect_retry_after:
+            retry_after = get_retry_after(headers)
+            if retry_after is not None:
+                return min(retry_after, self.max_retry_after)
+
+        backoff = min(self.max_backoff, self.backoff_factor * (2**attempt))
+        return uniform(0, backoff) if self.jitter else backoff
+
+
+class TokenBucket:
+    # client side pacing: ``rate`` requests per second with bursts of up to
+    # ``capacity`` requests. Callers reserve a token and sleep for the
+    # returned delay, so the same bucket works for threads and asyncio.
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        if rate <= 0:
+            raise ValueError("Token bucket rate must be greater than 0.")
+
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.__tokens = self.capacity
+        self.__updated_at = monotonic()
+        self.__paused_until = 0.0
+        self.__lock = Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        with self.__lock:
+            now = monotonic()
+            self.__tokens = min(
+                self.capacity, self.__tokens + (now - self.__updated_at) * self.rate
+            )
+            self.__updated_at = now
+            self.__tokens -= tokens
+
+            delay = -self.__tokens / self.rate if self.__tokens < 0 else 0.0
+            return max(delay, self.__paused_until - now)
+
+    def pause(self, seconds: float) -> None:
+        with self.__lock:
+            self.__paused_until = max(self.__paused_until, monotonic() + seconds)
+
+
+def get_retry_delay(
+    retry_policy: Optional[RetryPolicy],
+    rate_limiter: Optional[TokenBucket],
+    method: str,
+    status_code: int,
+    headers: Mapping[str, str],
+    attempt: int,
+    is_streamed: bool = False,
+) -> Optional[float]:
+    # called after every response of a client, None means the response is
+    # final. The rate limit headers pause the limiter either way.
+    if rate_limiter is not None:
+        pause = get_rate_limit_pause(
+            headers,
+            (
+                retry_policy.max_retry_after
+                if retry_policy is not None
+                else _DEFAULT_MAX_RETRY_AFTER
+            ),
+        )
+        if pause:
+            rate_limiter.pause(pause)
+
+    # a streamed request body cannot be sent a second time.
+    if (
+        retry_policy is None
+        or is_streamed
+        or not retry_policy.should_retry(method, status_code, attempt)
+    ):
+        return None
+
+    delay = retry_policy.get_delay(attempt, headers)
+    if rate_limiter is not None:
+        # hold back every caller sharing this client, not just this one.
+        rate_limiter.pause(delay)
+    return delay
@@ -0,0 +1,240 @@
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, tzinfo
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from typing import Any, Dict, Generator, Iterable, List, Optional, Protocol
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from jira_cloud_api.jira_api import JiraApi, JiraApiError
+from jira_cloud_api.jira_datetime import parse_jira_datetime
+from jira_cloud_api.jira_models import JiraIssue
+from jira_cloud_api.jira_request import SearchIssuesRequest
+
+# seconds re-read before the watermark on every cycle. Covers clock skew
+# between Jira nodes and issues which reach the search index late.
+_DEFAULT_OVERLAP = 300.0
+_DEFAULT_MAX_RESULTS = 100
+_DEFAULT_CHECKPOINT_INTERVAL = 1000
+# bump when the layout of the watermark file changes.
+_WATERMARK_FORMAT_VERSION = 1
+
+
+@dataclass
+class SyncWatermark:
+    # the latest ``updated`` value synced for a project.
+    updated: Optional[datetime] = None
+    # issue id -> raw ``updated`` value of the issues in the overlap window,
+    # the next cycle reads them again and skips the ones which are unchanged.
+    seen: Dict[str, str] = field(default_factory=dict)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "updated": self.updated.isoformat() if self.updated else None,
+            "seen": self.seen,
+        }
+
+    @classmethod
+    def from_json(cls, raw_data: Dict[str, Any]) -> "SyncWatermark":
+        updated = raw_data.get("updated", None)
+        return cls(
+            updated=datetime.fromisoformat(updated) if updated else None,
+            seen=dict(raw_data.get("seen", {})),
+        )
+
+
+class WatermarkStore(Protocol):
+    def load(self, project: str) -> Optional[SyncWatermark]: ...
+
+    def save(self, project: str, watermark: SyncWatermark) -> None: ...
+
+
+class MemoryWatermarkStore:
+    def __init__(self) -> None:
+        self.__watermarks: Dict[str, Dict[str, Any]] = {}
+        self.__lock = Lock()
+
+    def load(self, project: str) -> Optional[SyncWatermark]:
+        with self.__lock:
+            raw_data = self.__watermarks.get(project, None)
+        return SyncWatermark.from_json(raw_data) if raw_data is not None else None
+
+    def save(self, project: str, watermark: SyncWatermark) -> None:
+        with self.__lock:
+            self.__watermarks[project] = watermark.to_json()
+
+
+class FileWatermarkStore:
+    # all projects in one JSON file. Unlike the disk metadata cache, errors
+    # are raised, a lost watermark means a full rescan.
+
+    def __init__(self, path: str) -> None:
+        self.path = os.path.expanduser(path)
+        self.__lock = Lock()
+
+    def load(self, project: str) -> Optional[SyncWatermark]:
+        raw_data = self.__read().get(project, None)
+        return SyncWatermark.from_json(raw_data) if raw_data is not None else None
+
+    def save(self, project: str, watermark: SyncWatermark) -> None:
+        with self.__lock:
+            projects = self.__read()
+            projects[project] = watermark.to_json()
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            with NamedTemporaryFile(
+                "w", dir=directory, suffix=".tmp", delete=False, encoding="utf-8"
+            ) as file:
+                json.dump(
+                    {"version": _WATERMARK_FORMAT_VERSION, "projects": projects}, file
+                )
+            # replace atomically so a crash never leaves a partial file.
+            os.replace(file.name, self.path)
+
+    def __read(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                raw_data = json.load(file)
+        except FileNotFoundError:
+            return {}
+        if raw_data.get("version", None) != _WATERMARK_FORMAT_VERSION:
+            raise ValueError(f"Unsupported watermark file {self.path}.")
+        projects: Dict[str, Any] = raw_data.get("projects", {})
+        return projects
+
+
+def _quote_jql(value: str) -> str:
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
+class IncrementalSync:
+    # yields the issues of a project changed since the last cycle, so a cycle
+    # costs a search over the churn instead of over every issue. Issues are
+    # searched with ``updated >= watermark - overlap`` in ascending order of
+    # ``updated``, issues seen with the same ``updated`` value before are
+    # skipped. The watermark is saved every ``checkpoint_interval`` issues and
+    # when the stream ends or is closed, only issues the consumer asked past
+    # are recorded, so an interrupted cycle resumes without losing changes.
+    #
+    # JQL dates have minute precision and are read in the time zone of the
+    # API user, which is read from /myself unless ``time_zone`` is given.
+    # ``jql`` is an additional filter without ORDER BY.
+
+    def __init__(
+        self,
+        api: JiraApi,
+        store: WatermarkStore,
+        fields: Optional[List[str]] = None,
+        expand: Optional[List[str]] = None,
+        jql: Optional[str] = None,
+        overlap: float = _DEFAULT_OVERLAP,
+        time_zone: Optional[tzinfo] = None,
+        max_results: int = _DEFAULT_MAX_RESULTS,
+        checkpoint_interval: int = _DEFAULT_CHECKPOINT_INTERVAL,
+    ) -> None:
+        if overlap < 0:
+            raise ValueError("Overlap must not be negative.")
+
+        # the watermark needs ``updated``, the token paginated search only
+        # returns the id by default.
+        self.fields = list(fields) if fields else ["*all"]
+        if "updated" not in self.fields and not {"*all", "*navigable"} & set(
+            self.fields
+        ):
+            self.fields.append("updated")
+        self.api = api
+        self.store = store
+        self.expand = expand
+        self.jql = jql
+        self.overlap = overlap
+        self.time_zone = time_zone
+        self.max_results = max_results
+        self.checkpoint_interval = max(1, checkpoint_interval)
+
+    def sync(self, projects: Iterable[str]) -> Generator[JiraIssue, None, None]:
+        for project in projects:
+            yield from self.sync_project(project)
+
+    def sync_project(self, project: str) -> Generator[JiraIssue, None, None]:
+        watermark = self.store.load(project) or SyncWatermark()
+        request = SearchIssuesRequest(
+            jql=self.get_jql(project, watermark.updated),
+            fields=self.fields,
+            expand=self.expand,
+            max_results=self.max_results,
+            token_paginated=True,
+        )
+
+        synced = 0
+        try:
+            for issue in self.api.search_issues(request):
+                updated = str(issue.fields.get("updated", None) or "")
+                # an issue changed again during the cycle comes back with a
+                # newer value and is yielded again.
+                if watermark.seen.get(issue.id, None) == updated:
+                    continue
+
+                yield issue
+                watermark.seen[issue.id] = updated
+                updated_at = self.__parse_updated(updated)
+                if updated_at is not None and (
+                    watermark.updated is None or updated_at > watermark.updated
+                ):
+                    watermark.updated = updated_at
+
+                synced += 1
+                if synced % self.checkpoint_interval == 0:
+                    self.__save(project, watermark)
+        finally:
+            if synced:
+                self.__save(project, watermark)
+
+    def get_jql(self, project: str, updated: Optional[datetime] = None) -> str:
+        clauses = [f"project = {_quote_jql(project)}"]
+        if self.jql:
+            clauses.append(f"({self.jql})")
+        if updated is not None:
+            since = self.__get_since(updated)
+            clauses.append(f'updated >= "{since.strftime("%Y/%m/%d %H:%M")}"')
+        return " AND ".join(clauses) + " ORDER BY updated ASC, key ASC"
+
+    def __save(self, project: str, watermark: SyncWatermark) -> None:
+        # only the issues the next query reads again are kept.
+        if watermark.updated is not None:
+            since = self.__get_since(watermark.updated)
+            seen = {}
+            for issue_id, updated in watermark.seen.items():
+                updated_at = self.__parse_updated(updated)
+                if updated_at is None or updated_at >= since:
+                    seen[issue_id] = updated
+            watermark.seen = seen
+        self.store.save(project, watermark)
+
+    def __get_since(self, updated: datetime) -> datetime:
+        since = (updated - timedelta(seconds=self.overlap)).astimezone(
+            self.__get_time_zone()
+        )
+        return since.replace(second=0, microsecond=0)
+
+    def __parse_updated(self, updated: str) -> Optional[datetime]:
+        updated_at = parse_jira_datetime(updated)
+        if updated_at is not None and updated_at.tzinfo is None:
+            updated_at = updated_at.replace(tzinfo=self.__get_time_zone())
+        return updated_at
+
+    def __get_time_zone(self) -> tzinfo:
+        if self.time_zone is None:
+            response = self.api.get_myself()
+            if response.status_code != 200:
+                raise JiraApiError(
+                    response.status_code, response.status_reason, response.error_text
+                )
+            try:
+                self.time_zone = ZoneInfo(response.time_zone)
+            except (ZoneInfoNotFoundError, ValueError) as e:
+                raise ValueError(
+                    f"Unknown time zone {response.time_zone}, pass time_zone."
+                ) from e
+        return self.time_zone
@@ -0,0 +1,151 @@
+from operator import itemgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from jira_cloud_api.jira_models import JiraProjectField
+from jira_cloud_api.jira_request import CreateIssueRequest
+
+# (name, column index) for a value, (name, children) for a nested object.
+_Node = Tuple[str, Union[int, List[Any]]]
+
+# leaf names that carry an option reference in a create payload.
+_OPTION_KEYS = ("id", "name", "value")
+# createmeta does not always list these, they are accepted by every create.
+_ALWAYS_AVAILABLE_FIELDS = ("project", "issuetype")
+
+
+def _compile(keys: Sequence[str]) -> List[_Node]:
+    root: Dict[str, Any] = {}
+    for column, key in enumerate(keys):
+        field_paths = key.split(".")
+        node = root
+        for field_path in field_paths[:-1]:
+            child = node.setdefault(field_path, {})
+            if not isinstance(child, dict):
+                raise ValueError(f"Key {key} conflicts with another key.")
+            node = child
+        if field_paths[-1] in node:
+            raise ValueError(f"Key {key} conflicts with another key.")
+        node[field_paths[-1]] = column
+
+    def to_nodes(node: Dict[str, Any]) -> List[_Node]:
+        return [
+            (name, child if isinstance(child, int) else to_nodes(child))
+            for name, child in node.items()
+        ]
+
+    return to_nodes(root)
+
+
+def _compile_value(child: Union[int, List[_Node]]) -> Callable[[Sequence[Any]], Any]:
+    if isinstance(child, int):
+        return itemgetter(child)
+    leaf, column = child[0]
+    if len(child) == 1 and isinstance(column, int):
+        # same as CreateIssueRequest, {"components.name": ["a", "b"]}
+        # becomes {"components": [{"name": "a"}, {"name": "b"}]}.
+
+        def render_leaf(values: Sequence[Any]) -> Any:
+            value = values[column]
+            if isinstance(value, list):
+                return [{leaf: item} for item in value]
+            return {leaf: value}
+
+        return render_leaf
+    return _compile_renderer(child)
+
+
+def _compile_renderer(nodes: List[_Node]) -> Callable[[Sequence[Any]], Dict[str, Any]]:
+    # one closure per object of the key tree, built once per template. A row
+    # is then rendered without splitting keys or walking the tree again.
+    renderers = [(name, _compile_value(child)) for name, child in nodes]
+
+    def render(values: Sequence[Any]) -> Dict[str, Any]:
+        return {name: renderer(values) for name, renderer in renderers}
+
+    return render
+
+
+class CreateIssueTemplate:
+    # compiles the dotted keys of CreateIssueRequest once, rows are then
+    # rendered into the nested payload without splitting keys again. Useful
+    # for imports where every row has the same columns.
+
+    def __init__(
+        self,
+        keys: Sequence[str],
+        project_fields: Optional[Iterable[JiraProjectField]] = None,
+    ) -> None:
+        self.keys = list(keys)
+        self.__columns = {key: column for column, key in enumerate(self.keys)}
+        self.__render = _compile_renderer(_compile(self.keys))
+        self.__option_columns: List[Tuple[int, JiraProjectField]] = []
+        if project_fields is not None:
+            self.__check_project_fields(list(project_fields))
+
+    def __check_project_fields(self, project_fields: List[JiraProjectField]) -> None:
+        fields_by_id = {field.field_id: field for field in project_fields}
+        fields_by_id.update({field.key: field for field in project_fields if field.key})
+
+        used_field_ids = set()
+        for column, key in enumerate(self.keys):
+            field_paths = key.split(".")
+            field = fields_by_id.get(field_paths[0], None)
+            if field is None and field_paths[0] in _ALWAYS_AVAILABLE_FIELDS:
+                continue
+            if field is None:
+                raise ValueError(f"Field {field_paths[0]} is not available.")
+            used_field_ids.add(field.field_id)
+
+            if field.allowed_values and (
+                len(field_paths) == 1 or field_paths[-1] in _OPTION_KEYS
+            ):
+                self.__option_columns.append((column, field))
+
+        missing_fields = [
+            field.field_id
+            for field in project_fields
+            if field.required
+            and not field.has_default_value
+            and field.field_id not in used_field_ids
+        ]
+        if missing_fields:
+            raise ValueError(
+                f"Required fields are missing: {', '.join(missing_fields)}."
+            )
+
+    def render(self, values: Sequence[Any]) -> Dict[str, Any]:
+        # ``values`` are in the order of ``keys``.
+        return self.__render(values)
+
+    def render_mapping(self, row: Mapping[str, Any]) -> Dict[str, Any]:
+        return self.__render([row.get(key, None) for key in self.keys])
+
+    def create_request(self, values: Sequence[Any]) -> CreateIssueRequest:
+        return CreateIssueRequest.from_issue_fields(self.render(values))
+
+    def validate(self, values: Sequence[Any]) -> List[str]:
+        # only checks option values, the template itself was checked against
+        # the project fields when it was compiled.
+        errors = []
+        for column, field in self.__option_columns:
+            value = values[column]
+            for option in value if isinstance(value, list) else [value]:
+                if option is not None and not field.is_value_allowed(str(option)):
+                    errors.append(
+                        f"Value {option} is not allowed for {self.keys[column]}."
+                    )
+        return errors
+
+    def get_column(self, key: str) -> int:
+        return self.__columns[key]
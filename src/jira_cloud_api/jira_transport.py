@@ -0,0 +1,236 @@
+from http.cookiejar import Cookie, CookieJar, DefaultCookiePolicy
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Protocol,
+    Tuple,
+)
+
+
+class JiraTransportResponse(Protocol):
+    @property
+    def status_code(self) -> int: ...
+
+    @property
+    def reason(self) -> Optional[str]: ...
+
+    @property
+    def headers(self) -> Mapping[str, str]: ...
+
+    @property
+    def content(self) -> bytes: ...
+
+    @property
+    def text(self) -> str: ...
+
+    def json(self) -> Any: ...
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]: ...
+
+    def close(self) -> None: ...
+
+
+class JiraTransport(Protocol):
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        auth: Optional[Tuple[str, str]] = None,
+        timeout: Optional[float] = None,
+        data: Optional[Any] = None,
+        stream: bool = False,
+    ) -> JiraTransportResponse: ...
+
+    def close(self) -> None: ...
+
+
+class _RejectCookiesPolicy(DefaultCookiePolicy):
+    # a transport shared by several credentials must not send the session
+    # cookie of one user with the requests of another.
+
+    def set_ok(self, cookie: Cookie, request: Any) -> bool:
+        return False
+
+
+class RequestsTransport:
+    # One long-lived session, so calls reuse pooled keep-alive connections
+    # instead of paying a new TCP/TLS handshake each time.
+
+    def __init__(
+        self,
+        headers: Mapping[str, str],
+        pool_connections: int,
+        pool_maxsize: int,
+        keep_alive: bool,
+        ssl_verify: bool,
+        persist_cookies: bool = True,
+    ) -> None:
+        # requests and urllib3 take a noticeable part of the import time,
+        # load them with the first client rather than with the package.
+        # pylint: disable=import-outside-toplevel
+        from requests import Session
+        from requests.adapters import HTTPAdapter
+
+        self.__session = Session()
+        if not persist_cookies:
+            self.__session.cookies.set_policy(_RejectCookiesPolicy())
+        self.__session.verify = ssl_verify
+        self.__session.headers.update(headers)
+        if not keep_alive:
+            self.__session.headers["Connection"] = "close"
+
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize
+        )
+        self.__session.mount("https://", adapter)
+        self.__session.mount("http://", adapter)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        auth: Optional[Tuple[str, str]] = None,
+        timeout: Optional[float] = None,
+        data: Optional[Any] = None,
+        stream: bool = False,
+    ) -> JiraTransportResponse:
+        # ``data`` is a streamed body (e.g. a MultipartFileStream), ``stream``
+        # leaves the response body unread until iter_content.
+        return self.__session.request(
+            method=method,
+            url=url,
+            params=params,
+            json=json,
+            data=data,
+            headers=headers,
+            auth=auth,
+            timeout=timeout,
+            stream=stream,
+        )
+
+    def close(self) -> None:
+        self.__session.close()
+
+
+class HttpxTransportResponse:
+    def __init__(self, response: Any) -> None:
+        self.__response = response
+        self.status_code: int = response.status_code
+        self.reason: Optional[str] = response.reason_phrase
+        self.headers: Mapping[str, str] = response.headers
+
+    @property
+    def content(self) -> bytes:
+        # read() also loads a streamed response, and returns the content of
+        # one already read.
+        content: bytes = self.__response.read()
+        return content
+
+    @property
+    def text(self) -> str:
+        self.__response.read()
+        text: str = self.__response.text
+        return text
+
+    def json(self) -> Any:
+        return self.__response.json()
+
+    def iter_content(self, chunk_size: int) -> Iterator[bytes]:
+        chunks: Iterator[bytes] = self.__response.iter_bytes(chunk_size)
+        return chunks
+
+    def aiter_content(self, chunk_size: int) -> AsyncIterator[bytes]:
+        chunks: AsyncIterator[bytes] = self.__response.aiter_bytes(chunk_size)
+        return chunks
+
+    def close(self) -> None:
+        self.__response.close()
+
+    async def aread(self) -> bytes:
+        content: bytes = await self.__response.aread()
+        return content
+
+    async def aclose(self) -> None:
+        await self.__response.aclose()
+
+
+class HttpxTransport:
+    # HTTP/2 capable transport, requires ``httpx[http2]`` to be installed.
+
+    def __init__(
+        self,
+        headers: Mapping[str, str],
+        pool_connections: int,
+        pool_maxsize: int,
+        keep_alive: bool,
+        ssl_verify: bool,
+        transport: Optional[Any] = None,
+        persist_cookies: bool = True,
+    ) -> None:
+        try:
+            import httpx  # pylint: disable=import-outside-toplevel
+        except ImportError as e:
+            raise ValueError(
+                "HTTP/2 transport requires httpx, install jira-cloud-api[http2]."
+            ) from e
+
+        # ``transport`` is an httpx transport, e.g. httpx.MockTransport in tests.
+        try:
+            self.__client = httpx.Client(
+                http2=True,
+                verify=ssl_verify,
+                headers=dict(headers),
+                limits=httpx.Limits(
+                    max_connections=pool_connections * pool_maxsize,
+                    max_keepalive_connections=pool_maxsize if keep_alive else 0,
+                ),
+                transport=transport,
+                cookies=(
+                    None
+                    if persist_cookies
+                    else CookieJar(policy=_RejectCookiesPolicy())
+                ),
+            )
+        except ImportError as e:
+            # httpx without the h2 package.
+            raise ValueError(
+                "HTTP/2 transport requires h2, install jira-cloud-api[http2]."
+            ) from e
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        auth: Optional[Tuple[str, str]] = None,
+        timeout: Optional[float] = None,
+        data: Optional[Any] = None,
+        stream: bool = False,
+    ) -> JiraTransportResponse:
+        raw_request = self.__client.build_request(
+            method=method,
+            url=url,
+            params=params,
+            json=json,
+            content=data,
+            headers=headers,
+            timeout=timeout,
+        )
+        return HttpxTransportResponse(
+            self.__client.send(raw_request, auth=auth, stream=stream)
+        )
+
+    def close(self) -> None:
+        self.__client.close()
@@ -0,0 +1,254 @@
+# Typed decoding of metadata responses with msgspec, enabled through
+# JiraApiOptions.typed_decoding. The structs mirror the Jira JSON and are
+# turned into jira_models in the same pass, without an intermediate dict tree.
+# Defaults follow the dict based converters in jira_converters.
+from sys import intern
+from typing import Any, Dict, List, Optional
+
+import msgspec  # pylint: disable=import-error
+
+from jira_cloud_api.jira_converters import (
+    TypedProjectFieldsPage,
+    convert_to_field,
+    convert_to_project,
+    convert_to_project_detail,
+    convert_to_project_field,
+    get_field_schema,
+)
+from jira_cloud_api.jira_models import (
+    JiraAllowedValue,
+    JiraField,
+    JiraFieldSchema,
+    JiraIssueType,
+    JiraProject,
+    JiraProjectCategory,
+    JiraProjectDetail,
+    JiraProjectField,
+)
+
+
+class _Schema(msgspec.Struct, rename="camel"):
+    # UNSET tells an empty schema ({}, no schema like the dict path) from
+    # one with empty values.
+    type: Any = msgspec.UNSET
+    items: Any = msgspec.UNSET
+    system: Any = msgspec.UNSET
+    custom: Any = msgspec.UNSET
+    custom_id: Any = msgspec.UNSET
+
+
+class _Field(msgspec.Struct, rename="camel"):
+    id: Any = ""
+    key: Any = ""
+    name: Any = ""
+    custom: bool = False
+    orderable: bool = False
+    searchable: bool = False
+    clause_names: List[str] = []
+    schema: Optional[_Schema] = None
+
+
+class _ProjectCategory(msgspec.Struct):
+    id: Any = ""
+    name: Any = ""
+    description: Any = ""
+
+
+class _Project(msgspec.Struct, rename="camel"):
+    id: Any = ""
+    name: Any = ""
+    key: Any = ""
+    project_type_key: Any = ""
+    is_private: bool = False
+    project_category: Optional[_ProjectCategory] = None
+
+
+class _IssueType(msgspec.Struct, rename="camel"):
+    id: Any = ""
+    name: Any = ""
+    description: Any = ""
+    subtask: bool = False
+    hierarchy_level: int = 0
+
+
+class _ProjectDetail(msgspec.Struct, rename="camel"):
+    id: Any = ""
+    key: Any = ""
+    description: Any = ""
+    issue_types: List[_IssueType] = []
+    assignee_type: Any = ""
+    name: Any = ""
+    is_private: bool = False
+    project_type_key: Any = ""
+
+
+class _AllowedValue(msgspec.Struct, rename={"link": "self"}):
+    id: Any = ""
+    name: Any = None
+    value: Any = None
+    link: Optional[str] = None
+    disabled: bool = False
+
+
+class _ProjectField(msgspec.Struct, rename="camel"):
+    required: bool = False
+    name: Any = ""
+    has_default_value: bool = False
+    allowed_values: Optional[List[_AllowedValue]] = None
+    field_id: Any = ""
+    key: Any = ""
+    schema: Optional[_Schema] = None
+
+
+class _ProjectFieldsPage(msgspec.Struct, rename="camel"):
+    fields: Optional[List[_ProjectField]] = None
+    values: Optional[List[_ProjectField]] = None
+    total: int = 0
+    max_results: int = 50
+
+
+def _to_str(value: Any) -> str:
+    return intern(str(value))
+
+
+def _to_schema_value(value: Any) -> str:
+    return "" if value is msgspec.UNSET else str(value)
+
+
+def _to_schema(schema: Optional[_Schema]) -> Optional[JiraFieldSchema]:
+    values = (
+        [schema.type, schema.items, schema.system, schema.custom, schema.custom_id]
+        if schema is not None
+        else []
+    )
+    if all(value is msgspec.UNSET for value in values):
+        return None
+    return get_field_schema(*(_to_schema_value(value) for value in values))
+
+
+def _to_field(field: _Field) -> JiraField:
+    return JiraField(
+        id=_to_str(field.id),
+        key=_to_str(field.key),
+        name=_to_str(field.name),
+        custom=field.custom,
+        orderable=field.orderable,
+        searchable=field.searchable,
+        clause_names=[intern(name) for name in field.clause_names],
+        schema=_to_schema(field.schema),
+    )
+
+
+def _to_project(project: _Project) -> JiraProject:
+    category = project.project_category or _ProjectCategory()
+    return JiraProject(
+        id=str(project.id),
+        name=str(project.name),
+        key=str(project.key),
+        type=_to_str(project.project_type_key),
+        is_private=project.is_private,
+        category=JiraProjectCategory(
+            id=_to_str(category.id),
+            name=_to_str(category.name),
+            description=_to_str(category.description),
+        ),
+    )
+
+
+def _to_project_detail(project: _ProjectDetail) -> JiraProjectDetail:
+    project_id = _to_str(project.id)
+    return JiraProjectDetail(
+        id=str(project.id),
+        key=str(project.key),
+        description=str(project.description),
+        issue_types=[
+            JiraIssueType(
+                id=_to_str(issue_type.id),
+                name=_to_str(issue_type.name),
+                description=_to_str(issue_type.description),
+                subtask=issue_type.subtask,
+                hierarchy_level=issue_type.hierarchy_level,
+                project_id=project_id,
+            )
+            for issue_type in project.issue_types
+        ],
+        assignee_type=_to_str(project.assignee_type),
+        name=str(project.name),
+        is_private=project.is_private,
+        type=_to_str(project.project_type_key),
+    )
+
+
+def _to_project_field(field: _ProjectField) -> JiraProjectField:
+    return JiraProjectField(
+        required=field.required,
+        name=_to_str(field.name),
+        has_default_value=field.has_default_value,
+        allowed_values=[
+            JiraAllowedValue(
+                id=_to_str(value.id),
+                name=_to_str(value.name) if value.name is not None else None,
+                value=_to_str(value.value) if value.value is not None else None,
+                link=value.link,
+                disabled=value.disabled,
+            )
+            for value in field.allowed_values or []
+        ],
+        field_id=_to_str(field.field_id),
+        key=_to_str(field.key),
+        schema=_to_schema(field.schema),
+    )
+
+
+class TypedDecoder:
+    # every decode falls back to the dict based converters when a payload
+    # does not match the structs, e.g. an unexpected type in allowedValues.
+
+    def __init__(self) -> None:
+        self.__fields = msgspec.json.Decoder(List[_Field])
+        self.__projects = msgspec.json.Decoder(List[_Project])
+        self.__project_detail = msgspec.json.Decoder(_ProjectDetail)
+        self.__project_fields_page = msgspec.json.Decoder(_ProjectFieldsPage)
+
+    def decode_fields(self, content: bytes) -> List[JiraField]:
+        try:
+            return [_to_field(field) for field in self.__fields.decode(content)]
+        except msgspec.ValidationError:
+            return [convert_to_field(field) for field in msgspec.json.decode(content)]
+
+    def decode_projects(self, content: bytes) -> List[JiraProject]:
+        try:
+            return [_to_project(project) for project in self.__projects.decode(content)]
+        except msgspec.ValidationError:
+            return [
+                convert_to_project(project) for project in msgspec.json.decode(content)
+            ]
+
+    def decode_project_detail(self, content: bytes) -> JiraProjectDetail:
+        try:
+            return _to_project_detail(self.__project_detail.decode(content))
+        except msgspec.ValidationError:
+            return convert_to_project_detail(msgspec.json.decode(content))
+
+    def decode_project_fields_page(self, content: bytes) -> TypedProjectFieldsPage:
+        page = TypedProjectFieldsPage()
+        try:
+            raw_page = self.__project_fields_page.decode(content)
+            page.fields = [
+                _to_project_field(field)
+                for field in (
+                    raw_page.fields if raw_page.fields is not None else raw_page.values
+                )
+                or []
+            ]
+            page.total = raw_page.total
+            page.max_results = raw_page.max_results
+        except msgspec.ValidationError:
+            raw_data: Dict[str, Any] = msgspec.json.decode(content)
+            page.fields = [
+                convert_to_project_field(field)
+                for field in raw_data.get("fields", raw_data.get("values", []))
+            ]
+            page.total = raw_data.get("total", 0)
+            page.max_results = raw_data.get("maxResults", 50)
+        return page
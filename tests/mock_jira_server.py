@@ -2,10 +2,16 @@
 # pylint: disable=line-too-long
 from __future__ import annotations
 
+from datetime import datetime
+from io import BytesIO, RawIOBase
 from re import DOTALL, IGNORECASE, match, search
-from typing import Optional
+from typing import List, Optional
+from zoneinfo import ZoneInfo
 
-from requests import Response
+from httpx import MockTransport
+from httpx import Request as HttpxRequest
+from httpx import Response as HttpxResponse
+from requests import PreparedRequest, Response
 from requests_mock import Adapter
 from requests_mock.request import _RequestObjectProxy
 from requests_mock.response import create_response
@@ -13,11 +19,22 @@ from requests_mock.response import create_response
 
 class CustomMatcherFactory:
     response_status_code: int
+    search_issue_count: int
+    search_max_results: int
 
-    def __init__(self, response_status_code: int = 200):
+    def __init__(
+        self,
+        response_status_code: int = 200,
+        search_issue_count: int = 25,
+        search_max_results: int = 100,
+    ):
         self.response_status_code = response_status_code
+        self.search_issue_count = search_issue_count
+        self.search_max_results = search_max_results
 
-    def custom_matcher(self, request: _RequestObjectProxy) -> Optional[Response]:
+    def custom_matcher(  # pylint: disable=too-many-return-statements
+        self, request: _RequestObjectProxy
+    ) -> Optional[Response]:
         if (
             search(pattern="^/rest/api/2/field", string=request.path, flags=IGNORECASE)
             is not None
@@ -72,6 +89,17 @@ class CustomMatcherFactory:
             return mock_create_issue_response(
                 request, status_code=self.response_status_code
             )
+        if (
+            match(
+                pattern=r"^/rest/api/2/issue/bulk$",
+                string=request.path,
+                flags=IGNORECASE | DOTALL,
+            )
+            is not None
+        ):
+            return mock_create_issues_response(
+                request, status_code=self.response_status_code
+            )
         if (
             match(
                 pattern=r"^/rest/api/2/issue/createmeta/\w{1,}?/issuetypes$",
@@ -94,15 +122,143 @@ class CustomMatcherFactory:
             return mock_get_project_issue_fields_response(
                 request, status_code=self.response_status_code
             )
+        if (
+            match(
+                pattern=r"^/rest/api/2/issue/[\w-]+$",
+                string=request.path,
+                flags=IGNORECASE | DOTALL,
+            )
+            is not None
+            and request.method == "GET"
+        ):
+            return mock_get_issue_response(
+                request,
+                status_code=self.response_status_code,
+                issue_count=self.search_issue_count,
+            )
+        if (
+            match(
+                pattern=r"^/rest/api/2/issue/[\w-]+$",
+                string=request.path,
+                flags=IGNORECASE | DOTALL,
+            )
+            is not None
+            and request.method == "PUT"
+        ):
+            return mock_update_issue_response(
+                request,
+                status_code=self.response_status_code,
+                issue_count=self.search_issue_count,
+            )
+        if (
+            match(
+                pattern=r"^/rest/api/2/issue/[\w-]+/transitions$",
+                string=request.path,
+                flags=IGNORECASE | DOTALL,
+            )
+            is not None
+        ):
+            return mock_issue_transitions_response(
+                request,
+                status_code=self.response_status_code,
+                issue_count=self.search_issue_count,
+            )
+        if (
+            match(
+                pattern=r"^/rest/api/2/issue/[\w-]+/attachments$",
+                string=request.path,
+                flags=IGNORECASE | DOTALL,
+            )
+            is not None
+        ):
+            return mock_add_attachment_response(
+                request,
+                status_code=self.response_status_code,
+                issue_count=self.search_issue_count,
+            )
+        if (
+            match(
+                pattern=r"^/rest/api/2/attachment/content/[\w-]+$",
+                string=request.path,
+                flags=IGNORECASE | DOTALL,
+            )
+            is not None
+        ):
+            return mock_download_attachment_response(
+                request, status_code=self.response_status_code
+            )
+        if (
+            match(
+                pattern=r"^/rest/api/2/search(/jql)?$",
+                string=request.path,
+                flags=IGNORECASE | DOTALL,
+            )
+            is not None
+        ):
+            return mock_search_issues_response(
+                request,
+                status_code=self.response_status_code,
+                issue_count=self.search_issue_count,
+                max_results_cap=self.search_max_results,
+            )
         return None
 
 
-def mock_jira_requests(response_status_code: int = 200) -> Adapter:
+def mock_jira_requests(
+    response_status_code: int = 200,
+    search_issue_count: int = 25,
+    search_max_results: int = 100,
+) -> Adapter:
+    adapter = Adapter(False)
+    adapter.add_matcher(
+        CustomMatcherFactory(
+            response_status_code, search_issue_count, search_max_results
+        ).custom_matcher
+    )
+    return adapter
+
+
+def mock_jira_requests_with_failed_page(failed_start_at: int) -> Adapter:
+    matcher = CustomMatcherFactory().custom_matcher
+
+    def custom_matcher(request: _RequestObjectProxy) -> Optional[Response]:
+        if request.qs.get("startat", [None])[0] == str(failed_start_at):
+            return create_response(
+                request=request,
+                status_code=503,
+                reason="Service Unavailable",
+                text="page unavailable",
+            )
+        return matcher(request)
+
     adapter = Adapter(False)
-    adapter.add_matcher(CustomMatcherFactory(response_status_code).custom_matcher)
+    adapter.add_matcher(custom_matcher)
     return adapter
 
 
+def mock_jira_async_transport(response_status_code: int = 200) -> MockTransport:
+    matcher = CustomMatcherFactory(response_status_code).custom_matcher
+
+    def handler(request: HttpxRequest) -> HttpxResponse:
+        prepared_request = PreparedRequest()
+        prepared_request.prepare(
+            method=request.method,
+            url=str(request.url),
+            headers=dict(request.headers),
+            data=request.content,
+        )
+        response = matcher(_RequestObjectProxy(prepared_request))
+        if response is None:
+            return HttpxResponse(status_code=404)
+        return HttpxResponse(
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            content=response.content,
+        )
+
+    return MockTransport(handler)
+
+
 def mock_get_server_info_response(
     request: _RequestObjectProxy, status_code: int = 200
 ) -> Response:
@@ -155,13 +311,25 @@ def mock_get_myself_response(
     )
 
 
+MOCK_FIELDS_ETAG = '"fields-20230329"'
+
+
 def mock_get_all_fields_response(
     request: _RequestObjectProxy, status_code: int = 200
 ) -> Response:
+    if status_code == 200 and request.headers.get("If-None-Match") == MOCK_FIELDS_ETAG:
+        return create_response(
+            request=request,
+            status_code=304,
+            reason="Not Modified",
+            headers={"ETag": MOCK_FIELDS_ETAG},
+        )
+
     return create_response(
         request=request,
         status_code=status_code,
         reason="Bad Request" if status_code == 400 else "OK",
+        headers={"ETag": MOCK_FIELDS_ETAG},
         json=[
             {
                 "id": "customfield_14303",
@@ -367,19 +535,41 @@ def mock_get_all_projects_response(
     )
 
 
+def paginate_values(request: _RequestObjectProxy, values: list) -> dict:
+    start_at = int(request.qs.get("startat", ["0"])[0])
+    max_results = int(request.qs.get("maxresults", ["50"])[0])
+    return {
+        "maxResults": max_results,
+        "startAt": start_at,
+        "total": len(values),
+        "isLast": start_at + max_results >= len(values),
+        "values": values[start_at : start_at + max_results],
+    }
+
+
 def mock_get_project_issue_types_response(
     request: _RequestObjectProxy, status_code: int = 200
 ) -> Response:
+    # one validator per page, like the Jira metadata endpoints.
+    start_at = request.qs.get("startat", ["0"])[0]
+    max_results = request.qs.get("maxresults", ["50"])[0]
+    etag = f'"issuetypes-{start_at}-{max_results}"'
+    if status_code == 200 and request.headers.get("If-None-Match") == etag:
+        return create_response(
+            request=request,
+            status_code=304,
+            reason="Not Modified",
+            headers={"ETag": etag},
+        )
+
     return create_response(
         request=request,
         status_code=status_code,
         reason="Bad Request" if status_code == 400 else "OK",
-        json={
-            "maxResults": 50,
-            "startAt": 0,
-            "total": 7,
-            "isLast": True,
-            "values": [
+        headers={"ETag": etag},
+        json=paginate_values(
+            request,
+            [
                 {
                     "self": "https://your_jira.com/rest/api/2/issuetype/10500",
                     "id": "10500",
@@ -437,7 +627,7 @@ def mock_get_project_issue_types_response(
                     "subtask": False,
                 },
             ],
-        },
+        ),
     )
 
 
@@ -448,12 +638,9 @@ def mock_get_project_issue_fields_response(
         request=request,
         status_code=status_code,
         reason="Bad Request" if status_code == 400 else "OK",
-        json={
-            "maxResults": 50,
-            "startAt": 0,
-            "total": 5,
-            "isLast": True,
-            "values": [
+        json=paginate_values(
+            request,
+            [
                 {
                     "required": True,
                     "schema": {"type": "issuetype", "system": "issuetype"},
@@ -586,7 +773,7 @@ def mock_get_project_issue_fields_response(
                     ],
                 },
             ],
-        },
+        ),
     )
 
 
@@ -605,6 +792,449 @@ def mock_create_issue_response(
     )
 
 
+def mock_issue_updated(index: int) -> str:
+    # one second apart, later issues were updated later.
+    return f"2023-03-29T{index // 3600 % 24:02d}:{index // 60 % 60:02d}:{index % 60:02d}.000-0700"
+
+
+def find_mock_issues_updated_since(jql: str, issue_count: int) -> List[int]:
+    # JQL dates have minute precision and are in the time zone of the user,
+    # Asia/Shanghai for the mock myself response.
+    updated_match = search(r'updated >= "(\d{4}/\d{2}/\d{2} \d{2}:\d{2})"', jql)
+    if updated_match is None:
+        return list(range(issue_count))
+    since = datetime.strptime(updated_match.group(1), "%Y/%m/%d %H:%M").replace(
+        tzinfo=ZoneInfo("Asia/Shanghai")
+    )
+    return [
+        index
+        for index in range(issue_count)
+        if datetime.strptime(mock_issue_updated(index), "%Y-%m-%dT%H:%M:%S.%f%z")
+        >= since
+    ]
+
+
+def mock_issue(index: int, fields: Optional[list] = None) -> dict:
+    issue_id = str(100000 + index)
+    all_fields = {
+        "summary": f"Mock issue {index}",
+        "description": "This is a mock issue for the search API. " * 8,
+        "issuetype": {"id": "10002", "name": "Story", "subtask": False},
+        "project": {"id": "10000", "key": "SAND", "name": "Sandbox"},
+        "status": {"id": "1", "name": "To Do"},
+        "priority": {"id": "3", "name": "Medium"},
+        "labels": ["mock", f"batch-{index // 100}"],
+        "created": "2023-03-29T00:15:35.205-0700",
+        "updated": mock_issue_updated(index),
+    }
+    return {
+        "expand": "operations,versionedRepresentations,editmeta,changelog,renderedFields",
+        "id": issue_id,
+        "self": f"https://your_jira.com/rest/api/2/issue/{issue_id}",
+        "key": f"SAND-{index + 1}",
+        "fields": (
+            {key: value for key, value in all_fields.items() if key in fields}
+            if fields
+            else all_fields
+        ),
+    }
+
+
+def find_mock_issue_index(key_or_id: str, issue_count: int) -> Optional[int]:
+    # SAND-1 is index 0 and has the id 100000.
+    key_match = match(r"^SAND-(\d+)$", key_or_id, flags=IGNORECASE)
+    if key_match is not None:
+        index = int(key_match.group(1)) - 1
+    elif key_or_id.isdigit():
+        index = int(key_or_id) - 100000
+    else:
+        return None
+    return index if 0 <= index < issue_count else None
+
+
+def mock_issue_not_found_response(request: _RequestObjectProxy, text: str) -> Response:
+    return create_response(
+        request=request,
+        status_code=404 if "search" not in request.path else 400,
+        reason="Not Found" if "search" not in request.path else "Bad Request",
+        json={"errorMessages": [text], "errors": {}},
+    )
+
+
+def mock_get_issue_response(
+    request: _RequestObjectProxy, status_code: int = 200, issue_count: int = 25
+) -> Response:
+    fields = (
+        request.qs.get("fields", [""])[0].split(",") if "fields" in request.qs else None
+    )
+    index = find_mock_issue_index(request.path.split("/")[-1], issue_count)
+    if status_code == 200 and index is None:
+        return mock_issue_not_found_response(
+            request, "Issue does not exist or you do not have permission to see it."
+        )
+
+    return create_response(
+        request=request,
+        status_code=status_code,
+        reason="Bad Request" if status_code == 400 else "OK",
+        json=(
+            mock_issue(index, None if fields == ["*all"] else fields)
+            if index is not None
+            else {}
+        ),
+    )
+
+
+def mock_update_issue_response(
+    request: _RequestObjectProxy, status_code: int = 204, issue_count: int = 25
+) -> Response:
+    index = find_mock_issue_index(request.path.split("/")[-1], issue_count)
+    if index is None:
+        return mock_issue_not_found_response(
+            request, "Issue does not exist or you do not have permission to see it."
+        )
+    if status_code >= 400 or not request.json().get("fields", None):
+        return create_response(
+            request=request,
+            status_code=400,
+            reason="Bad Request",
+            json={"errorMessages": ["No fields to update."], "errors": {}},
+        )
+
+    return create_response(request=request, status_code=204, reason="No Content")
+
+
+def mock_transitions(index: int) -> list:
+    # every tenth issue misses the Done transition, like a workflow condition
+    # would hide it.
+    transitions = [
+        {
+            "id": "11",
+            "name": "Start Progress",
+            "to": {"id": "3", "name": "In Progress"},
+            "hasScreen": False,
+            "isConditional": False,
+        },
+        {
+            "id": "31",
+            "name": "Done",
+            "to": {"id": "10001", "name": "Done"},
+            "hasScreen": False,
+            "isConditional": True,
+        },
+    ]
+    return transitions if index % 10 != 9 else transitions[:1]
+
+
+def mock_issue_transitions_response(
+    request: _RequestObjectProxy, status_code: int = 200, issue_count: int = 25
+) -> Response:
+    index = find_mock_issue_index(request.path.split("/")[-2], issue_count)
+    if index is None:
+        return mock_issue_not_found_response(
+            request, "Issue does not exist or you do not have permission to see it."
+        )
+
+    transitions = mock_transitions(index)
+    if request.method == "GET":
+        return create_response(
+            request=request,
+            status_code=status_code,
+            reason="Bad Request" if status_code == 400 else "OK",
+            json={"expand": "transitions", "transitions": transitions},
+        )
+
+    transition_id = request.json().get("transition", {}).get("id", None)
+    if status_code >= 400 or transition_id not in [t["id"] for t in transitions]:
+        return create_response(
+            request=request,
+            status_code=400,
+            reason="Bad Request",
+            json={
+                "errorMessages": [
+                    f"Transition id '{transition_id}' is not valid for this issue."
+                ],
+                "errors": {},
+            },
+        )
+    return create_response(request=request, status_code=204, reason="No Content")
+
+
+def mock_add_attachment_response(
+    request: _RequestObjectProxy, status_code: int = 200, issue_count: int = 25
+) -> Response:
+    # reads the multipart body chunk by chunk like a server would, so uploads of
+    # any size can be checked without holding them in memory.
+    index = find_mock_issue_index(request.path.split("/")[-2], issue_count)
+    if index is None:
+        return mock_issue_not_found_response(
+            request, "Issue does not exist or you do not have permission to see it."
+        )
+
+    boundary = request.headers.get("Content-Type", "").partition("boundary=")[2]
+    body = request.body
+    reader = BytesIO(body) if isinstance(body, bytes) else body
+    head = b""
+    total = 0
+    while b"\r\n\r\n" not in head:
+        chunk = reader.read(64 * 1024)
+        if not chunk:
+            break
+        head += chunk
+        total += len(chunk)
+    while True:
+        chunk = reader.read(1024 * 1024)
+        if not chunk:
+            break
+        total += len(chunk)
+
+    part_headers = head.partition(b"\r\n\r\n")[0].decode("utf-8")
+    filename_match = search(r'filename="((?:[^"\\]|\\.)*)"', part_headers)
+    type_match = search(r"Content-Type: (\S+)", part_headers)
+    tail = f"\r\n--{boundary}--\r\n".encode("utf-8")
+    size = total - len(part_headers.encode("utf-8")) - 4 - len(tail)
+    content_length = request.headers.get("Content-Length", None)
+    if (
+        status_code >= 400
+        or not boundary
+        or filename_match is None
+        or (content_length is not None and int(content_length) != total)
+    ):
+        return create_response(
+            request=request,
+            status_code=400,
+            reason="Bad Request",
+            json={"errorMessages": ["Invalid multipart body."], "errors": {}},
+        )
+
+    return create_response(
+        request=request,
+        status_code=200,
+        reason="OK",
+        json=[
+            {
+                "self": "https://your_jira.com/rest/api/2/attachment/10100",
+                "id": "10100",
+                "filename": filename_match.group(1).replace('\\"', '"'),
+                "size": size,
+                "mimeType": type_match.group(1) if type_match else "",
+                "content": "https://your_jira.com/rest/api/2/attachment/content/10100",
+            }
+        ],
+    )
+
+
+# byte i of every mock attachment is i % 256.
+_MOCK_ATTACHMENT_PATTERN = bytes(range(256)) * 4097
+
+
+class MockAttachmentContent(RawIOBase):
+    # generates the content while it is read, multi hundred MB downloads do
+    # not allocate their size.
+
+    def __init__(self, start: int, end: int) -> None:
+        self.position = start
+        self.end = end
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        size = min(len(buffer), self.end - self.position, 1024 * 1024)
+        if size <= 0:
+            return 0
+        offset = self.position % 256
+        buffer[:size] = _MOCK_ATTACHMENT_PATTERN[offset : offset + size]
+        self.position += size
+        return size
+
+
+def mock_attachment_bytes(start: int, end: int) -> bytes:
+    return MockAttachmentContent(start, end).read()
+
+
+def mock_download_attachment_response(
+    request: _RequestObjectProxy, status_code: int = 200
+) -> Response:
+    # the id is the size of the attachment, "norange-<size>" ignores Range.
+    attachment_id = request.path.split("/")[-1]
+    ignore_range = attachment_id.startswith("norange-")
+    size_text = attachment_id.removeprefix("norange-")
+    if status_code >= 400 or not size_text.isdigit():
+        return mock_issue_not_found_response(
+            request, "The attachment does not exist or you do not have permission."
+        )
+
+    size = int(size_text)
+    start, end = 0, size - 1
+    range_match = match(r"^bytes=(\d*)-(\d*)$", request.headers.get("Range", ""))
+    if range_match is not None and not ignore_range:
+        start = int(range_match.group(1) or 0)
+        end = min(int(range_match.group(2) or size - 1), size - 1)
+        if start > end:
+            return create_response(
+                request=request,
+                status_code=416,
+                reason="Range Not Satisfiable",
+                headers={"Content-Range": f"bytes */{size}"},
+            )
+        return create_response(
+            request=request,
+            status_code=206,
+            reason="Partial Content",
+            headers={
+                "Content-Range": f"bytes {start}-{end}/{size}",
+                "Content-Length": str(end + 1 - start),
+            },
+            body=MockAttachmentContent(start, end + 1),
+        )
+
+    return create_response(
+        request=request,
+        status_code=200,
+        reason="OK",
+        headers={"Content-Length": str(size)},
+        body=MockAttachmentContent(0, size),
+    )
+
+
+def mock_search_issues_by_keys_response(
+    request: _RequestObjectProxy,
+    keys: str,
+    issue_count: int,
+    start_at: int,
+    max_results: int,
+) -> Response:
+    # like Jira, one unknown key fails the whole key in (...) search unless
+    # validateQuery is warn.
+    indexes = []
+    warnings = []
+    for key in keys.split(","):
+        index = find_mock_issue_index(key.strip(), issue_count)
+        if index is not None:
+            indexes.append(index)
+            continue
+        message = (
+            f"An issue with key '{key.strip().upper()}' does not exist for field 'key'."
+        )
+        if request.qs.get("validatequery", ["strict"])[0] != "warn":
+            return mock_issue_not_found_response(request, message)
+        warnings.append(message)
+
+    fields = request.qs.get("fields", [""])[0].split(",")
+    indexes = sorted(set(indexes), reverse=True)
+    issues = [
+        mock_issue(index, None if fields == ["*all"] else fields)
+        for index in indexes[start_at : start_at + max_results]
+    ]
+    return create_response(
+        request=request,
+        status_code=200,
+        reason="OK",
+        json={
+            "startAt": start_at,
+            "maxResults": max_results,
+            "total": len(indexes),
+            "issues": issues,
+            "warningMessages": warnings,
+        },
+    )
+
+
+def mock_search_issues_response(
+    request: _RequestObjectProxy,
+    status_code: int = 200,
+    issue_count: int = 25,
+    max_results_cap: int = 100,
+) -> Response:
+    # the same handler serves both startAt and nextPageToken pagination,
+    # the token is simply the start index of the next page. Like Jira, larger
+    # maxResults are capped.
+    max_results = min(int(request.qs.get("maxresults", ["50"])[0]), max_results_cap)
+    start_at = int(request.qs.get("nextpagetoken", request.qs.get("startat", ["0"]))[0])
+    fields = (
+        request.qs.get("fields", [""])[0].split(",") if "fields" in request.qs else None
+    )
+
+    jql = request.qs.get("jql", [""])[0]
+    key_match = match(r"^key in \((.*)\)$", jql, flags=IGNORECASE)
+    if status_code == 200 and key_match is not None:
+        return mock_search_issues_by_keys_response(
+            request, key_match.group(1), issue_count, start_at, max_results
+        )
+
+    indexes = find_mock_issues_updated_since(jql, issue_count)
+    end_at = min(start_at + max_results, len(indexes))
+    body: dict = {
+        "issues": [
+            mock_issue(index, None if fields == ["*all"] else fields)
+            for index in indexes[start_at:end_at]
+        ],
+        "isLast": end_at >= len(indexes),
+    }
+    if match(pattern=r".*/jql$", string=request.path) is not None:
+        if end_at < len(indexes):
+            body["nextPageToken"] = str(end_at)
+    else:
+        body.update(
+            {"startAt": start_at, "maxResults": max_results, "total": len(indexes)}
+        )
+
+    return create_response(
+        request=request,
+        status_code=status_code,
+        reason="Bad Request" if status_code == 400 else "OK",
+        json=body,
+    )
+
+
+def mock_create_issues_response(
+    request: _RequestObjectProxy, status_code: int = 201
+) -> Response:
+    if status_code >= 400:
+        return create_response(
+            request=request,
+            status_code=status_code,
+            reason="Bad Request" if status_code == 400 else "Error",
+            json={"errorMessages": ["bulk create failed"], "errors": {}},
+        )
+
+    # elements without a summary fail, the others are created.
+    issues: list = []
+    errors: list = []
+    for index, issue_update in enumerate(request.json().get("issueUpdates", [])):
+        summary = issue_update.get("fields", {}).get("summary", None)
+        if summary:
+            issue_id = str(1252056 + len(issues) + len(errors) * 1000)
+            issues.append(
+                {
+                    "id": issue_id,
+                    "key": f"SD-{summary.split()[-1]}",
+                    "self": f"https://your_jira.com/rest/api/2/issue/{issue_id}",
+                }
+            )
+        else:
+            errors.append(
+                {
+                    "status": 400,
+                    "elementErrors": {
+                        "errorMessages": [],
+                        "errors": {
+                            "summary": "You must specify a summary of the issue."
+                        },
+                    },
+                    "failedElementNumber": index,
+                }
+            )
+
+    return create_response(
+        request=request,
+        status_code=201 if issues else 400,
+        reason="Created" if issues else "Bad Request",
+        json={"issues": issues, "errors": errors},
+    )
+
+
 def mock_jira_requests_with_error_response() -> Adapter:
     adapter = Adapter(False)
     adapter.add_matcher(custom_matcher_with_error_response)
@@ -0,0 +1,65 @@
+import subprocess
+import sys
+from typing import List
+
+# cumulative import time of ``import jira_cloud_api`` in milliseconds, the
+# package itself only defines the lazy attribute table.
+IMPORT_TIME_BUDGET_MS = 50
+
+HEAVY_MODULES = ["requests", "urllib3", "dateparser", "httpx", "importlib.metadata"]
+
+
+def run_python(code: str, *args: str) -> "subprocess.CompletedProcess[str]":
+    return subprocess.run(
+        [sys.executable, *args, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def get_import_time_ms(module: str) -> float:
+    for line in run_python(f"import {module}", "-X", "importtime").stderr.splitlines():
+        columns = line.split("|")
+        if len(columns) == 3 and columns[2].strip() == module:
+            return int(columns[1]) / 1000
+    raise AssertionError(f"{module} is missing in the importtime output")
+
+
+def get_loaded_modules(code: str) -> List[str]:
+    output: str = run_python(f"{code}; import sys; print(' '.join(sys.modules))").stdout
+    return output.split()
+
+
+def test_package_import_time_budget():
+    # best of a few runs, the first one may include cold .pyc compilation.
+    import_time = min(get_import_time_ms("jira_cloud_api") for _ in range(3))
+
+    assert import_time < IMPORT_TIME_BUDGET_MS
+
+
+def test_package_import_defers_heavy_modules():
+    loaded_modules = get_loaded_modules("import jira_cloud_api")
+
+    for module in HEAVY_MODULES + ["jira_cloud_api.jira_api"]:
+        assert module not in loaded_modules
+
+
+def test_api_import_defers_transport_dependencies():
+    loaded_modules = get_loaded_modules("from jira_cloud_api import JiraApi")
+
+    assert "jira_cloud_api.jira_api" in loaded_modules
+    for module in ["requests", "dateparser", "httpx"]:
+        assert module not in loaded_modules
+
+
+def test_lazy_attributes():
+    # pylint: disable=import-outside-toplevel
+    import jira_cloud_api
+    from jira_cloud_api.jira_api import JiraApi
+
+    assert jira_cloud_api.JiraApi is JiraApi
+    assert jira_cloud_api.__version__
+    assert set(jira_cloud_api.__all__) <= set(dir(jira_cloud_api))
+    for name in jira_cloud_api.__all__:
+        assert getattr(jira_cloud_api, name) is not None
@@ -1,13 +1,30 @@
+import sys
+from dataclasses import replace
+from functools import partial
+from time import sleep
+from unittest.mock import patch
+
 import pytest
 from requests_mock import Mocker
 
-from jira_cloud_api.jira_api import JiraApi, JiraApiOptions
+from jira_cloud_api.jira_api import JiraApi, JiraApiError, JiraApiOptions
+from jira_cloud_api.jira_cache import FIELDS_ENDPOINT, PROJECT_DETAIL_ENDPOINT
 from jira_cloud_api.jira_request import (
     CreateIssueRequest,
     GetProjectIssueFieldsRequest,
     GetProjectIssueTypesRequest,
+    SearchIssuesRequest,
+    UpdateIssueRequest,
+)
+from jira_cloud_api.jira_retry import RetryPolicy
+from jira_cloud_api.jira_transport import HttpxTransport, RequestsTransport
+from tests.mock_jira_server import (
+    MOCK_FIELDS_ETAG,
+    mock_jira_async_transport,
+    mock_jira_requests,
+    mock_jira_requests_with_error_response,
+    mock_jira_requests_with_failed_page,
 )
-from tests.mock_jira_server import mock_jira_requests
 
 DEFAULT_jira_cloud_api_OPTIONS = JiraApiOptions(
     url="https://localhost",
@@ -100,6 +117,88 @@ def test_get_project_issue_types():
         assert respose is not None
 
 
+def test_get_project_issue_types_query_all_in_order():
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests(),
+    ):
+        request = GetProjectIssueTypesRequest(
+            project_id_or_key="SAND", start_at=0, max_results=2, query_all=True
+        )
+        response = jira_cloud_api.get_project_issue_types(request)
+
+        assert response.status_code == 200
+        assert [issue_type.id for issue_type in response.issue_types] == [
+            "10500",
+            "10700",
+            "11",
+            "11000",
+            "12500",
+            "14",
+            "7",
+        ]
+        assert request.start_at == 0
+
+
+def test_get_project_issue_types_query_all_with_failed_page():
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests_with_failed_page(failed_start_at=4),
+    ):
+        response = jira_cloud_api.get_project_issue_types(
+            GetProjectIssueTypesRequest(
+                project_id_or_key="SAND", start_at=0, max_results=2, query_all=True
+            )
+        )
+
+        assert response.status_code == 503
+        assert response.error_text == "page unavailable"
+        assert len(response.issue_types) == 5
+
+
+def test_iter_project_issue_types():
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests(),
+    ) as mocker:
+        issue_types = jira_cloud_api.iter_project_issue_types(
+            GetProjectIssueTypesRequest(project_id_or_key="SAND", max_results=3)
+        )
+
+        first_issue_type = next(issue_types)
+
+        assert first_issue_type.id == "10500"
+        assert mocker.call_count == 1
+        assert [issue_type.id for issue_type in issue_types] == [
+            "10700",
+            "11",
+            "11000",
+            "12500",
+            "14",
+            "7",
+        ]
+        assert mocker.call_count == 3
+
+
+def test_iter_project_issue_types_with_failed_page():
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests_with_failed_page(failed_start_at=3),
+    ):
+        issue_types = jira_cloud_api.iter_project_issue_types(
+            GetProjectIssueTypesRequest(project_id_or_key="SAND", max_results=3)
+        )
+
+        with pytest.raises(JiraApiError) as e:
+            _ = list(issue_types)
+
+        assert e.value.status_code == 503
+
+
 def test_get_all_fields():
     with Mocker(
         real_http=False,
@@ -130,6 +229,49 @@ def test_get_project_issue_fields():
         assert respose is not None
 
 
+def test_get_project_issue_fields_query_all_in_order():
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests(),
+    ):
+        response = jira_cloud_api.get_project_issue_fields(
+            GetProjectIssueFieldsRequest(
+                project_id_or_key="SAND",
+                issue_type_id="10002",
+                max_results=4,
+                query_all=True,
+            )
+        )
+
+        assert response.status_code == 200
+        assert [field.field_id for field in response.fields] == [
+            "issuetype",
+            "customfield_11700",
+            "customfield_12426",
+            "summary",
+            "description",
+            "MyValue",
+        ]
+
+
+def test_iter_project_issue_fields():
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests(),
+    ):
+        fields = list(
+            jira_cloud_api.iter_project_issue_fields(
+                GetProjectIssueFieldsRequest(
+                    project_id_or_key="SAND", issue_type_id="10002", max_results=1
+                )
+            )
+        )
+
+        assert len(fields) == 6
+
+
 def test_create_issue():
     with Mocker(
         real_http=False,
@@ -149,3 +291,735 @@ def test_create_issue():
         )
 
         assert respose is not None
+
+
+def test_jira_cloud_api_context_manager():
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests(),
+    ):
+        with JiraApi(DEFAULT_jira_cloud_api_OPTIONS) as api:
+            first_response = api.get_myself()
+            second_response = api.get_server_info()
+
+        assert first_response.status_code == 200
+        assert second_response.status_code == 200
+
+        # the transport is created again on demand after close.
+        assert api.get_myself().status_code == 200
+        api.close()
+
+
+def test_jira_cloud_api_http2_transport():
+    options = JiraApiOptions(
+        url="https://localhost",
+        access_token="access_token",
+        http2=True,
+        keep_alive=False,
+        pool_connections=2,
+        pool_maxsize=4,
+    )
+    create_transport = partial(HttpxTransport, transport=mock_jira_async_transport())
+
+    with patch(
+        "jira_cloud_api.jira_api.HttpxTransport", side_effect=create_transport
+    ) as transport_type:
+        with JiraApi(options) as api:
+            response = api.get_myself()
+
+    transport_type.assert_called_once()
+    assert response.status_code == 200
+    assert response.time_zone == "Asia/Shanghai"
+
+
+def test_jira_cloud_api_http2_transport_without_h2():
+    # a None entry makes ``import h2`` fail.
+    with patch.dict(sys.modules, {"h2": None}):
+        with pytest.raises(ValueError, match="jira-cloud-api\\[http2\\]"):
+            HttpxTransport(
+                headers={},
+                pool_connections=1,
+                pool_maxsize=1,
+                keep_alive=True,
+                ssl_verify=True,
+            )
+
+
+def test_search_issues():
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests(search_issue_count=25),
+    ) as mocker:
+        issues = jira_cloud_api.search_issues(
+            SearchIssuesRequest(jql="project = SAND", max_results=10)
+        )
+
+        first_issue = next(issues)
+
+        assert first_issue.key == "SAND-1"
+        assert mocker.call_count == 1
+        assert len(list(issues)) == 24
+        assert mocker.call_count == 3
+
+
+def test_search_issues_with_fields_projection():
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests(),
+    ) as mocker:
+        issues = list(
+            jira_cloud_api.search_issues(
+                SearchIssuesRequest(
+                    jql="project = SAND",
+                    fields=["summary", "updated"],
+                    expand=["names"],
+                )
+            )
+        )
+
+        assert len(issues) == 25
+        assert set(issues[0].fields.keys()) == {"summary", "updated"}
+        assert mocker.last_request.qs["fields"] == ["summary,updated"]
+        assert mocker.last_request.qs["expand"] == ["names"]
+
+
+def test_search_issues_token_paginated():
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests(search_issue_count=120),
+    ) as mocker:
+        issues = list(
+            jira_cloud_api.search_issues(
+                SearchIssuesRequest(
+                    jql="project = SAND", max_results=50, token_paginated=True
+                )
+            )
+        )
+
+        assert [issue.key for issue in issues[:2]] == ["SAND-1", "SAND-2"]
+        assert len(issues) == 120
+        assert mocker.call_count == 3
+
+
+def test_search_issues_failed():
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests_with_error_response(),
+    ):
+        with pytest.raises(JiraApiError) as e:
+            _ = list(jira_cloud_api.search_issues(SearchIssuesRequest(jql="key = ')")))
+
+        assert e.value.status_code == 400
+        assert "Error in the JQL Query" in str(e.value.error_text)
+
+
+def test_get_issue():
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests(),
+    ) as mocker:
+        response = jira_cloud_api.get_issue(
+            "SAND-2", fields=["summary", "status"], expand=["names"]
+        )
+
+        assert response.status_code == 200
+        assert response.key == "SAND-2"
+        assert response.id == "100001"
+        assert set(response.fields.keys()) == {"summary", "status"}
+        assert mocker.last_request.qs["expand"] == ["names"]
+
+        response = jira_cloud_api.get_issue("SAND-999")
+
+        assert response.status_code == 404
+        assert "does not exist" in str(response.error_text)
+
+
+def test_get_issues_folds_keys_into_searches():
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests(search_issue_count=250),
+    ) as mocker:
+        keys = [f"SAND-{i}" for i in range(150, 0, -1)] + ["SAND-3", "100001"]
+        responses = jira_cloud_api.get_issues(keys, fields=["summary"])
+
+        assert [response.key for response in responses] == keys[:-1] + ["SAND-2"]
+        assert all(response.status_code == 200 for response in responses)
+        assert set(responses[0].fields.keys()) == {"summary"}
+        # 151 distinct keys, two searches of at most 100 keys.
+        assert mocker.call_count == 2
+
+
+def test_get_issues_pages_capped_searches():
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests(search_issue_count=250, search_max_results=40),
+    ) as mocker:
+        keys = [f"SAND-{i}" for i in range(1, 151)]
+        responses = jira_cloud_api.get_issues(keys)
+
+        assert [response.key for response in responses] == keys
+        assert all(response.status_code == 200 for response in responses)
+        # chunks of 100 and 50 keys, read in pages of 40 issues, no single gets.
+        assert mocker.call_count == 5
+        assert all("search" in request.path for request in mocker.request_history)
+
+
+def test_get_issues_with_unknown_keys():
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests(search_issue_count=25),
+    ) as mocker:
+        responses = jira_cloud_api.get_issues(
+            ["SAND-1", "SAND-999", "NOTAKEY", "SAND-20", "SAND-2"], chunk_size=2
+        )
+
+        assert [response.status_code for response in responses] == [
+            200,
+            404,
+            404,
+            200,
+            200,
+        ]
+        assert responses[4].key == "SAND-2"
+        assert "does not exist" in str(responses[1].error_text)
+        # 2 searches, then single gets for the unknown and unsearchable keys.
+        assert mocker.call_count == 4
+        assert mocker.request_history[0].qs["validatequery"] == ["warn"]
+
+
+def test_update_issue_sends_changed_fields_only():
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests(),
+    ) as mocker:
+        previous_fields = jira_cloud_api.get_issue("SAND-1").fields
+        response = jira_cloud_api.update_issue(
+            UpdateIssueRequest(
+                key="SAND-1",
+                fields={
+                    "summary": "Mock issue 0",
+                    "priority.name": "High",
+                    "project.key": "SAND",
+                    "labels": ["mock", "batch-0"],
+                },
+                previous_fields=previous_fields,
+            ),
+            notify_users=False,
+        )
+
+        assert response.status_code == 204
+        assert response.updated_fields == ["priority"]
+        assert mocker.last_request.method == "PUT"
+        assert mocker.last_request.json() == {"fields": {"priority": {"name": "High"}}}
+        assert mocker.last_request.qs["notifyusers"] == ["false"]
+
+        call_count = mocker.call_count
+        response = jira_cloud_api.update_issue(
+            UpdateIssueRequest(
+                key="SAND-1",
+                fields={"priority.name": "Medium"},
+                previous_fields={"priority.name": "Medium"},
+            )
+        )
+
+        assert response.status_code == 204
+        assert not response.updated_fields
+        assert mocker.call_count == call_count
+
+
+def test_update_issues():
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests(),
+    ) as mocker:
+        responses = jira_cloud_api.update_issues(
+            [
+                UpdateIssueRequest(key=f"SAND-{i}", fields={"summary": f"Issue {i}"})
+                for i in [1, 999, 2]
+            ]
+        )
+
+        assert [response.key for response in responses] == [
+            "SAND-1",
+            "SAND-999",
+            "SAND-2",
+        ]
+        assert [response.status_code for response in responses] == [204, 404, 204]
+        assert "does not exist" in str(responses[1].error_text)
+        assert mocker.call_count == 3
+        assert all("notifyusers" not in r.qs for r in mocker.request_history)
+
+
+def test_update_issues_share_one_transport():
+    def create_transport(**kwargs):
+        # widen the window in which concurrent workers could race.
+        sleep(0.05)
+        return RequestsTransport(**kwargs)
+
+    with (
+        Mocker(real_http=False, case_sensitive=False, adapter=mock_jira_requests()),
+        patch(
+            "jira_cloud_api.jira_api.RequestsTransport", side_effect=create_transport
+        ) as transport_type,
+    ):
+        with JiraApi(DEFAULT_jira_cloud_api_OPTIONS) as api:
+            api.update_issues(
+                [
+                    UpdateIssueRequest(key=f"SAND-{i}", fields={"summary": "Issue"})
+                    for i in range(1, 9)
+                ]
+            )
+
+        assert transport_type.call_count == 1
+
+
+def test_transition_issues_reuses_transitions():
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests(),
+    ) as mocker:
+        keys = [f"SAND-{i}" for i in range(1, 13)] + ["SAND-999", "SAND-1"]
+        responses = jira_cloud_api.transition_issues(keys, "done")
+
+        assert [response.key for response in responses] == keys
+        assert [response.status_code for response in responses] == (
+            [204] * 9 + [400] + [204] * 2 + [404, 204]
+        )
+        assert responses[0].transition_id == "31"
+        assert "not valid" in str(responses[9].error_text)
+        assert "does not exist" in str(responses[12].error_text)
+
+        methods = [request.method for request in mocker.request_history]
+        # search, one shared transitions read, 12 transitions, the fallback
+        # read of SAND-10 and the single get of the unknown key.
+        assert methods.count("POST") == 12
+        assert methods.count("GET") == 4
+
+
+def test_transition_issues_skips_issues_in_target_status():
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests(),
+    ) as mocker:
+        responses = jira_cloud_api.transition_issues(["SAND-1", "SAND-2"], "To Do")
+
+        assert [response.status_code for response in responses] == [204, 204]
+        assert [response.transition_id for response in responses] == [None, None]
+        assert mocker.call_count == 1
+
+        response = jira_cloud_api.transition_issues(["SAND-1"], "Closed")[0]
+
+        assert response.status_code == 0
+        assert "No transition" in str(response.error_text)
+
+
+def test_create_issues():
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests(),
+    ) as mocker:
+        requests = [
+            CreateIssueRequest(
+                fields=(
+                    {"project.key": "SAND", "summary": f"Issue {i}"}
+                    if i % 7
+                    else {"project.key": "SAND"}
+                )
+            )
+            for i in range(120)
+        ]
+
+        responses = jira_cloud_api.create_issues(requests)
+
+        assert mocker.call_count == 3
+        assert len(responses) == 120
+        for i, response in enumerate(responses):
+            if i % 7:
+                assert response.status_code == 201
+                assert response.key == f"SD-{i}"
+            else:
+                assert response.status_code == 400
+                assert "You must specify a summary" in str(response.error_text)
+
+
+def test_create_issues_concurrently():
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests(),
+    ) as mocker:
+        responses = jira_cloud_api.create_issues(
+            [
+                CreateIssueRequest(
+                    fields={"project.key": "SAND", "summary": f"Issue {i}"}
+                )
+                for i in range(1, 26)
+            ],
+            chunk_size=5,
+            concurrent=True,
+        )
+
+        assert mocker.call_count == 5
+        assert [response.key for response in responses] == [
+            f"SD-{i}" for i in range(1, 26)
+        ]
+
+
+def test_create_issues_failed():
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests(response_status_code=500),
+    ):
+        responses = jira_cloud_api.create_issues(
+            [
+                CreateIssueRequest(fields={"project.key": "SAND", "summary": "Issue"})
+                for _ in range(3)
+            ]
+        )
+
+        assert [response.status_code for response in responses] == [500, 500, 500]
+        assert all("bulk create failed" in str(r.error_text) for r in responses)
+
+
+def test_metadata_cache():
+    api = JiraApi(
+        JiraApiOptions(
+            url="https://localhost",
+            access_token="access_token",
+            cache_enabled=True,
+            cache_ttls={PROJECT_DETAIL_ENDPOINT: 0},
+        )
+    )
+
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests(),
+    ) as mocker:
+        first_response = api.get_all_fields()
+        second_response = api.get_all_fields()
+
+        assert second_response is first_response
+        assert mocker.call_count == 1
+
+        request = GetProjectIssueFieldsRequest(
+            project_id_or_key="SAND", issue_type_id="10002", query_all=True
+        )
+        api.get_project_issue_fields(request)
+        api.get_project_issue_fields(request)
+
+        assert mocker.call_count == 2
+
+        # a TTL of 0 disables caching for the endpoint.
+        api.get_project_detail("SAND")
+        api.get_project_detail("SAND")
+
+        assert mocker.call_count == 4
+
+        assert api.metadata_cache is not None
+        api.metadata_cache.invalidate(FIELDS_ENDPOINT)
+        api.get_all_fields()
+
+        assert mocker.call_count == 5
+        assert api.metadata_cache.hits == 2
+        assert api.metadata_cache.misses == 5
+
+
+def test_metadata_cache_does_not_keep_failed_responses():
+    api = JiraApi(
+        JiraApiOptions(
+            url="https://localhost",
+            access_token="access_token",
+            cache_enabled=True,
+        )
+    )
+
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests(response_status_code=400),
+    ) as mocker:
+        api.get_all_projects()
+        api.get_all_projects()
+
+        assert mocker.call_count == 2
+
+
+def test_metadata_cache_does_not_keep_undecodable_responses():
+    api = JiraApi(
+        JiraApiOptions(
+            url="https://localhost",
+            access_token="access_token",
+            cache_enabled=True,
+        )
+    )
+
+    with Mocker(real_http=False) as mocker:
+        mocker.get("https://localhost/rest/api/2/field", content=b'[{"id": "sum')
+
+        response = api.get_all_fields()
+
+        assert response.status_code == 0
+        assert response.error_text
+        assert api.get_all_fields().status_code == 0
+        assert mocker.call_count == 2
+
+
+def test_conditional_requests():
+    api = JiraApi(
+        JiraApiOptions(
+            url="https://localhost",
+            access_token="access_token",
+            conditional_requests=True,
+        )
+    )
+
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests(),
+    ) as mocker:
+        first_response = api.get_all_fields()
+        second_response = api.get_all_fields()
+
+        assert "If-None-Match" not in mocker.request_history[0].headers
+        assert mocker.request_history[1].headers["If-None-Match"] == MOCK_FIELDS_ETAG
+        assert second_response is first_response
+        assert second_response.status_code == 200
+        assert api.conditional_request_cache is not None
+        assert api.conditional_request_cache.not_modified == 1
+
+        # responses without validators are fetched in full every time.
+        api.get_all_projects()
+        api.get_all_projects()
+
+        assert "If-None-Match" not in mocker.last_request.headers
+
+
+def test_conditional_requests_query_all():
+    api = JiraApi(
+        JiraApiOptions(
+            url="https://localhost",
+            access_token="access_token",
+            conditional_requests=True,
+        )
+    )
+    request = GetProjectIssueTypesRequest(
+        project_id_or_key="SAND", max_results=2, query_all=True
+    )
+
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests(),
+    ) as mocker:
+        responses = [api.get_project_issue_types(request) for _ in range(3)]
+
+        # every page is revalidated, the cached first page is not merged into.
+        assert mocker.call_count == 12
+        assert all(
+            "If-None-Match" in request.headers for request in mocker.request_history[4:]
+        )
+
+    ids = [[issue_type.id for issue_type in r.issue_types] for r in responses]
+    assert len(ids[0]) == 7
+    assert ids == [ids[0]] * 3
+
+
+def test_disk_cache_warm_start(tmp_path):
+    options = JiraApiOptions(
+        url="https://localhost",
+        access_token="access_token",
+        disk_cache_dir=str(tmp_path),
+    )
+
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests(),
+    ) as mocker:
+        with JiraApi(options) as cold_api:
+            cold_fields = cold_api.get_all_fields()
+            cold_api.get_project_detail("SAND")
+
+        assert mocker.call_count == 2
+
+        with JiraApi(options) as warm_api:
+            warm_fields = warm_api.get_all_fields()
+            warm_project = warm_api.get_project_detail("SAND")
+
+        assert mocker.call_count == 2
+        assert [field.id for field in warm_fields.fields] == [
+            field.id for field in cold_fields.fields
+        ]
+        assert warm_project.project is not None
+
+        # another credential on the same site has its own entries.
+        with JiraApi(replace(options, access_token="other_token")) as other_api:
+            other_api.get_all_fields()
+
+        assert mocker.call_count == 3
+
+
+def test_invalidate_drops_memory_disk_and_validators(tmp_path):
+    options = JiraApiOptions(
+        url="https://localhost",
+        access_token="access_token",
+        cache_enabled=True,
+        disk_cache_dir=str(tmp_path),
+        conditional_requests=True,
+    )
+
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests(),
+    ) as mocker:
+        with JiraApi(options) as api:
+            api.get_all_fields()
+            api.invalidate(FIELDS_ENDPOINT)
+            response = api.get_all_fields()
+
+            assert response.status_code == 200
+            assert mocker.call_count == 2
+            assert "If-None-Match" not in mocker.last_request.headers
+
+            api.invalidate()
+
+        # nothing is left on disk for a new process either.
+        with JiraApi(options) as api:
+            api.get_all_fields()
+
+        assert mocker.call_count == 3
+        assert "If-None-Match" not in mocker.last_request.headers
+
+
+def test_disk_cache_revalidates_expired_entries(tmp_path):
+    options = JiraApiOptions(
+        url="https://localhost",
+        access_token="access_token",
+        disk_cache_dir=str(tmp_path),
+        cache_ttl=0,
+        conditional_requests=True,
+    )
+
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests(),
+    ) as mocker:
+        JiraApi(options).get_all_fields()
+
+        response = JiraApi(options).get_all_fields()
+
+        assert mocker.call_count == 2
+        assert mocker.last_request.headers["If-None-Match"] == MOCK_FIELDS_ETAG
+        assert response.status_code == 200
+        assert len(response.fields) > 0
+
+
+def test_retry_throttled_requests():
+    api = JiraApi(
+        JiraApiOptions(
+            url="https://localhost",
+            access_token="access_token",
+            retry_policy=RetryPolicy(max_attempts=3),
+            rate_limit=1000,
+        )
+    )
+
+    with (
+        Mocker(real_http=False) as mocker,
+        patch("jira_cloud_api.jira_api.sleep") as mock_sleep,
+    ):
+        mocker.get(
+            "https://localhost/rest/api/2/myself",
+            [
+                {"status_code": 429, "headers": {"Retry-After": "3"}},
+                {"status_code": 503, "headers": {"Retry-After": "1"}},
+                {"status_code": 200, "json": {"displayName": "Sharry Xu"}},
+            ],
+        )
+        mocker.post(
+            "https://localhost/rest/api/2/issue",
+            status_code=429,
+            headers={"Retry-After": "3"},
+        )
+
+        response = api.get_myself()
+
+        assert response.status_code == 200
+        assert response.display_name == "Sharry Xu"
+        assert mocker.call_count == 3
+        assert 3 in [call.args[0] for call in mock_sleep.call_args_list]
+
+        # POST is not idempotent, so it is not retried by default.
+        create_response = api.create_issue(CreateIssueRequest(fields={}))
+
+        assert create_response.status_code == 429
+        assert mocker.call_count == 4
+
+
+def test_retry_gives_up_after_max_attempts():
+    api = JiraApi(
+        JiraApiOptions(
+            url="https://localhost",
+            access_token="access_token",
+            retry_policy=RetryPolicy(max_attempts=2, jitter=False),
+        )
+    )
+
+    with (
+        Mocker(real_http=False) as mocker,
+        patch("jira_cloud_api.jira_api.sleep") as mock_sleep,
+    ):
+        mocker.get("https://localhost/rest/api/2/myself", status_code=503)
+
+        response = api.get_myself()
+
+        assert response.status_code == 503
+        assert mocker.call_count == 2
+        mock_sleep.assert_called_once_with(0.5)
+
+
+def test_get_field_registry():
+    api = JiraApi(
+        JiraApiOptions(
+            url="https://localhost", access_token="access_token", cache_enabled=True
+        )
+    )
+
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests(),
+    ):
+        registry = api.get_field_registry()
+
+        assert len(registry) == 5
+        assert registry.resolve("Domain") == registry.get_by_id("customfield_15601")
+        assert registry.resolve("cf[14303]") == registry.get_by_id("customfield_14303")
+        assert api.get_field_registry() is registry
+
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests(400),
+    ):
+        with pytest.raises(JiraApiError):
+            jira_cloud_api.get_field_registry()
@@ -0,0 +1,324 @@
+import asyncio
+from dataclasses import replace
+from io import BytesIO
+
+import pytest
+
+from jira_cloud_api.jira_api import JiraApiOptions
+from jira_cloud_api.jira_async_api import AsyncJiraApi
+from jira_cloud_api.jira_request import (
+    AddAttachmentRequest,
+    CreateIssueRequest,
+    GetProjectIssueFieldsRequest,
+    GetProjectIssueTypesRequest,
+    SearchIssuesRequest,
+    UpdateIssueRequest,
+)
+from tests.mock_jira_server import mock_attachment_bytes, mock_jira_async_transport
+
+DEFAULT_JIRA_API_OPTIONS = JiraApiOptions(
+    url="https://localhost",
+    access_token="access_token",
+    user_email="sharry.xu@outlook.com",
+)
+
+
+def test_async_jira_api_constructor():
+    with pytest.raises(ValueError) as e:
+        _ = AsyncJiraApi(
+            JiraApiOptions(
+                url="https://localhost.atlassian.net",
+                access_token="access_token",
+            )
+        )
+
+    assert "User email must be provided" in str(e.value)
+
+
+def test_async_get_server_info():
+    async def run():
+        async with AsyncJiraApi(
+            DEFAULT_JIRA_API_OPTIONS, transport=mock_jira_async_transport()
+        ) as api:
+            return await api.get_server_info()
+
+    response = asyncio.run(run())
+
+    assert response.status_code == 200
+    assert response.version == "8.20.13"
+    assert response.server_time is not None
+
+
+def test_async_get_server_info_failed():
+    async def run():
+        async with AsyncJiraApi(
+            DEFAULT_JIRA_API_OPTIONS,
+            transport=mock_jira_async_transport(response_status_code=400),
+        ) as api:
+            return await api.get_server_info()
+
+    response = asyncio.run(run())
+
+    assert response.status_code == 400
+
+
+def test_async_get_metadata_concurrently():
+    async def run():
+        async with AsyncJiraApi(
+            DEFAULT_JIRA_API_OPTIONS, transport=mock_jira_async_transport()
+        ) as api:
+            return await asyncio.gather(
+                api.get_myself(),
+                api.get_all_projects(),
+                api.get_project_detail("SAND"),
+                api.get_all_fields(),
+                api.get_project_issue_types(
+                    GetProjectIssueTypesRequest(project_id_or_key="SAND")
+                ),
+                api.get_project_issue_fields(
+                    GetProjectIssueFieldsRequest(
+                        project_id_or_key="SAND", issue_type_id="10002"
+                    )
+                ),
+            )
+
+    responses = asyncio.run(run())
+
+    assert all(response.status_code == 200 for response in responses)
+    myself, projects, project_detail, fields = responses[:4]
+    assert myself.display_name == "Sharry Xu"
+    assert len(projects.projects) > 0
+    assert project_detail.project is not None
+    assert len(fields.fields) > 0
+
+
+def test_async_create_issue():
+    async def run():
+        async with AsyncJiraApi(
+            DEFAULT_JIRA_API_OPTIONS, transport=mock_jira_async_transport()
+        ) as api:
+            return await api.create_issue(
+                CreateIssueRequest(
+                    fields={
+                        "project.key": "SAND",
+                        "summary": "Test issue creation",
+                        "issuetype.id": "10002",
+                    }
+                )
+            )
+
+    response = asyncio.run(run())
+
+    assert response.status_code == 200
+    assert response.key == "SD-123"
+
+
+def test_async_get_project_issue_fields_query_all():
+    async def run():
+        async with AsyncJiraApi(
+            DEFAULT_JIRA_API_OPTIONS, transport=mock_jira_async_transport()
+        ) as api:
+            return await api.get_project_issue_fields(
+                GetProjectIssueFieldsRequest(
+                    project_id_or_key="SAND",
+                    issue_type_id="10002",
+                    max_results=1,
+                    query_all=True,
+                )
+            )
+
+    response = asyncio.run(run())
+
+    assert response.status_code == 200
+    assert len(response.fields) == 6
+    assert response.fields[0].field_id == "issuetype"
+    assert response.fields[-1].field_id == "MyValue"
+
+
+def test_async_conditional_requests_query_all():
+    async def run():
+        async with AsyncJiraApi(
+            replace(DEFAULT_JIRA_API_OPTIONS, conditional_requests=True),
+            transport=mock_jira_async_transport(),
+        ) as api:
+            request = GetProjectIssueTypesRequest(
+                project_id_or_key="SAND", max_results=2, query_all=True
+            )
+            return [await api.get_project_issue_types(request) for _ in range(3)]
+
+    responses = asyncio.run(run())
+
+    # the 304 pages must not return the merged list of an earlier call.
+    ids = [[issue_type.id for issue_type in r.issue_types] for r in responses]
+    assert ids == [["10500", "10700", "11", "11000", "12500", "14", "7"]] * 3
+
+
+def test_async_iter_project_issue_types():
+    async def run():
+        async with AsyncJiraApi(
+            DEFAULT_JIRA_API_OPTIONS, transport=mock_jira_async_transport()
+        ) as api:
+            return [
+                issue_type.id
+                async for issue_type in api.iter_project_issue_types(
+                    GetProjectIssueTypesRequest(project_id_or_key="SAND", max_results=2)
+                )
+            ]
+
+    issue_type_ids = asyncio.run(run())
+
+    assert issue_type_ids == ["10500", "10700", "11", "11000", "12500", "14", "7"]
+
+
+def test_async_search_issues():
+    async def run(token_paginated: bool):
+        async with AsyncJiraApi(
+            DEFAULT_JIRA_API_OPTIONS, transport=mock_jira_async_transport()
+        ) as api:
+            return [
+                issue.key
+                async for issue in api.search_issues(
+                    SearchIssuesRequest(
+                        jql="project = SAND",
+                        fields=["summary"],
+                        max_results=10,
+                        token_paginated=token_paginated,
+                    )
+                )
+            ]
+
+    assert asyncio.run(run(token_paginated=False)) == [
+        f"SAND-{index}" for index in range(1, 26)
+    ]
+    assert asyncio.run(run(token_paginated=True)) == [
+        f"SAND-{index}" for index in range(1, 26)
+    ]
+
+
+def test_async_get_issues():
+    async def run():
+        async with AsyncJiraApi(
+            DEFAULT_JIRA_API_OPTIONS, transport=mock_jira_async_transport()
+        ) as api:
+            return (
+                await api.get_issue("SAND-3"),
+                await api.get_issues(["SAND-3", "SAND-999", "SAND-1", "SAND-3"]),
+            )
+
+    response, responses = asyncio.run(run())
+
+    assert response.key == "SAND-3"
+    assert [response.status_code for response in responses] == [200, 404, 200, 200]
+    assert [response.key for response in responses if response.status_code == 200] == [
+        "SAND-3",
+        "SAND-1",
+        "SAND-3",
+    ]
+
+
+def test_async_update_issues():
+    async def run():
+        async with AsyncJiraApi(
+            DEFAULT_JIRA_API_OPTIONS, transport=mock_jira_async_transport()
+        ) as api:
+            return await api.update_issues(
+                [
+                    UpdateIssueRequest(
+                        key="SAND-1",
+                        fields={"summary": "Changed"},
+                        previous_fields={"summary": "Mock issue 0"},
+                    ),
+                    UpdateIssueRequest(
+                        key="SAND-2",
+                        fields={"summary": "Mock issue 1"},
+                        previous_fields={"summary": "Mock issue 1"},
+                    ),
+                ],
+                notify_users=False,
+            )
+
+    responses = asyncio.run(run())
+
+    assert [response.status_code for response in responses] == [204, 204]
+    assert [response.updated_fields for response in responses] == [["summary"], []]
+
+
+def test_async_transition_issues():
+    async def run():
+        async with AsyncJiraApi(
+            DEFAULT_JIRA_API_OPTIONS, transport=mock_jira_async_transport()
+        ) as api:
+            return await api.transition_issues(
+                ["SAND-1", "SAND-10", "SAND-2"], "In Progress"
+            )
+
+    responses = asyncio.run(run())
+
+    assert [response.status_code for response in responses] == [204, 204, 204]
+    assert [response.transition_id for response in responses] == ["11"] * 3
+
+
+def test_async_attachments():
+    target = BytesIO()
+
+    async def run():
+        async with AsyncJiraApi(
+            DEFAULT_JIRA_API_OPTIONS, transport=mock_jira_async_transport()
+        ) as api:
+            return (
+                await api.add_attachments(
+                    [
+                        AddAttachmentRequest(
+                            issue_key="SAND-1",
+                            file=BytesIO(b"a" * 3000),
+                            filename="a.txt",
+                        )
+                    ],
+                    chunk_size=1024,
+                ),
+                await api.download_attachment(
+                    "4096", target, start=100, end=299, chunk_size=64
+                ),
+            )
+
+    uploads, download = asyncio.run(run())
+
+    assert uploads[0].status_code == 200
+    assert uploads[0].attachments[0].size == 3000
+    assert uploads[0].attachments[0].mime_type == "text/plain"
+    assert download.status_code == 206
+    assert download.size == 200
+    assert target.getvalue() == mock_attachment_bytes(100, 300)
+
+
+def test_async_create_issues():
+    async def run():
+        async with AsyncJiraApi(
+            DEFAULT_JIRA_API_OPTIONS, transport=mock_jira_async_transport()
+        ) as api:
+            return await api.create_issues(
+                [
+                    CreateIssueRequest(
+                        fields={"project.key": "SAND", "summary": f"Issue {i}"}
+                    )
+                    for i in range(1, 61)
+                ],
+                concurrent=True,
+            )
+
+    responses = asyncio.run(run())
+
+    assert [response.key for response in responses] == [f"SD-{i}" for i in range(1, 61)]
+
+
+def test_async_get_field_registry():
+    async def run():
+        async with AsyncJiraApi(
+            DEFAULT_JIRA_API_OPTIONS, transport=mock_jira_async_transport()
+        ) as api:
+            return await api.get_field_registry()
+
+    registry = asyncio.run(run())
+
+    assert len(registry) == 5
+    assert registry.resolve("domain") == registry.get_by_id("customfield_15601")
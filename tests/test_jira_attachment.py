@@ -0,0 +1,167 @@
+import tracemalloc
+from email import message_from_bytes
+from io import BytesIO
+from typing import Any
+
+import pytest
+from requests_mock import Mocker
+
+from jira_cloud_api.jira_api import JiraApi, JiraApiOptions
+from jira_cloud_api.jira_attachment import (
+    MultipartFileStream,
+    RangeSlice,
+    to_range_header,
+)
+from jira_cloud_api.jira_request import AddAttachmentRequest
+from tests.mock_jira_server import mock_attachment_bytes, mock_jira_requests
+
+LARGE_FILE_SIZE = 256 * 1024 * 1024
+# a few chunks of 1 MiB, far below the size of the large files.
+MEMORY_BUDGET = 16 * 1024 * 1024
+
+jira_api = JiraApi(JiraApiOptions(url="https://localhost", access_token="access_token"))
+
+
+class CountingSink:
+    def __init__(self) -> None:
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        self.size += len(data)
+        return len(data)
+
+
+def test_multipart_file_stream():
+    content = bytes(range(256)) * 10
+    body = MultipartFileStream(BytesIO(content), 'report "v2".log', chunk_size=100)
+
+    data = b"".join(body)
+    message = message_from_bytes(
+        f"Content-Type: {body.content_type}\r\n\r\n".encode("utf-8") + data
+    )
+    parts: Any = message.get_payload()
+
+    assert body.len == len(data)
+    assert len(parts) == 1
+    assert parts[0].get_filename() == 'report "v2".log'
+    assert parts[0].get_content_type() == "application/octet-stream"
+    assert parts[0].get_payload(decode=True) == content
+
+
+def test_multipart_file_stream_reads_in_chunks():
+    body = MultipartFileStream(BytesIO(b"x" * 1000), "a.txt", chunk_size=300)
+    reads = []
+    while True:
+        data = body.read(128)
+        if not data:
+            break
+        reads.append(data)
+
+    assert max(len(data) for data in reads) <= 128
+    assert len(b"".join(reads)) == body.len
+
+
+@pytest.mark.parametrize(
+    "start, end, expected",
+    [
+        (None, None, None),
+        (10, None, "bytes=10-"),
+        (10, 19, "bytes=10-19"),
+        (None, 9, "bytes=0-9"),
+    ],
+)
+def test_to_range_header(start, end, expected):
+    assert to_range_header(start, end) == expected
+
+
+def test_range_slice_of_full_response():
+    range_slice = RangeSlice(200, 5, 14)
+    chunks = [range_slice.apply(bytes(range(i, i + 4))) for i in range(0, 20, 4)]
+
+    assert b"".join(chunks) == bytes(range(5, 15))
+    assert range_slice.is_done
+    assert RangeSlice(206, 5, 14).apply(b"abc") == b"abc"
+
+
+def test_add_attachment(tmp_path):
+    path = tmp_path / "build.log"
+    path.write_bytes(b"log line\n" * 1000)
+
+    with Mocker(real_http=False, case_sensitive=False, adapter=mock_jira_requests()):
+        response = jira_api.add_attachment(
+            AddAttachmentRequest(issue_key="SAND-1", file=path), chunk_size=1024
+        )
+        missing = jira_api.add_attachment(
+            AddAttachmentRequest(issue_key="SAND-1", file=tmp_path / "missing.log")
+        )
+        responses = jira_api.add_attachments(
+            [
+                AddAttachmentRequest(
+                    issue_key=key,
+                    file=BytesIO(b"{}"),
+                    filename="data.json",
+                )
+                for key in ["SAND-1", "SAND-999", "SAND-2"]
+            ]
+        )
+
+    assert response.status_code == 200
+    assert response.attachments[0].filename == "build.log"
+    assert response.attachments[0].size == 9000
+    assert missing.status_code == 0
+    assert "missing.log" in str(missing.error_text)
+    assert [response.status_code for response in responses] == [200, 404, 200]
+    assert responses[0].attachments[0].mime_type == "application/json"
+
+
+def test_download_attachment(tmp_path):
+    path = tmp_path / "download.bin"
+
+    with Mocker(real_http=False, case_sensitive=False, adapter=mock_jira_requests()):
+        response = jira_api.download_attachment("5000", path, chunk_size=1024)
+        partial = BytesIO()
+        partial_response = jira_api.download_attachment(
+            "5000", partial, start=1000, end=1999
+        )
+        ignored_range = BytesIO()
+        ignored_range_response = jira_api.download_attachment(
+            "norange-5000", ignored_range, start=1000, end=1999, chunk_size=512
+        )
+        missing_response = jira_api.download_attachment(
+            "missing", tmp_path / "missing.bin"
+        )
+
+    assert response.status_code == 200
+    assert response.size == 5000
+    assert path.read_bytes() == mock_attachment_bytes(0, 5000)
+    assert partial_response.status_code == 206
+    assert partial_response.content_range == "bytes 1000-1999/5000"
+    assert partial.getvalue() == mock_attachment_bytes(1000, 2000)
+    assert ignored_range_response.status_code == 200
+    assert ignored_range.getvalue() == mock_attachment_bytes(1000, 2000)
+    assert missing_response.status_code == 404
+    assert not (tmp_path / "missing.bin").exists()
+
+
+def test_large_attachments_are_streamed(tmp_path):
+    path = tmp_path / "large.bin"
+    with open(path, "wb") as file:
+        file.truncate(LARGE_FILE_SIZE)
+
+    with Mocker(real_http=False, case_sensitive=False, adapter=mock_jira_requests()):
+        tracemalloc.start()
+        try:
+            upload = jira_api.add_attachment(
+                AddAttachmentRequest(issue_key="SAND-1", file=path)
+            )
+            sink = CountingSink()
+            download = jira_api.download_attachment(str(LARGE_FILE_SIZE), sink)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    assert upload.status_code == 200
+    assert upload.attachments[0].size == LARGE_FILE_SIZE
+    assert download.status_code == 200
+    assert sink.size == LARGE_FILE_SIZE
+    assert peak < MEMORY_BUDGET
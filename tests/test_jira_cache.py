@@ -0,0 +1,117 @@
+import os
+from unittest.mock import patch
+
+from jira_cloud_api.jira_cache import (
+    FIELDS_ENDPOINT,
+    PROJECT_DETAIL_ENDPOINT,
+    ConditionalRequestCache,
+    DiskMetadataCache,
+    MetadataCache,
+)
+
+
+def test_metadata_cache_lru_eviction():
+    cache = MetadataCache(max_size=2)
+
+    cache.put(PROJECT_DETAIL_ENDPOINT, "A", "project A")
+    cache.put(PROJECT_DETAIL_ENDPOINT, "B", "project B")
+    assert cache.get(PROJECT_DETAIL_ENDPOINT, "A") == "project A"
+
+    cache.put(PROJECT_DETAIL_ENDPOINT, "C", "project C")
+
+    assert len(cache) == 2
+    assert cache.get(PROJECT_DETAIL_ENDPOINT, "B") is None
+    assert cache.get(PROJECT_DETAIL_ENDPOINT, "A") == "project A"
+    assert cache.get(PROJECT_DETAIL_ENDPOINT, "C") == "project C"
+
+
+def test_metadata_cache_ttl():
+    cache = MetadataCache(default_ttl=10, ttls={FIELDS_ENDPOINT: 100})
+
+    with patch("jira_cloud_api.jira_cache.monotonic", return_value=0):
+        cache.put(FIELDS_ENDPOINT, None, "fields")
+        cache.put(PROJECT_DETAIL_ENDPOINT, "A", "project A")
+
+    with patch("jira_cloud_api.jira_cache.monotonic", return_value=50):
+        assert cache.get(FIELDS_ENDPOINT) == "fields"
+        assert cache.get(PROJECT_DETAIL_ENDPOINT, "A") is None
+
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_metadata_cache_invalidate():
+    cache = MetadataCache()
+    cache.put(FIELDS_ENDPOINT, None, "fields")
+    cache.put(PROJECT_DETAIL_ENDPOINT, "A", "project A")
+    cache.put(PROJECT_DETAIL_ENDPOINT, "B", "project B")
+
+    cache.invalidate(PROJECT_DETAIL_ENDPOINT, "A")
+    assert cache.get(PROJECT_DETAIL_ENDPOINT, "A") is None
+    assert cache.get(PROJECT_DETAIL_ENDPOINT, "B") == "project B"
+
+    cache.invalidate(PROJECT_DETAIL_ENDPOINT)
+    assert cache.get(PROJECT_DETAIL_ENDPOINT, "B") is None
+    assert cache.get(FIELDS_ENDPOINT) == "fields"
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.hits == 0
+    assert cache.misses == 0
+
+
+def test_conditional_request_cache():
+    cache = ConditionalRequestCache(max_size=1)
+
+    cache.put("fields", {"ETag": '"v1"', "Last-Modified": "Wed, 29 Mar 2023"}, "A")
+    cache.put("projects", {}, "B")
+
+    assert cache.get_request_headers("fields") == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Wed, 29 Mar 2023",
+    }
+    assert cache.get_request_headers("projects") is None
+    assert cache.get_not_modified("fields") == "A"
+    assert cache.not_modified == 1
+
+    cache.put("project", {"ETag": '"v2"'}, "C")
+
+    assert len(cache) == 1
+    assert cache.get_request_headers("fields") is None
+
+
+def test_disk_metadata_cache(tmp_path):
+    cache = DiskMetadataCache(str(tmp_path), "https://localhost", default_ttl=60)
+    other_site_cache = DiskMetadataCache(str(tmp_path), "https://other")
+    other_user_cache = DiskMetadataCache(
+        str(tmp_path), "https://localhost", access_token="other_token"
+    )
+
+    cache.put(FIELDS_ENDPOINT, None, ["field"])
+    cache.put(PROJECT_DETAIL_ENDPOINT, "A", {"key": "A"})
+
+    assert cache.get(FIELDS_ENDPOINT) == ["field"]
+    assert cache.get(PROJECT_DETAIL_ENDPOINT, "A") == {"key": "A"}
+    assert cache.get(PROJECT_DETAIL_ENDPOINT, "B") is None
+    assert other_site_cache.get(FIELDS_ENDPOINT) is None
+    assert other_user_cache.get(FIELDS_ENDPOINT) is None
+
+    with patch("jira_cloud_api.jira_cache.time", return_value=10**12):
+        assert cache.get(FIELDS_ENDPOINT) is None
+        assert cache.get(FIELDS_ENDPOINT, check_ttl=False) == ["field"]
+
+    cache.invalidate(PROJECT_DETAIL_ENDPOINT)
+    assert cache.get(PROJECT_DETAIL_ENDPOINT, "A") is None
+    assert cache.get(FIELDS_ENDPOINT) == ["field"]
+
+
+def test_disk_metadata_cache_ignores_corrupted_files(tmp_path):
+    cache = DiskMetadataCache(str(tmp_path), "https://localhost")
+    cache.put(FIELDS_ENDPOINT, None, ["field"])
+
+    for name in os.listdir(cache.directory):
+        with open(os.path.join(cache.directory, name), "wb") as file:
+            file.write(b"not a pickle")
+
+    assert cache.get(FIELDS_ENDPOINT) is None
+    assert not os.listdir(cache.directory)
@@ -0,0 +1,197 @@
+from jira_cloud_api.jira_api import JiraApiOptions, JiraApiRequest, JiraApiResponse
+from jira_cloud_api.jira_client_core import (
+    ClientCaches,
+    SearchIssuesPages,
+    get_issues_search_chunks,
+    get_missing_issue_keys,
+    get_next_issues_chunk_start_at,
+    get_next_page_start_at,
+    get_next_search_page_token,
+    get_next_search_start_at,
+    get_query_all_start_ats,
+    get_settled_transition_response,
+    get_transition_groups,
+    resolve_own_transition,
+)
+from jira_cloud_api.jira_converters import create_transition_issue_response
+from jira_cloud_api.jira_models import JiraTransition
+from jira_cloud_api.jira_request import SearchIssuesRequest
+from jira_cloud_api.jira_response import (
+    GetIssueResponse,
+    GetIssueTransitionsResponse,
+    GetProjectIssueTypesResponse,
+    TransitionIssueResponse,
+)
+
+
+def create_issue(status_code: int, status_id: str) -> GetIssueResponse:
+    issue = GetIssueResponse()
+    issue.status_code = status_code
+    issue.status_reason = None
+    issue.error_text = None
+    issue.fields = {
+        "project": {"id": "10000"},
+        "issuetype": {"id": "10001"},
+        "status": {"id": status_id, "name": f"Status {status_id}"},
+    }
+    return issue
+
+
+def create_transitions(
+    status_code: int, *transitions: JiraTransition
+) -> GetIssueTransitionsResponse:
+    response = GetIssueTransitionsResponse()
+    response.status_code = status_code
+    response.status_reason = None
+    response.error_text = None
+    response.transitions = list(transitions)
+    return response
+
+
+def test_client_caches():
+    caches = ClientCaches(
+        JiraApiOptions(
+            url="https://localhost",
+            access_token="access_token",
+            cache_enabled=True,
+            conditional_requests=True,
+        )
+    )
+    response = create_transitions(200)
+    failed_response = create_transitions(500)
+
+    assert caches.is_enabled
+    caches.put("endpoint", "key", response)
+    caches.put("endpoint", "failed", failed_response)
+    assert caches.get("endpoint", "key") is response
+    assert caches.get("endpoint", "failed") is None
+
+    request = JiraApiRequest(url="https://localhost/field", params={"b": 1, "a": 2})
+    key = caches.add_validator_headers(request)
+    assert key == ("https://localhost/field", (("a", 2), ("b", 1)))
+    assert request.headers is None
+
+    raw_response = JiraApiResponse()
+    raw_response.status_code = 200
+    raw_response.headers = {"ETag": '"1"'}
+    caches.put_validated(key, raw_response, response)
+    caches.add_validator_headers(request)
+    assert request.headers == {"If-None-Match": '"1"'}
+
+    raw_response = JiraApiResponse()
+    raw_response.status_code = 304
+    assert caches.get_not_modified(key, raw_response) is response
+
+    caches = ClientCaches(
+        JiraApiOptions(url="https://localhost", access_token="access_token")
+    )
+    assert not caches.is_enabled
+    assert caches.add_validator_headers(request) is None
+    assert caches.get_not_modified(None, raw_response) is None
+
+
+def test_page_planning():
+    page = GetProjectIssueTypesResponse()
+    page.status_code = 200
+    page.total = 120
+    page.max_results = 50
+
+    assert get_query_all_start_ats(0, 25, True, page) == [50, 100]
+    assert not get_query_all_start_ats(0, 25, False, page)
+    assert get_next_page_start_at(50, 25, page, 50) == 100
+    assert get_next_page_start_at(100, 25, page, 20) is None
+    assert get_next_page_start_at(0, 25, page, 0) is None
+
+    page.status_code = 500
+    assert not get_query_all_start_ats(0, 25, True, page)
+
+    assert get_next_search_start_at(0, {"total": 3}, 2) == 2
+    assert get_next_search_start_at(2, {"total": 3}, 1) is None
+    assert get_next_search_page_token({"nextPageToken": "a"}) == "a"
+    assert get_next_search_page_token({"nextPageToken": "a", "isLast": True}) is None
+
+
+def test_search_pages():
+    pages = SearchIssuesPages(SearchIssuesRequest(jql="project = SAND", start_at=5))
+    assert pages.path == "/rest/api/2/search"
+    assert pages.params["startAt"] == 5
+    assert pages.advance({"total": 60}, 50)
+    assert pages.params["startAt"] == 55
+    assert not pages.advance({"total": 60}, 5)
+
+    pages = SearchIssuesPages(
+        SearchIssuesRequest(jql="project = SAND", token_paginated=True)
+    )
+    assert pages.path == "/rest/api/2/search/jql"
+    assert "nextPageToken" not in pages.params
+    assert pages.advance({"nextPageToken": "50"}, 50)
+    assert pages.params["nextPageToken"] == "50"
+    assert not pages.advance({"nextPageToken": "100", "isLast": True}, 50)
+
+
+def test_issue_planning():
+    keys = [f"SAND-{i}" for i in range(1, 6)] + ["SAND-1", "bad key"]
+
+    assert get_issues_search_chunks(keys, 2) == [
+        ["SAND-1", "SAND-2"],
+        ["SAND-3", "SAND-4"],
+        ["SAND-5"],
+    ]
+    assert len(get_issues_search_chunks(keys, 1000)) == 1
+    assert not get_issues_search_chunks(["SAND-1", "SAND-1"], 10)
+
+    raw_response = JiraApiResponse()
+    raw_response.status_code = 200
+    raw_response.content = {"total": 100, "issues": [{}] * 40}
+    assert get_next_issues_chunk_start_at(40, raw_response) == 80
+    raw_response.content = {"total": 100, "issues": [{}] * 20}
+    assert get_next_issues_chunk_start_at(80, raw_response) is None
+    raw_response.status_code = 400
+    assert get_next_issues_chunk_start_at(0, raw_response) is None
+
+    found = {"SAND-1": create_issue(200, "1"), "SAND-3": create_issue(200, "1")}
+    assert get_missing_issue_keys(keys, found) == [
+        "SAND-2",
+        "SAND-4",
+        "SAND-5",
+        "bad key",
+    ]
+
+
+def test_transition_planning():
+    done = JiraTransition(id="31", name="Done", to_status_id="3", to_status_name="Done")
+    keys = ["SAND-1", "SAND-2", "SAND-3", "SAND-4"]
+    issues = [
+        create_issue(200, "1"),
+        create_issue(200, "1"),
+        create_issue(200, "3"),
+        create_issue(404, "1"),
+    ]
+
+    assert get_transition_groups(keys, issues, "3") == {
+        ("10000", "10001", "1"): "SAND-1"
+    }
+    assert get_settled_transition_response("SAND-1", issues[0], "Done") is None
+    response = get_settled_transition_response("SAND-3", issues[2], "3")
+    assert response is not None and response.status_code == 204
+    response = get_settled_transition_response("SAND-4", issues[3], "3")
+    assert response is not None and response.status_code == 404
+
+    assert (
+        resolve_own_transition("SAND-1", "done", create_transitions(200, done), None)
+        is done
+    )
+    tried_response = create_transition_issue_response("SAND-1", 400, None, None)
+    tried_response.transition_id = "31"
+    assert (
+        resolve_own_transition(
+            "SAND-1", "Done", create_transitions(200, done), tried_response
+        )
+        is tried_response
+    )
+    response = resolve_own_transition("SAND-1", "Done", create_transitions(200), None)
+    assert isinstance(response, TransitionIssueResponse)
+    assert response.error_text == "No transition of SAND-1 leads to Done."
+    response = resolve_own_transition("SAND-1", "Done", create_transitions(403), None)
+    assert isinstance(response, TransitionIssueResponse)
+    assert response.status_code == 403
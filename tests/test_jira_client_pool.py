@@ -0,0 +1,171 @@
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from time import sleep
+from typing import Any, List, Optional
+from unittest.mock import patch
+
+import pytest
+from requests import Session
+from requests_mock import Mocker
+
+from jira_cloud_api.jira_api import JiraApi, JiraApiOptions
+from jira_cloud_api.jira_client_pool import JiraClientPool
+from tests.mock_jira_server import mock_jira_requests
+
+
+def create_options(url: str, access_token: str = "access_token") -> JiraApiOptions:
+    return JiraApiOptions(url=url, access_token=access_token)
+
+
+def test_bearer_token_is_kept_per_instance():
+    first_api = JiraApi(create_options("https://first", "first_token"))
+    second_api = JiraApi(create_options("https://second", "second_token"))
+
+    assert first_api.default_request_headers["Authorization"] == "Bearer first_token"
+    assert second_api.default_request_headers["Authorization"] == "Bearer second_token"
+    assert "Authorization" not in JiraApi.default_request_headers
+
+
+def test_client_pool_reuses_clients_per_site_and_credential():
+    with JiraClientPool() as pool:
+        client = pool.get(create_options("https://first"))
+
+        assert pool.get(create_options("https://first/")) is client
+        assert pool.get(create_options("https://first", "other_token")) is not client
+        assert pool.get(create_options("https://second")) is not client
+        assert len(pool) == 3
+        assert create_options("https://first") in pool
+
+
+def test_client_pool_sends_each_tenant_token():
+    with (
+        Mocker(real_http=False, case_sensitive=False) as mocker,
+        JiraClientPool() as pool,
+    ):
+        mocker.get("https://first/rest/api/2/myself", json={})
+        mocker.get("https://second/rest/api/2/myself", json={})
+
+        pool.get(create_options("https://first", "first_token")).get_myself()
+        pool.get(create_options("https://second", "second_token")).get_myself()
+        pool.get(create_options("https://first", "first_token")).get_myself()
+
+        assert [
+            request.headers["Authorization"] for request in mocker.request_history
+        ] == ["Bearer first_token", "Bearer second_token", "Bearer first_token"]
+        assert all(
+            request.headers["Content-Type"] == "application/json"
+            for request in mocker.request_history
+        )
+
+
+class CookieHandler(BaseHTTPRequestHandler):
+    # sets a session cookie for the caller's token and records the cookies
+    # each request sent.
+    cookies: List[Optional[str]] = []
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        self.cookies.append(self.headers.get("Cookie", None))
+        token = self.headers.get("Authorization", "").split()[-1]
+        body = b"{}"
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Set-Cookie", f"JSESSIONID=session-of-{token}; Path=/")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_: Any) -> None:
+        pass
+
+
+@pytest.mark.parametrize("http2", [False, True])
+def test_client_pool_does_not_share_cookies(http2):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), CookieHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    CookieHandler.cookies = []
+
+    try:
+        with JiraClientPool() as pool:
+            for token in ["first_token", "second_token", "first_token"]:
+                options = JiraApiOptions(url=url, access_token=token, http2=http2)
+                assert pool.get(options).get_myself().status_code == 200
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    # one shared transport, but no tenant sends the session of another.
+    assert CookieHandler.cookies == [None, None, None]
+
+
+def test_client_pool_evicts_least_recently_used_clients():
+    with JiraClientPool(max_clients=2) as pool:
+        first = pool.get(create_options("https://first"))
+        pool.get(create_options("https://second"))
+        assert pool.get(create_options("https://first")) is first
+
+        pool.get(create_options("https://third"))
+
+        assert create_options("https://first") in pool
+        assert create_options("https://second") not in pool
+        assert len(pool) == 2
+
+
+def test_client_pool_evicts_idle_clients():
+    with patch("jira_cloud_api.jira_client_pool.monotonic") as monotonic:
+        monotonic.return_value = 0.0
+        with JiraClientPool(idle_timeout=60) as pool:
+            pool.get(create_options("https://first"))
+            monotonic.return_value = 30.0
+            pool.get(create_options("https://second"))
+
+            monotonic.return_value = 70.0
+            assert pool.evict_idle() == 1
+            assert create_options("https://first") not in pool
+            assert create_options("https://second") in pool
+
+
+def test_client_pool_limits_concurrent_requests():
+    in_flight = 0
+    max_in_flight = 0
+    lock = Lock()
+    original_request = Session.request
+
+    def request(*args, **kwargs):
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        try:
+            sleep(0.01)
+            return original_request(*args, **kwargs)
+        finally:
+            with lock:
+                in_flight -= 1
+
+    with (
+        Mocker(real_http=False, case_sensitive=False, adapter=mock_jira_requests()),
+        JiraClientPool(max_concurrency=2) as pool,
+        patch.object(Session, "request", request),
+    ):
+        clients = [
+            pool.get(create_options("https://localhost", f"token_{i}"))
+            for i in range(4)
+        ]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            responses = list(
+                executor.map(lambda client: client.get_myself(), clients * 4)
+            )
+
+    assert all(response.status_code == 200 for response in responses)
+    assert max_in_flight == 2
+
+
+def test_client_pool_options_are_validated():
+    with pytest.raises(ValueError):
+        JiraClientPool(max_clients=0)
+    with pytest.raises(ValueError):
+        JiraClientPool(max_concurrency=0)
+    with pytest.raises(ValueError):
+        JiraClientPool(idle_timeout=0)
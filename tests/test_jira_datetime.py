@@ -0,0 +1,54 @@
+import sys
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from jira_cloud_api.jira_datetime import parse_jira_datetime
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (
+            "2023-03-29T00:15:35.205-0700",
+            datetime(2023, 3, 29, 0, 15, 35, 205000, timezone(timedelta(hours=-7))),
+        ),
+        (
+            "2023-03-29T00:15:35.205+0000",
+            datetime(2023, 3, 29, 0, 15, 35, 205000, timezone.utc),
+        ),
+        ("2023-03-29T00:15:35Z", datetime(2023, 3, 29, 0, 15, 35, 0, timezone.utc)),
+        (
+            "2023-03-29T00:15:35.123456789+05:30",
+            datetime(
+                2023, 3, 29, 0, 15, 35, 123456, timezone(timedelta(hours=5, minutes=30))
+            ),
+        ),
+        ("2023-03-29T00:15", datetime(2023, 3, 29, 0, 15)),
+        ("2023-03-29", datetime(2023, 3, 29)),
+    ],
+)
+def test_parse_jira_datetime(value, expected):
+    parsed = parse_jira_datetime(value)
+
+    assert parsed == expected
+    assert (parsed.utcoffset() if parsed else None) == expected.utcoffset()
+
+
+def test_parse_jira_datetime_empty_values():
+    assert parse_jira_datetime(None) is None
+    assert parse_jira_datetime("") is None
+
+
+def test_parse_jira_datetime_falls_back_to_dateparser():
+    assert parse_jira_datetime("29 March 2023 10:00") == datetime(2023, 3, 29, 10, 0)
+    assert parse_jira_datetime("2023-02-30T00:00:00Z") is None
+    assert parse_jira_datetime("not a date") is None
+
+
+def test_fast_path_does_not_import_dateparser():
+    sys.modules.pop("dateparser", None)
+
+    parse_jira_datetime("2023-03-29T00:15:35.205-0700")
+
+    assert "dateparser" not in sys.modules
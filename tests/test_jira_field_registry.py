@@ -0,0 +1,115 @@
+from typing import Optional
+
+from jira_cloud_api.jira_converters import convert_to_field
+from jira_cloud_api.jira_field_registry import FieldRegistry
+from jira_cloud_api.jira_models import JiraField
+
+SELECT_TYPE = "com.atlassian.jira.plugin.system.customfieldtypes:select"
+
+
+def make_field(id_: str, name: str, clause_names: list, custom: str = ""):
+    return convert_to_field(
+        {
+            "id": id_,
+            "key": id_,
+            "name": name,
+            "custom": bool(custom),
+            "clauseNames": clause_names,
+            "schema": {"type": "option", "custom": custom} if custom else None,
+        }
+    )
+
+
+def get_attribute(field: Optional[JiraField], name: str) -> Optional[str]:
+    return getattr(field, name) if field is not None else None
+
+
+def make_fields():
+    return [
+        make_field("summary", "Summary", ["summary"]),
+        make_field("customfield_10000", "Team", ["cf[10000]", "Team"], SELECT_TYPE),
+        make_field("customfield_10001", "Team", ["cf[10001]", "Team"], SELECT_TYPE),
+    ]
+
+
+def test_lookups():
+    registry = FieldRegistry(make_fields())
+
+    assert len(registry) == 3
+    assert "summary" in registry
+    assert get_attribute(registry.get_by_id("customfield_10000"), "name") == "Team"
+    assert get_attribute(registry.get_by_key("summary"), "id") == "summary"
+    assert [f.id for f in registry.find_by_name("team")] == [
+        "customfield_10000",
+        "customfield_10001",
+    ]
+    assert [f.id for f in registry.find_by_clause_name("CF[10001]")] == [
+        "customfield_10001"
+    ]
+    assert len(registry.find_by_custom_type(SELECT_TYPE)) == 2
+    assert registry.get_by_id("unknown") is None
+    assert not registry.find_by_name("unknown")
+
+
+def test_resolve():
+    registry = FieldRegistry(make_fields())
+
+    assert get_attribute(registry.resolve("summary"), "id") == "summary"
+    assert get_attribute(registry.resolve("SUMMARY"), "id") == "summary"
+    assert get_attribute(registry.resolve("cf[10001]"), "id") == "customfield_10001"
+    assert get_attribute(registry.resolve("Team"), "id") == "customfield_10000"
+    assert registry.resolve("unknown") is None
+
+
+def test_refresh_only_touches_changed_fields():
+    registry = FieldRegistry(make_fields())
+
+    assert registry.refresh(make_fields()) == 0
+
+    fields = make_fields()
+    fields[1] = make_field(
+        "customfield_10000", "Squad", ["cf[10000]", "Squad"], SELECT_TYPE
+    )
+    del fields[2]
+    fields.append(make_field("labels", "Labels", ["labels"]))
+
+    assert registry.refresh(fields) == 3
+    assert len(registry) == 3
+    assert get_attribute(registry.resolve("Squad"), "id") == "customfield_10000"
+    assert not registry.find_by_name("Team")
+    assert not registry.find_by_clause_name("cf[10001]")
+    assert get_attribute(registry.resolve("labels"), "id") == "labels"
+
+
+def test_refresh_keeps_the_server_order():
+    registry = FieldRegistry(make_fields())
+    fields = make_fields()
+    fields[1] = make_field(
+        "customfield_10000", "Team", ["cf[10000]", "Team", "Squad"], SELECT_TYPE
+    )
+
+    assert registry.refresh(fields) == 1
+    assert [f.id for f in registry] == [f.id for f in fields]
+    assert [f.id for f in registry.find_by_name("Team")] == [
+        "customfield_10000",
+        "customfield_10001",
+    ]
+    assert [f.id for f in registry.find_by_clause_name("team")] == [
+        "customfield_10000",
+        "customfield_10001",
+    ]
+    assert [f.id for f in registry.find_by_custom_type(SELECT_TYPE)] == [
+        f.id for f in FieldRegistry(fields).find_by_custom_type(SELECT_TYPE)
+    ]
+
+
+def test_update_and_remove():
+    registry = FieldRegistry(make_fields())
+
+    registry.update([make_field("customfield_10001", "Sprint", ["Sprint"])])
+    registry.remove("summary")
+
+    assert get_attribute(registry.resolve("Sprint"), "id") == "customfield_10001"
+    assert [f.id for f in registry.find_by_name("Team")] == ["customfield_10000"]
+    assert registry.find_by_custom_type(SELECT_TYPE)[0].id == "customfield_10000"
+    assert "summary" not in registry
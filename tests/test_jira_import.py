@@ -0,0 +1,236 @@
+from datetime import datetime, timezone
+from io import StringIO
+from typing import Any, Dict, List
+
+import pytest
+from requests_mock import Mocker
+
+from jira_cloud_api.jira_api import JiraApi, JiraApiOptions
+from jira_cloud_api.jira_converters import convert_to_project_field
+from jira_cloud_api.jira_import import IssueImporter, read_csv_rows, read_excel_rows
+from tests.mock_jira_server import mock_jira_requests
+
+CSV = """Summary,Impact,My Value,description
+Import 1,Low,"1, 2",First
+Import 2,Unknown,1,
+,High,3,Missing summary
+Import 4,,2,
+Import 5,,,No value
+"""
+
+
+def create_api() -> JiraApi:
+    return JiraApi(
+        JiraApiOptions(
+            url="https://localhost", access_token="access_token", cache_enabled=True
+        )
+    )
+
+
+def test_read_csv_rows(tmp_path):
+    path = tmp_path / "issues.csv"
+    path.write_text(CSV, encoding="utf-8-sig")
+
+    rows = read_csv_rows(str(path))
+
+    assert next(rows) == ["Summary", "Impact", "My Value", "description"]
+    assert next(rows) == ["Import 1", "Low", "1, 2", "First"]
+
+
+def test_import_csv():
+    api = create_api()
+
+    with Mocker(
+        real_http=False, case_sensitive=False, adapter=mock_jira_requests()
+    ) as mocker:
+        importer = IssueImporter.for_issue_type(
+            api,
+            "SAND",
+            "7",
+            column_mapping={
+                "Summary": "summary",
+                "Impact": "customfield_12426.value",
+                "My Value": "MyValue.value",
+            },
+            batch_size=2,
+        )
+        results = importer.import_csv(StringIO(CSV))
+
+        first = next(results)
+        assert first.row_number == 2
+        assert first.is_success()
+        assert first.response is not None and first.response.key == "SD-1"
+        request = mocker.last_request.json()["issueUpdates"][0]
+        assert request["fields"] == {
+            "summary": "Import 1",
+            "customfield_12426": {"value": "Low"},
+            "MyValue": [{"value": "1"}, {"value": "2"}],
+            "description": "First",
+            "project": {"key": "SAND"},
+            "issuetype": {"id": "7"},
+        }
+
+        results = [first] + list(results)
+
+    assert [result.row_number for result in results] == [2, 3, 4, 5, 6]
+    assert [result.is_success() for result in results] == [
+        True,
+        False,
+        False,
+        True,
+        False,
+    ]
+    assert results[1].errors == [
+        "Value Unknown is not allowed for customfield_12426.value."
+    ]
+    assert results[1].response is None
+    assert "summary" in results[2].errors[0]
+    assert results[3].response is not None and results[3].response.key == "SD-4"
+    assert "MyValue" in results[4].errors[0]
+
+
+def test_import_rows_rejects_unknown_columns():
+    api = create_api()
+
+    with Mocker(real_http=False, case_sensitive=False, adapter=mock_jira_requests()):
+        importer = IssueImporter.for_issue_type(api, "SAND", "7")
+
+        with pytest.raises(ValueError, match="Field labels is not available"):
+            list(importer.import_rows([["summary", "MyValue.value", "labels"]]))
+
+
+def test_import_rows_without_project_fields():
+    api = create_api()
+
+    with Mocker(real_http=False, case_sensitive=False, adapter=mock_jira_requests()):
+        importer = IssueImporter(
+            api,
+            defaults={"project.key": "SAND"},
+            list_columns=["labels"],
+            list_separator=";",
+        )
+
+        results = list(
+            importer.import_rows(
+                [["summary", "labels"], ["Issue 7", "a; b"], ["Issue 8"]]
+            )
+        )
+
+    assert [result.is_success() for result in results] == [True, True]
+    assert results[1].response is not None and results[1].response.key == "SD-8"
+
+
+def test_import_rows_with_excel_values():
+    api = create_api()
+    raw_project_fields: List[Dict[str, Any]] = [
+        {"fieldId": "project", "required": True},
+        {"fieldId": "summary", "required": True},
+        {"fieldId": "duedate", "schema": {"type": "date"}},
+        {"fieldId": "customfield_10100", "schema": {"type": "datetime"}},
+    ]
+    project_fields = [convert_to_project_field(field) for field in raw_project_fields]
+    # openpyxl returns datetimes for date cells and None for empty cells.
+    started = datetime(2023, 3, 29, 10, 15, 30, 205000, tzinfo=timezone.utc)
+
+    with Mocker(
+        real_http=False, case_sensitive=False, adapter=mock_jira_requests()
+    ) as mocker:
+        importer = IssueImporter(
+            api, project_fields=project_fields, defaults={"project.key": "SAND"}
+        )
+        results = list(
+            importer.import_rows(
+                [
+                    ["summary", "project.key", "duedate", "customfield_10100"],
+                    ["Issue 1", None, datetime(2023, 3, 29), started],
+                    ["Issue 2", None, None, None],
+                ]
+            )
+        )
+        fields = [
+            issue_update["fields"]
+            for issue_update in mocker.last_request.json()["issueUpdates"]
+        ]
+
+    assert [result.is_success() for result in results] == [True, True]
+    assert fields == [
+        {
+            "summary": "Issue 1",
+            "project": {"key": "SAND"},
+            "duedate": "2023-03-29",
+            "customfield_10100": "2023-03-29T10:15:30.205+0000",
+        },
+        {"summary": "Issue 2", "project": {"key": "SAND"}},
+    ]
+
+
+def test_import_excel(tmp_path):
+    openpyxl = pytest.importorskip("openpyxl")
+    path = tmp_path / "issues.xlsx"
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "Issues"
+    sheet.append(["summary", "project.key", "duedate", "customfield_10101"])
+    sheet.append(["Issue 1", "SAND", datetime(2023, 3, 29), 3])
+    sheet.append(["Issue 2", "SAND", None, "inf"])
+    workbook.save(path)
+
+    assert list(read_excel_rows(path, "Issues"))[1] == [
+        "Issue 1",
+        "SAND",
+        datetime(2023, 3, 29),
+        3,
+    ]
+
+    raw_project_fields: List[Dict[str, Any]] = [
+        {"fieldId": "project", "required": True},
+        {"fieldId": "summary", "required": True},
+        {"fieldId": "duedate", "schema": {"type": "date"}},
+        {"fieldId": "customfield_10101", "schema": {"type": "number"}},
+    ]
+    project_fields = [convert_to_project_field(field) for field in raw_project_fields]
+
+    with Mocker(
+        real_http=False, case_sensitive=False, adapter=mock_jira_requests()
+    ) as mocker:
+        importer = IssueImporter(create_api(), project_fields=project_fields)
+        results = list(importer.import_excel(path))
+        fields = [
+            issue_update["fields"]
+            for issue_update in mocker.last_request.json()["issueUpdates"]
+        ]
+
+    assert [result.row_number for result in results] == [2, 3]
+    assert fields == [
+        {
+            "summary": "Issue 1",
+            "project": {"key": "SAND"},
+            "duedate": "2023-03-29",
+            "customfield_10101": 3,
+        },
+        # not finite, sent as is for Jira to reject instead of invalid JSON.
+        {"summary": "Issue 2", "project": {"key": "SAND"}, "customfield_10101": "inf"},
+    ]
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("2", 2), ("2.5", 2.5), ("inf", "inf"), ("nan", "nan"), ("1e999", "1e999")],
+)
+def test_import_rows_number_values(value, expected):
+    raw_project_fields: List[Dict[str, Any]] = [
+        {"fieldId": "summary", "required": True},
+        {"fieldId": "customfield_10101", "schema": {"type": "number"}},
+    ]
+    project_fields = [convert_to_project_field(field) for field in raw_project_fields]
+
+    with Mocker(
+        real_http=False, case_sensitive=False, adapter=mock_jira_requests()
+    ) as mocker:
+        importer = IssueImporter(create_api(), project_fields=project_fields)
+        list(
+            importer.import_rows([["summary", "customfield_10101"], ["Issue 1", value]])
+        )
+        fields = mocker.last_request.json()["issueUpdates"][0]["fields"]
+
+    assert fields["customfield_10101"] == expected
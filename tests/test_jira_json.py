@@ -0,0 +1,56 @@
+import json
+from importlib.util import find_spec
+from typing import List
+
+import pytest
+from requests_mock import Mocker
+
+from jira_cloud_api.jira_api import JiraApi, JiraApiOptions
+from jira_cloud_api.jira_json import get_json_decoder
+from tests.mock_jira_server import mock_jira_requests
+
+PAYLOAD = '{"name": "Ünïcode", "values": [1, 2.5, true, null]}'.encode("utf-8")
+
+
+@pytest.mark.parametrize("backend", ["auto", "orjson", "msgspec", "json", None])
+def test_decoders_decode_bytes(backend):
+    if backend in ("orjson", "msgspec") and find_spec(backend) is None:
+        with pytest.raises(ValueError, match="is not installed"):
+            get_json_decoder(backend)
+        return
+
+    decode = get_json_decoder(backend)
+
+    assert decode(PAYLOAD) == json.loads(PAYLOAD)
+
+
+def test_auto_prefers_orjson():
+    pytest.importorskip("orjson")
+    import orjson  # pylint: disable=import-outside-toplevel
+
+    assert get_json_decoder() is orjson.loads
+
+
+def test_unknown_decoder():
+    with pytest.raises(ValueError, match="Unknown JSON decoder"):
+        get_json_decoder("yaml")
+
+
+def test_api_uses_custom_decoder():
+    decoded: List[bytes] = []
+
+    def decode(content: bytes):
+        decoded.append(content)
+        return json.loads(content)
+
+    api = JiraApi(
+        JiraApiOptions(
+            url="https://localhost", access_token="access_token", json_decoder=decode
+        )
+    )
+
+    with Mocker(real_http=False, case_sensitive=False, adapter=mock_jira_requests()):
+        response = api.get_all_fields()
+
+    assert len(response.fields) == 5
+    assert len(decoded) == 1 and isinstance(decoded[0], bytes)
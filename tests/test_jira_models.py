@@ -0,0 +1,111 @@
+import pickle
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from jira_cloud_api.jira_converters import convert_to_field, convert_to_project_field
+from jira_cloud_api.jira_models import JiraAllowedValue, JiraProjectField
+
+RAW_FIELD = {
+    "id": "customfield_10000",
+    "key": "customfield_10000",
+    "name": "Team",
+    "custom": True,
+    "clauseNames": ["cf[10000]", "Team"],
+    "schema": {
+        "type": "option",
+        "custom": "com.atlassian.jira.plugin.system.customfieldtypes:select",
+        "customId": 10000,
+    },
+}
+
+
+def test_models_are_slotted():
+    field = convert_to_field(RAW_FIELD)
+
+    assert not hasattr(field, "__dict__")
+    with pytest.raises(AttributeError):
+        field.unknown = "value"  # type: ignore[attr-defined]
+
+
+def test_field_schemas_are_shared_and_frozen():
+    field = convert_to_field(RAW_FIELD)
+    project_field = convert_to_project_field(
+        {"fieldId": "customfield_10000", "name": "Team", "schema": RAW_FIELD["schema"]}
+    )
+
+    assert field.schema is not None
+    assert field.schema is project_field.schema
+    assert field.schema.custom_id == "10000"
+    with pytest.raises(FrozenInstanceError):
+        field.schema.type = "string"  # type: ignore[misc]
+
+
+def test_repeated_strings_are_interned():
+    first = convert_to_project_field({"fieldId": "".join(["summ", "ary"])})
+    second = convert_to_project_field({"fieldId": "".join(["sum", "mary"])})
+
+    assert first.field_id is second.field_id
+
+
+def test_models_pickle_round_trip():
+    project_field = convert_to_project_field(
+        {
+            "fieldId": "customfield_10000",
+            "name": "Team",
+            "allowedValues": [{"id": "1", "value": "Red"}],
+            "schema": RAW_FIELD["schema"],
+        }
+    )
+
+    restored: JiraProjectField = pickle.loads(pickle.dumps(project_field))
+
+    assert restored == project_field
+    assert restored.is_value_allowed("Red")
+
+
+def test_allowed_values_lookups():
+    project_field = convert_to_project_field(
+        {
+            "fieldId": "components",
+            "name": "Components",
+            "allowedValues": [
+                {"id": "10001", "name": "Backend", "self": "https://jira/10001"},
+                {"id": "10002", "name": "Frontend"},
+                {"id": "10003", "name": "Legacy", "disabled": True},
+                {"id": "10004", "value": "Backend"},
+            ],
+        }
+    )
+
+    assert [v.id for v in project_field.allowed_values] == [
+        "10001",
+        "10002",
+        "10003",
+        "10004",
+    ]
+    assert project_field.allowed_values[0].link == "https://jira/10001"
+    assert project_field.get_allowed_value_id("Frontend") == "10002"
+    assert project_field.get_allowed_value_id("Backend") == "10001"
+    assert project_field.get_allowed_value_id("10004") == "10004"
+    assert project_field.get_allowed_value_id("Unknown") is None
+    assert project_field.is_value_allowed("Backend")
+    assert project_field.is_value_allowed("10002")
+    assert not project_field.is_value_allowed("Legacy")
+    assert not project_field.is_value_allowed(None)
+
+
+def test_allowed_value_indexes_are_built_lazily():
+    project_field = convert_to_project_field(
+        {"fieldId": "priority", "allowedValues": [{"id": "1", "name": "High"}]}
+    )
+
+    indexes = project_field.get_allowed_value_indexes()
+
+    assert project_field.get_allowed_value_indexes() is indexes
+    assert list(indexes.by_name) == ["High"]
+
+    project_field.allowed_values.append(JiraAllowedValue(id="2", name="Low"))
+    project_field.reset_allowed_value_indexes()
+
+    assert project_field.is_value_allowed("Low")
@@ -0,0 +1,113 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import patch
+
+import pytest
+
+from jira_cloud_api.jira_retry import (
+    RetryPolicy,
+    TokenBucket,
+    get_rate_limit_pause,
+    get_retry_after,
+    get_retry_delay,
+)
+
+
+def test_retry_policy_should_retry():
+    policy = RetryPolicy(max_attempts=3)
+
+    assert policy.should_retry("GET", 429, attempt=0)
+    assert policy.should_retry("put", 503, attempt=1)
+    assert not policy.should_retry("GET", 503, attempt=2)
+    assert not policy.should_retry("GET", 400, attempt=0)
+    assert not policy.should_retry("POST", 429, attempt=0)
+    assert RetryPolicy(retry_methods=("POST",)).should_retry("POST", 429, attempt=0)
+
+
+def test_retry_policy_backoff():
+    policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+
+    assert [policy.get_delay(attempt, {}) for attempt in range(5)] == [1, 2, 4, 5, 5]
+
+    jitter_policy = RetryPolicy(backoff_factor=1, max_backoff=5)
+    for attempt in range(5):
+        assert 0 <= jitter_policy.get_delay(attempt, {}) <= 5
+
+
+def test_retry_policy_honors_retry_after():
+    policy = RetryPolicy(max_retry_after=60)
+
+    assert policy.get_delay(0, {"Retry-After": "7"}) == 7
+    assert policy.get_delay(0, {"Retry-After": "3600"}) == 60
+
+
+def test_get_retry_after():
+    in_ten_seconds = datetime.now(timezone.utc) + timedelta(seconds=10)
+    reset_at = in_ten_seconds.strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
+    assert get_retry_after({}) is None
+    assert get_retry_after({"Retry-After": "2.5"}) == 2.5
+    assert get_retry_after({"Retry-After": "soon"}) is None
+
+    retry_after = get_retry_after({"Retry-After": format_datetime(in_ten_seconds)})
+    assert retry_after is not None and 8 < retry_after <= 10
+
+    retry_after = get_retry_after({"X-RateLimit-Reset": reset_at})
+    assert retry_after is not None and 8 < retry_after <= 10
+
+
+def test_get_rate_limit_pause():
+    assert get_rate_limit_pause({"X-RateLimit-Remaining": "10"}) is None
+    assert get_rate_limit_pause({"X-RateLimit-Remaining": "0", "Retry-After": "4"}) == 4
+
+    # a far (or skewed) reset is capped.
+    headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "2099-01-01T00:00Z"}
+    assert get_rate_limit_pause(headers) == 120
+    assert get_rate_limit_pause(headers, max_pause=10) == 10
+
+
+def test_token_bucket():
+    with patch("jira_cloud_api.jira_retry.monotonic", return_value=100.0):
+        bucket = TokenBucket(rate=10, capacity=2)
+
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(0.1)
+        assert bucket.reserve() == pytest.approx(0.2)
+
+        bucket.pause(5)
+
+        assert bucket.reserve() == 5
+
+    with patch("jira_cloud_api.jira_retry.monotonic", return_value=110.0):
+        assert bucket.reserve() == 0
+
+
+def test_token_bucket_rate_must_be_positive():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_get_retry_delay():
+    policy = RetryPolicy(jitter=False)
+
+    with patch("jira_cloud_api.jira_retry.monotonic", return_value=100.0):
+        bucket = TokenBucket(rate=10)
+        assert get_retry_delay(policy, bucket, "GET", 503, {}, 0) == 0.5
+        assert bucket.reserve() == pytest.approx(0.5)
+        # a streamed body or a final status is not retried.
+        assert get_retry_delay(policy, bucket, "POST", 503, {}, 0) is None
+        assert get_retry_delay(policy, bucket, "GET", 503, {}, 0, True) is None
+        assert get_retry_delay(None, None, "GET", 503, {}, 0) is None
+
+        headers = {"X-RateLimit-Remaining": "0", "Retry-After": "4"}
+        assert get_retry_delay(policy, bucket, "GET", 200, headers, 0) is None
+        assert bucket.reserve() == 4
+
+        headers = {"X-RateLimit-Remaining": "0", "Retry-After": "99999"}
+        assert get_retry_delay(None, bucket, "GET", 200, headers, 0) is None
+        assert bucket.reserve() == 120
+        get_retry_delay(
+            RetryPolicy(max_retry_after=300), bucket, "GET", 200, headers, 0
+        )
+        assert bucket.reserve() == 300
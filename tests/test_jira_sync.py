@@ -0,0 +1,98 @@
+import json
+from datetime import datetime, timezone
+from itertools import islice
+
+import pytest
+from requests_mock import Mocker
+
+from jira_cloud_api.jira_api import JiraApi, JiraApiOptions
+from jira_cloud_api.jira_sync import (
+    FileWatermarkStore,
+    IncrementalSync,
+    MemoryWatermarkStore,
+    SyncWatermark,
+)
+from tests.mock_jira_server import mock_issue_updated, mock_jira_requests
+
+jira_api = JiraApi(JiraApiOptions(url="https://localhost", access_token="access_token"))
+
+
+def sync_keys(sync: IncrementalSync, issue_count: int) -> list:
+    with Mocker(
+        real_http=False,
+        case_sensitive=False,
+        adapter=mock_jira_requests(search_issue_count=issue_count),
+    ):
+        return [issue.key for issue in sync.sync(["SAND"])]
+
+
+def test_sync_only_yields_changed_issues():
+    store = MemoryWatermarkStore()
+    sync = IncrementalSync(jira_api, store, fields=["summary"], max_results=10)
+
+    assert sync_keys(sync, 25) == [f"SAND-{i}" for i in range(1, 26)]
+    watermark = store.load("SAND")
+    assert watermark is not None
+    assert watermark.updated == datetime.fromisoformat("2023-03-29T00:00:24-07:00")
+    assert sync.fields == ["summary", "updated"]
+
+    # the overlap reads every issue again, only the new ones are yielded.
+    assert sync_keys(sync, 30) == [f"SAND-{i}" for i in range(26, 31)]
+    assert sync_keys(sync, 30) == []
+    watermark = store.load("SAND")
+    assert watermark is not None
+    assert watermark.seen["100029"] == mock_issue_updated(29)
+
+
+def test_sync_jql():
+    sync = IncrementalSync(
+        jira_api, MemoryWatermarkStore(), jql="labels = mock", overlap=60
+    )
+
+    with Mocker(real_http=False, case_sensitive=False, adapter=mock_jira_requests()):
+        # the time zone of the API user, Asia/Shanghai in the mock.
+        jql = sync.get_jql("SAND", datetime.fromisoformat("2023-03-29T00:00:24-07:00"))
+
+    assert jql == (
+        'project = "SAND" AND (labels = mock) AND updated >= "2023/03/29 14:59"'
+        " ORDER BY updated ASC, key ASC"
+    )
+    assert (
+        IncrementalSync(
+            jira_api, MemoryWatermarkStore(), time_zone=timezone.utc
+        ).get_jql('A"B')
+        == 'project = "A\\"B" ORDER BY updated ASC, key ASC'
+    )
+
+
+def test_sync_resumes_after_interruption():
+    store = MemoryWatermarkStore()
+    sync = IncrementalSync(jira_api, store, checkpoint_interval=10)
+
+    with Mocker(real_http=False, case_sensitive=False, adapter=mock_jira_requests()):
+        issues = sync.sync_project("SAND")
+        assert len(list(islice(issues, 15))) == 15
+        watermark = store.load("SAND")
+        assert watermark is not None
+        assert watermark.updated == datetime.fromisoformat("2023-03-29T00:00:09-07:00")
+        issues.close()
+
+    # the 15th issue was yielded but not confirmed, it is yielded again.
+    assert sync_keys(sync, 25) == [f"SAND-{i}" for i in range(15, 26)]
+
+
+def test_file_watermark_store(tmp_path):
+    path = tmp_path / "sync" / "watermarks.json"
+    store = FileWatermarkStore(str(path))
+    updated = datetime.fromisoformat("2023-03-29T00:15:35.205-07:00")
+
+    assert store.load("SAND") is None
+    store.save("SAND", SyncWatermark(updated=updated, seen={"100000": "x"}))
+    store.save("OTHER", SyncWatermark())
+
+    watermark = FileWatermarkStore(str(path)).load("SAND")
+    assert watermark == SyncWatermark(updated=updated, seen={"100000": "x"})
+
+    path.write_text(json.dumps({"version": 0}), encoding="utf-8")
+    with pytest.raises(ValueError):
+        store.load("SAND")
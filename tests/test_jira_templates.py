@@ -0,0 +1,94 @@
+from typing import Any, Dict, List
+
+import pytest
+
+from jira_cloud_api.jira_converters import convert_to_project_field
+from jira_cloud_api.jira_request import CreateIssueRequest
+from jira_cloud_api.jira_templates import CreateIssueTemplate
+
+KEYS = [
+    "project.key",
+    "project.id",
+    "summary",
+    "components.name",
+    "labels",
+    "priority.name",
+    "customfield_10000.child.value",
+]
+ROW = ["SAND", "10000", "Summary", ["Backend", "API"], ["a"], "High", "Child"]
+
+RAW_PROJECT_FIELDS: List[Dict[str, Any]] = [
+    {"fieldId": "project", "required": True},
+    {"fieldId": "issuetype", "required": True},
+    {"fieldId": "summary", "required": True},
+    {"fieldId": "labels"},
+    {
+        "fieldId": "priority",
+        "required": True,
+        "hasDefaultValue": True,
+        "allowedValues": [{"id": "1", "name": "High"}, {"id": "2", "name": "Low"}],
+    },
+    {
+        "fieldId": "components",
+        "allowedValues": [{"id": "10", "name": "Backend"}],
+    },
+]
+PROJECT_FIELDS = [convert_to_project_field(field) for field in RAW_PROJECT_FIELDS]
+
+
+def test_render_matches_create_issue_request():
+    template = CreateIssueTemplate(KEYS)
+
+    assert (
+        template.render(ROW) == CreateIssueRequest(fields=dict(zip(KEYS, ROW))).fields
+    )
+    assert template.render(["SAND", "1", "S", "Backend", [], None, "C"])[
+        "components"
+    ] == {"name": "Backend"}
+
+
+def test_render_mapping_and_create_request():
+    template = CreateIssueTemplate(["project.key", "summary"])
+
+    request = template.create_request(["SAND", "Summary"])
+
+    assert request.fields == {"project": {"key": "SAND"}, "summary": "Summary"}
+    assert template.render_mapping({"summary": "Summary"}) == {
+        "project": {"key": None},
+        "summary": "Summary",
+    }
+    assert template.get_column("summary") == 1
+
+
+def test_conflicting_keys():
+    with pytest.raises(ValueError):
+        CreateIssueTemplate(["project", "project.key"])
+    with pytest.raises(ValueError):
+        CreateIssueTemplate(["project.key", "project"])
+
+
+def test_template_keys_cannot_inject_code():
+    template = CreateIssueTemplate(["a'}]; import os; #.b", "c\\"])
+
+    assert template.render([1, 2]) == {"a'}]; import os; #": {"b": 1}, "c\\": 2}
+
+
+def test_validate_against_project_fields():
+    template = CreateIssueTemplate(
+        ["project.key", "issuetype.id", "summary", "priority.name", "components.name"],
+        project_fields=PROJECT_FIELDS,
+    )
+
+    assert not template.validate(["SAND", "10002", "S", "High", ["Backend"]])
+    assert template.validate(["SAND", "10002", "S", "Medium", ["Backend", "UI"]]) == [
+        "Value Medium is not allowed for priority.name.",
+        "Value UI is not allowed for components.name.",
+    ]
+
+    with pytest.raises(ValueError, match="Required fields are missing: issuetype"):
+        CreateIssueTemplate(["project.key", "summary"], project_fields=PROJECT_FIELDS)
+    with pytest.raises(ValueError, match="Field unknown is not available"):
+        CreateIssueTemplate(
+            ["project.key", "issuetype.id", "summary", "unknown"],
+            project_fields=PROJECT_FIELDS,
+        )
@@ -0,0 +1,127 @@
+import json
+import sys
+from importlib.util import find_spec
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+import pytest
+from requests_mock import Mocker
+
+from jira_cloud_api.jira_api import JiraApi, JiraApiOptions
+from jira_cloud_api.jira_converters import (
+    convert_to_field,
+    convert_to_project,
+    convert_to_project_field,
+)
+from jira_cloud_api.jira_json import get_typed_decoder
+from jira_cloud_api.jira_request import GetProjectIssueFieldsRequest
+from tests.mock_jira_server import mock_jira_requests
+
+HAS_MSGSPEC = find_spec("msgspec") is not None
+
+
+def create_api(typed_decoding: bool) -> JiraApi:
+    return JiraApi(
+        JiraApiOptions(
+            url="https://localhost",
+            access_token="access_token",
+            typed_decoding=typed_decoding,
+        )
+    )
+
+
+def to_dict(response: Any) -> Dict[str, Any]:
+    # the dict converters leave error_text unset on success.
+    return {"error_text": None, **vars(response)}
+
+
+@pytest.mark.skipif(not HAS_MSGSPEC, reason="msgspec is not installed")
+@pytest.mark.parametrize("status_code", [200, 400])
+def test_typed_decoding_matches_dict_converters(status_code):
+    typed_api = create_api(typed_decoding=True)
+    api = create_api(typed_decoding=False)
+    request = GetProjectIssueFieldsRequest(
+        project_id_or_key="SAND", issue_type_id="10002", query_all=True
+    )
+
+    with Mocker(
+        real_http=False, case_sensitive=False, adapter=mock_jira_requests(status_code)
+    ):
+        for call in [
+            lambda api: api.get_all_fields(),
+            lambda api: api.get_all_projects(),
+            lambda api: api.get_project_detail("SD"),
+            lambda api: api.get_project_issue_fields(request),
+        ]:
+            typed_response = call(typed_api)
+            response = call(api)
+
+            assert typed_response.status_code == response.status_code
+            assert to_dict(typed_response) == to_dict(response)
+
+
+@pytest.mark.skipif(not HAS_MSGSPEC, reason="msgspec is not installed")
+def test_typed_decoding_falls_back_on_unexpected_types():
+    decoder = get_typed_decoder()
+    # booleans as strings do not match the structs.
+    fields = [{"id": "summary", "name": "Summary", "custom": "no"}]
+    projects = [{"id": 1, "key": "SAND", "isPrivate": "no"}]
+    page_fields = [{"fieldId": "summary", "required": "yes"}]
+    page = {"fields": page_fields, "total": 1}
+
+    assert decoder.decode_fields(json.dumps(fields).encode()) == [
+        convert_to_field(field) for field in fields
+    ]
+    assert decoder.decode_projects(json.dumps(projects).encode()) == [
+        convert_to_project(project) for project in projects
+    ]
+    decoded_page = decoder.decode_project_fields_page(json.dumps(page).encode())
+    assert decoded_page.fields == [convert_to_project_field(page_fields[0])]
+    assert decoded_page.total == 1
+
+
+@pytest.mark.skipif(not HAS_MSGSPEC, reason="msgspec is not installed")
+@pytest.mark.parametrize("content", [b"", b'[{"id": "sum'])
+def test_typed_decoding_failures_are_not_cached(content):
+    api = JiraApi(
+        JiraApiOptions(
+            url="https://localhost",
+            access_token="access_token",
+            typed_decoding=True,
+            cache_enabled=True,
+        )
+    )
+
+    with Mocker(real_http=False) as mocker:
+        mocker.get("https://localhost/rest/api/2/field", content=content)
+
+        response = api.get_all_fields()
+
+        assert response.status_code == 0
+        assert response.error_text
+        assert not response.fields
+        assert api.get_all_fields().status_code == 0
+        assert mocker.call_count == 2
+
+
+@pytest.mark.skipif(not HAS_MSGSPEC, reason="msgspec is not installed")
+def test_typed_decoding_of_empty_schemas():
+    decoder = get_typed_decoder()
+    fields: List[Dict[str, Any]] = [
+        {"id": "summary", "schema": {}},
+        {"id": "labels", "schema": {"type": ""}},
+        {"id": "status"},
+    ]
+
+    assert decoder.decode_fields(json.dumps(fields).encode()) == [
+        convert_to_field(field) for field in fields
+    ]
+    assert decoder.decode_fields(json.dumps(fields).encode())[0].schema is None
+
+
+def test_typed_decoding_requires_msgspec():
+    # a None entry makes the import fail even when msgspec is installed.
+    with patch.dict(sys.modules, {"msgspec": None}):
+        sys.modules.pop("jira_cloud_api.jira_typed", None)
+        with pytest.raises(ValueError, match="requires msgspec"):
+            create_api(typed_decoding=True)